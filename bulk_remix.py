@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Bulk remix pairing for LUCKNOOZ
+Picks large numbers of compatible (subject, predicate) headline pairs at once
+with NumPy boolean masks, falling back to a pure-Python sampler without it
+"""
+
+import argparse
+import random
+import time
+
+from pair_sampling import sample_pairs
+
+try:
+    import numpy as np
+except ImportError:  # optional: the pure-Python path gives the same kind of pairs
+    np = None
+
+# Below this many headlines the per-pair Python loops are already fast
+BULK_MIN_HEADLINES = 2000
+
+TENSES = ('present', 'past', 'gerund')
+TENSE_CODES = {tense: code for code, tense in enumerate(TENSES)}
+UNKNOWN_TENSE = len(TENSES)
+
+# compatible[subject tense][predicate tense], indexed by TENSE_CODES plus
+# UNKNOWN_TENSE. lucknooz_v13 conjugates predicates into the subject's tense,
+# except that a gerund subject leaves the predicate verb as it was, which
+# only reads right when that verb is a gerund too.
+V13_COMPATIBILITY = (
+    (True, True, True, True),
+    (True, True, True, True),
+    (False, False, True, False),
+    (True, True, True, True),
+)
+
+OVERSAMPLE = 2      # candidate pairs drawn per pair wanted, per round
+MAX_ROUNDS = 8
+
+
+def tense_code(tense):
+    """Index of a tense in a compatibility table; anything unrecognised is UNKNOWN_TENSE"""
+    return TENSE_CODES.get(tense or '', UNKNOWN_TENSE)
+
+
+def compatible(compatibility, subject_tense, predicate_tense):
+    """Whether a compatibility table allows this subject tense with this predicate tense"""
+    return compatibility[tense_code(subject_tense)][tense_code(predicate_tense)]
+
+
+def v13_features(record):
+    """(original, source, subject plural, subject tense, predicate tense) of a lucknooz_v13 record"""
+    tense = record.get('tense') or ''
+    return (record['original_headline'], record['source'],
+            bool(record.get('subject_is_plural')), tense, tense)
+
+
+def parsed_headline_features(parsed):
+    """The same features of a generate_headlines.ParsedHeadline"""
+    return (parsed.original, parsed.source, parsed.subject_is_plural,
+            parsed.tense, parsed.tense)
+
+
+class RemixCorpus:
+    """
+    Parsed headlines as parallel feature columns, for filtering pairs in bulk
+
+    Columns are NumPy arrays when NumPy is installed and lists otherwise:
+    original id (equal ids are the same headline text), source id, subject
+    plurality, subject tense and predicate tense codes.
+    """
+
+    def __init__(self, records, features):
+        originals = {}
+        sources = {}
+        columns = ([], [], [], [], [])
+        for record in records:
+            original, source, plural, subject_tense, predicate_tense = features(record)
+            columns[0].append(originals.setdefault(original, len(originals)))
+            columns[1].append(sources.setdefault(source, len(sources)))
+            columns[2].append(plural)
+            columns[3].append(tense_code(subject_tense))
+            columns[4].append(tense_code(predicate_tense))
+
+        self.size = len(columns[0])
+        if np is not None:
+            self.original_id = np.array(columns[0], dtype=np.int32)
+            self.source_id = np.array(columns[1], dtype=np.int32)
+            self.subject_plural = np.array(columns[2], dtype=bool)
+            self.subject_tense = np.array(columns[3], dtype=np.int8)
+            self.predicate_tense = np.array(columns[4], dtype=np.int8)
+        else:
+            (self.original_id, self.source_id, self.subject_plural,
+             self.subject_tense, self.predicate_tense) = columns
+
+    def pairs(self, count, compatibility=None, mix_sources=False, rng=random):
+        """
+        Up to count distinct (subject index, predicate index) pairs, in random order.
+
+        Pairs of the same headline text are never returned. With
+        compatibility, pairs whose tenses it rules out are dropped; with
+        mix_sources, so are pairs from the same source.
+        """
+        if self.size < 2 or count <= 0:
+            return []
+        if np is None:
+            return self._pairs_python(count, compatibility, mix_sources, rng)
+        return self._pairs_numpy(count, compatibility, mix_sources, rng)
+
+    def _pairs_numpy(self, count, compatibility, mix_sources, rng):
+        generator = np.random.default_rng(rng.getrandbits(64))
+        table = np.array(compatibility, dtype=bool) if compatibility is not None else None
+        chosen = np.empty(0, dtype=np.int64)
+
+        for _ in range(MAX_ROUNDS):
+            draws = OVERSAMPLE * (count - len(chosen))
+            subjects = generator.integers(0, self.size, draws)
+            predicates = generator.integers(0, self.size, draws)
+
+            keep = self.original_id[subjects] != self.original_id[predicates]
+            if mix_sources:
+                keep &= self.source_id[subjects] != self.source_id[predicates]
+            if table is not None:
+                keep &= table[self.subject_tense[subjects], self.predicate_tense[predicates]]
+
+            # Pair codes, deduplicated against each other and earlier rounds in draw order
+            codes = np.concatenate([chosen, subjects[keep] * self.size + predicates[keep]])
+            _, first = np.unique(codes, return_index=True)
+            chosen = codes[np.sort(first)][:count]
+            if len(chosen) >= count:
+                break
+
+        subjects, predicates = np.divmod(chosen, self.size)
+        return list(zip(subjects.tolist(), predicates.tolist()))
+
+    def _pairs_python(self, count, compatibility, mix_sources, rng):
+        chosen = []
+        for subject, predicate in sample_pairs(self.size, rng):
+            if self.original_id[subject] == self.original_id[predicate]:
+                continue
+            if mix_sources and self.source_id[subject] == self.source_id[predicate]:
+                continue
+            if compatibility is not None and not compatibility[
+                    self.subject_tense[subject]][self.predicate_tense[predicate]]:
+                continue
+            chosen.append((subject, predicate))
+            if len(chosen) >= count:
+                break
+        return chosen
+
+
+def use_bulk(headline_count):
+    """Whether pairing this many headlines should go through RemixCorpus"""
+    return headline_count >= BULK_MIN_HEADLINES
+
+
+def main():
+    """Time bulk pairing over a synthetic corpus"""
+    parser = argparse.ArgumentParser(description="Benchmark bulk remix pairing")
+    parser.add_argument('--headlines', type=int, default=20000)
+    parser.add_argument('--pairs', type=int, default=100000)
+    parser.add_argument('--sources', type=int, default=40)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    records = [{'original_headline': f"headline {i}", 'source': f"source {rng.randrange(args.sources)}",
+                'subject_is_plural': rng.random() < 0.3, 'tense': rng.choice(TENSES)}
+               for i in range(args.headlines)]
+
+    start = time.perf_counter()
+    corpus = RemixCorpus(records, v13_features)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pairs = corpus.pairs(args.pairs, V13_COMPATIBILITY, mix_sources=True, rng=rng)
+    elapsed = time.perf_counter() - start
+
+    engine = f"NumPy {np.__version__}" if np is not None else "pure Python (NumPy not installed)"
+    print(f"{engine}: {len(pairs)} pairs from {args.headlines} headlines in "
+          f"{elapsed * 1000:.0f} ms (corpus built in {build * 1000:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,19 @@ RSS Feed Analyzer for LUCKNOOZ
 Tests RSS feeds and reports statistics to help select the best feeds
 """
 
-import feedparser
+import argparse
+import multiprocessing
+import os
 import re
 from collections import defaultdict
 import statistics
 
+from feed_breaker import CircuitBreaker
+from feed_fetcher import add_fetch_arguments, fetch_feed, get_feeds, parse_feed
+from feed_history import WINDOWS, FeedHistory
+from feed_state import FeedState
+from parse_cache import fingerprint
+
 # Test feeds - your current ones plus potential new ones
 TEST_FEEDS = {
     # Current feeds
@@ -107,23 +115,35 @@ def find_first_verb(title):
     
     return -1
 
-def analyze_feed(feed_url, feed_name):
+def analyze_feed(feed_url, feed_name, fetched=None):
     """
     Analyze a single feed and return statistics
+    
+    fetched is this feed's result from feed_fetcher.fetch_feeds; if omitted the
+    feed is downloaded here
     """
+    # One print per feed, so lines from parallel workers don't interleave
+    label = f"Testing {feed_name}..."
     try:
-        print(f"Testing {feed_name}...", end=' ')
-        feed = feedparser.parse(feed_url)
+        if fetched is None:
+            fetched = fetch_feed(feed_url)
+        if fetched.get('skipped') and fetched['error']:
+            print(f"{label} ⏸️  Skipped: {fetched['error']}")
+            return None
+        if fetched['error']:
+            print(f"{label} ❌ Error: {fetched['error'][:50]}")
+            return None
+        feed = parse_feed(fetched, max_entries=30)
         
         if not feed.entries:
-            print("❌ No entries found")
+            print(f"{label} ❌ No entries found")
             return None
             
         headlines = []
         word_counts = []
         parseable = 0
         
-        for entry in feed.entries[:30]:  # Test first 30 headlines
+        for entry in feed.entries:  # First 30 headlines, capped in parse_feed
             title = entry.get('title', '').strip()
             if not title:
                 continue
@@ -142,14 +162,14 @@ def analyze_feed(feed_url, feed_name):
                 parseable += 1
         
         if not headlines:
-            print("❌ No valid headlines")
+            print(f"{label} ❌ No valid headlines")
             return None
             
         total = len(headlines)
         avg_words = statistics.mean(word_counts)
         parse_rate = (parseable / total) * 100
         
-        print(f"✅ {total} headlines")
+        print(f"{label} ✅ {total} headlines")
         
         return {
             'name': feed_name,
@@ -160,14 +180,65 @@ def analyze_feed(feed_url, feed_name):
             'max_words': max(word_counts),
             'parseable': parseable,
             'parse_rate': parse_rate,
+            'total_words': sum(word_counts),
             'sample_headlines': headlines[:5]
         }
         
     except Exception as e:
-        print(f"❌ Error: {str(e)[:50]}")
+        print(f"{label} ❌ Error: {str(e)[:50]}")
+        return None
+
+def analyzer_fingerprint():
+    """Fingerprint of the analysis rules, used to invalidate analyses stored for 304s"""
+    return fingerprint(analyze_feed, find_first_verb, parse_feed)
+
+def analyze_task(task):
+    """Worker entry point: analyze_feed over one (url, name, fetched) tuple"""
+    return analyze_feed(*task)
+
+def analyze_pool(workers):
+    """
+    Pool of `workers` forked processes for analyze_feeds, or None to analyze in this one
+    
+    Make it before any fetch threads start, so none are running when it forks,
+    and hand it to close_analyze_pool when done.
+    """
+    if workers <= 1 or 'fork' not in multiprocessing.get_all_start_methods():
         return None
+    return multiprocessing.get_context('fork').Pool(workers)
+
+def close_analyze_pool(pool):
+    if pool is not None:
+        pool.close()
+        pool.join()
+
+def analyze_feeds(tasks, pool=None):
+    """
+    analyze_feed over (url, name, fetched) tuples, on a pool from analyze_pool if given
+    
+    Results come back in the order given, None for feeds that failed.
+    """
+    if pool is None or len(tasks) < 2:
+        return [analyze_task(task) for task in tasks]
+    return pool.map(analyze_task, tasks)
+
+def composite_score(r):
+    """Prefer shorter headlines with high parse rates"""
+    # Normalize scores (lower word count is better, higher parse rate is better)
+    word_score = 100 - (r['avg_words'] * 5)  # Penalize long headlines
+    parse_score = r['parse_rate']
+    return (word_score + parse_score) / 2
 
 def main():
+    parser = argparse.ArgumentParser(description="LUCKNOOZ RSS feed analyzer")
+    parser.add_argument('--workers', type=int, default=min(8, os.cpu_count() or 1),
+                        help="processes to analyze feeds on")
+    parser.add_argument('--window', choices=['run'] + list(WINDOWS), default='7d',
+                        help="rank feeds over this rolling window of past runs, "
+                             "or just this run")
+    add_fetch_arguments(parser)
+    args = parser.parse_args()
+    
     print("=" * 80)
     print("LUCKNOOZ RSS Feed Analyzer")
     print("=" * 80)
@@ -175,11 +246,81 @@ def main():
     
     results = []
     
-    # Test all feeds
-    for feed_name, feed_url in TEST_FEEDS.items():
-        result = analyze_feed(feed_url, feed_name)
+    # Fork the analysis workers before any fetch threads exist
+    pool = analyze_pool(min(args.workers, len(TEST_FEEDS)))
+    
+    # Feeds unchanged since the last run (HTTP 304) reuse their last analysis.
+    # Replays are read straight from the snapshot, without that state.
+    state = None
+    validators = None
+    breaker = None
+    if not args.replay:
+        state = FeedState('feed_analyzer', analyzer_fingerprint())
+        if args.refresh:
+            state.clear()
+        validators = state.validators(TEST_FEEDS.values())
+        # Feeds that keep failing are skipped for a while, with the reason shown
+        breaker = CircuitBreaker()
+        if args.reset_breakers:
+            breaker.reset()
+    
+    # Download all feeds at once, then test them
+    print(f"Fetching {len(TEST_FEEDS)} feeds...")
+    try:
+        fetched = get_feeds(TEST_FEEDS.values(), 'feed_analyzer', args.concurrency, args.timeout,
+                            args.deadline, validators, args.replay, not args.no_snapshot,
+                            breaker=breaker)
+    except FileNotFoundError as e:
+        print(f"ERROR: {e}")
+        close_analyze_pool(pool)
+        return
+    finally:
+        if breaker is not None:
+            breaker.close()
+    print()
+    
+    tasks = []
+    analyzed = []
+    for (feed_name, feed_url), feed_result in zip(TEST_FEEDS.items(), fetched):
+        if feed_result['not_modified']:
+            print(f"Testing {feed_name}... ♻️  not modified, reusing last analysis")
+            result = state.items(feed_url)
+            if result:
+                results.append(result)
+        else:
+            tasks.append((feed_url, feed_name, feed_result))
+    
+    # Parse and score every downloaded feed at once
+    try:
+        analyses = analyze_feeds(tasks, pool)
+    finally:
+        close_analyze_pool(pool)
+    for (feed_url, feed_name, feed_result), result in zip(tasks, analyses):
         if result:
             results.append(result)
+            analyzed.append(result)
+            if state is not None:
+                state.update(feed_url, feed_result['headers'], result)
+    if state is not None:
+        state.close()
+    
+    # Append this run's fresh analyses to the history and rank over the
+    # rolling window; a reused 304 analysis is already in the history.
+    # A feed that has answered 304 for the whole window still ranks, on its
+    # last stored analysis. Replays are old data, so they are neither
+    # recorded nor mixed with it.
+    ranked = results
+    window = 'run' if args.replay else args.window
+    if not args.replay:
+        history = FeedHistory()
+        history.record(analyzed)
+        if window != 'run':
+            stats = history.window(WINDOWS[window])
+            reached = {r['url']: r for r in results}
+            ranked = [stats.get(url) or reached[url] for url in TEST_FEEDS.values()
+                      if url in stats or url in reached]
+        history.close()
+    samples = {r['url']: r['sample_headlines'] for r in results}
     
     print()
     print("=" * 80)
@@ -187,19 +328,23 @@ def main():
     print("=" * 80)
     print()
     
-    if not results:
+    if not ranked:
         print("No feeds successfully analyzed.")
         return
     
+    if window != 'run':
+        print(f"Statistics over the last {window} of runs")
+        print()
+    
     # Sort by parse rate (best first)
-    results.sort(key=lambda x: x['parse_rate'], reverse=True)
+    ranked.sort(key=lambda x: x['parse_rate'], reverse=True)
     
     # Display detailed results
-    print(f"{'Feed Name':<25} {'Avg Words':<12} {'Parse Rate':<12} {'Total':<8}")
+    print(f"{'Feed Name':<25} {'Avg Words':<12} {'Parse Rate':<12} {'Total':<8} {'Runs':<6}")
     print("-" * 80)
     
-    for r in results:
-        print(f"{r['name']:<25} {r['avg_words']:>6.1f} words   {r['parse_rate']:>5.1f}%       {r['total_headlines']:>4}")
+    for r in ranked:
+        print(f"{r['name']:<25} {r['avg_words']:>6.1f} words   {r['parse_rate']:>5.1f}%       {r['total_headlines']:>4}     {r.get('samples', 1):>4}")
     
     print()
     print("=" * 80)
@@ -209,26 +354,23 @@ def main():
     
     # Rank by terseness (shorter = better)
     print("🏆 MOST TERSE (Shortest Headlines):")
-    terse = sorted(results, key=lambda x: x['avg_words'])[:10]
+    terse = sorted(ranked, key=lambda x: x['avg_words'])[:10]
     for i, r in enumerate(terse, 1):
         print(f"{i:2}. {r['name']:<25} {r['avg_words']:>6.1f} words")
     
     print()
     print("🎯 BEST PARSE RATE (Most Parseable):")
-    best_parse = sorted(results, key=lambda x: x['parse_rate'], reverse=True)[:10]
+    best_parse = sorted(ranked, key=lambda x: x['parse_rate'], reverse=True)[:10]
     for i, r in enumerate(best_parse, 1):
         print(f"{i:2}. {r['name']:<25} {r['parse_rate']:>5.1f}%")
     
     print()
     print("⭐ RECOMMENDED FEEDS (Terse + High Parse Rate):")
     # Calculate composite score: prefer shorter headlines with high parse rates
-    for r in results:
-        # Normalize scores (lower word count is better, higher parse rate is better)
-        word_score = 100 - (r['avg_words'] * 5)  # Penalize long headlines
-        parse_score = r['parse_rate']
-        r['composite_score'] = (word_score + parse_score) / 2
+    for r in ranked:
+        r['composite_score'] = composite_score(r)
     
-    recommended = sorted(results, key=lambda x: x['composite_score'], reverse=True)[:15]
+    recommended = sorted(ranked, key=lambda x: x['composite_score'], reverse=True)[:15]
     for i, r in enumerate(recommended, 1):
         print(f"{i:2}. {r['name']:<25} {r['avg_words']:>6.1f} words, {r['parse_rate']:>5.1f}% parse")
     
@@ -238,11 +380,11 @@ def main():
     print("=" * 80)
     print()
     
-    # Show samples from top 3 recommended feeds
-    for r in recommended[:3]:
+    # Show samples from top 3 recommended feeds, as fetched this run
+    for r in [r for r in recommended if r['url'] in samples][:3]:
         print(f"\n{r['name']} (avg {r['avg_words']:.1f} words):")
         print("-" * 60)
-        for headline in r['sample_headlines']:
+        for headline in samples[r['url']]:
             verb_pos = find_first_verb(headline)
             if verb_pos > 0:
                 words = headline.split()
@@ -258,14 +400,14 @@ def main():
     print("=" * 80)
     print()
     
-    all_avg_words = [r['avg_words'] for r in results]
-    all_parse_rates = [r['parse_rate'] for r in results]
+    all_avg_words = [r['avg_words'] for r in ranked]
+    all_parse_rates = [r['parse_rate'] for r in ranked]
     
-    print(f"Total feeds analyzed: {len(results)}")
+    print(f"Total feeds analyzed: {len(ranked)}")
     print(f"Average headline length: {statistics.mean(all_avg_words):.1f} words")
     print(f"Average parse rate: {statistics.mean(all_parse_rates):.1f}%")
-    print(f"Shortest avg headlines: {min(all_avg_words):.1f} words ({[r['name'] for r in results if r['avg_words'] == min(all_avg_words)][0]})")
-    print(f"Longest avg headlines: {max(all_avg_words):.1f} words ({[r['name'] for r in results if r['avg_words'] == max(all_avg_words)][0]})")
+    print(f"Shortest avg headlines: {min(all_avg_words):.1f} words ({[r['name'] for r in ranked if r['avg_words'] == min(all_avg_words)][0]})")
+    print(f"Longest avg headlines: {max(all_avg_words):.1f} words ({[r['name'] for r in ranked if r['avg_words'] == max(all_avg_words)][0]})")
     print()
 
 if __name__ == "__main__":
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Per-feed circuit breaker for LUCKNOOZ
+Stops requesting feeds that keep failing for a cool-down window, and
+remembers why, instead of paying their full timeout on every run
+"""
+
+import sqlite3
+import threading
+import time
+
+DEFAULT_BREAKER_FILE = 'feed_breaker.sqlite3'
+
+FAILURE_THRESHOLD = 3               # consecutive failed runs before a feed is skipped
+DEFAULT_COOLDOWN = 6 * 60 * 60      # first skip window, in seconds
+MAX_COOLDOWN = 7 * 24 * 60 * 60     # the window doubles each time a retry fails, up to this
+
+
+class CircuitBreaker:
+    """
+    SQLite-backed failure history per feed url, shared by every entry point
+
+    A feed that fails FAILURE_THRESHOLD runs in a row is opened: skipped
+    until its cool-down passes. Then one run tries it again (half-open);
+    success closes the breaker, failure reopens it for twice as long.
+    """
+
+    def __init__(self, filename=DEFAULT_BREAKER_FILE, threshold=FAILURE_THRESHOLD,
+                 cooldown=DEFAULT_COOLDOWN):
+        self.filename = filename
+        self.threshold = threshold
+        self.cooldown = cooldown
+        # Streaming mode records results from a pipeline stage thread
+        self.conn = sqlite3.connect(filename, check_same_thread=False)
+        self.lock = threading.Lock()
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS feed_breaker (
+                url TEXT PRIMARY KEY,
+                failures INTEGER NOT NULL,
+                last_error TEXT,
+                last_failure REAL NOT NULL,
+                open_until REAL,
+                cooldown REAL
+            )
+        """)
+        self.conn.commit()
+
+    def rows(self):
+        """Every feed with recent failures, as dicts"""
+        with self.lock:
+            cursor = self.conn.execute(
+                "SELECT url, failures, last_error, last_failure, open_until, cooldown "
+                "FROM feed_breaker")
+            names = [column[0] for column in cursor.description]
+            return {row[0]: dict(zip(names, row)) for row in cursor.fetchall()}
+
+    def blocked(self, urls, now=None):
+        """The urls whose breaker is open, as url -> reason"""
+        now = now if now is not None else time.time()
+        rows = self.rows()
+        found = {}
+        for url in urls:
+            row = rows.get(url)
+            if row and row['open_until'] and row['open_until'] > now:
+                hours = (row['open_until'] - now) / 3600
+                found[url] = (f"circuit open after {row['failures']} failures "
+                              f"({row['last_error']}); retrying in {hours:.1f}h")
+        return found
+
+    def record(self, result, now=None):
+        """Update a feed's breaker from one fetch result; skipped results are ignored"""
+        if result.get('skipped'):
+            return
+        now = now if now is not None else time.time()
+        url = result['url']
+
+        with self.lock:
+            if not result['error']:
+                self.conn.execute("DELETE FROM feed_breaker WHERE url = ?", (url,))
+                self.conn.commit()
+                return
+
+            row = self.conn.execute(
+                "SELECT failures, cooldown FROM feed_breaker WHERE url = ?", (url,)
+            ).fetchone()
+            failures = (row[0] if row else 0) + 1
+            cooldown = row[1] if row and row[1] else None
+            open_until = None
+            if failures >= self.threshold:
+                # A failed half-open retry doubles the window
+                cooldown = min(MAX_COOLDOWN, cooldown * 2) if cooldown else self.cooldown
+                open_until = now + cooldown
+
+            self.conn.execute(
+                "INSERT OR REPLACE INTO feed_breaker "
+                "(url, failures, last_error, last_failure, open_until, cooldown) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (url, failures, result['error'], now, open_until, cooldown)
+            )
+            self.conn.commit()
+
+    def reset(self):
+        """Close every breaker"""
+        with self.lock:
+            self.conn.execute("DELETE FROM feed_breaker")
+            self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+def main():
+    """Print every feed with recent failures and whether it is being skipped"""
+    breaker = CircuitBreaker()
+    rows = breaker.rows()
+    breaker.close()
+
+    if not rows:
+        print("No feed failures recorded")
+        return
+
+    now = time.time()
+    print(f"{'Feed':<55} {'Fails':>5} {'State':>12}  Last error")
+    print("-" * 100)
+    for row in sorted(rows.values(), key=lambda r: -r['failures']):
+        if row['open_until'] and row['open_until'] > now:
+            state = f"open {(row['open_until'] - now) / 3600:.1f}h"
+        elif row['open_until']:
+            state = "half-open"
+        else:
+            state = "closed"
+        print(f"{row['url'][:55]:<55} {row['failures']:>5} {state:>12}  {row['last_error']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Fast RSS/Atom entry extractor for LUCKNOOZ
+Pulls just the feed title and each entry's title, link and id out of a feed
+body with an incremental XML parser, instead of feedparser's full object tree
+"""
+
+import argparse
+import html
+import re
+import time
+import xml.etree.ElementTree as ET
+import zipfile
+
+from feed_snapshots import snapshot_paths
+
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024   # stop reading a feed body after this much
+CHUNK_SIZE = 64 * 1024                # bytes fed to the XML parser at a time
+
+ATOM_NS = 'http://www.w3.org/2005/Atom'
+RSS1_NS = 'http://purl.org/rss/1.0/'
+
+# Only these namespaces' <title>/<link> count, so media:title and the like don't
+FEED_NAMESPACES = {'', ATOM_NS, RSS1_NS}
+ENTRY_TAGS = {'item', 'entry'}
+FEED_TAGS = {'channel', 'feed'}
+
+TAG_RE = re.compile(r'<[^>]+>')
+
+
+class ExtractError(ValueError):
+    """The body isn't a well-formed RSS or Atom feed the fast path understands"""
+
+
+class ExtractedFeed:
+    """
+    The slice of a feedparser result LUCKNOOZ reads
+
+    feed is a dict with the feed's 'title'; entries is a list of dicts with
+    'title', 'link' and 'id' (where present), so entry.get(...) works as it
+    does on feedparser entries.
+    """
+
+    __slots__ = ('feed', 'entries', 'truncated')
+
+    def __init__(self, feed, entries, truncated=False):
+        self.feed = feed
+        self.entries = entries
+        self.truncated = truncated
+
+
+def split_tag(tag):
+    """'{namespace}local' -> ('namespace', 'local')"""
+    if tag[:1] == '{':
+        namespace, _, local = tag[1:].partition('}')
+        return namespace, local
+    return '', tag
+
+
+def clean_text(text):
+    """Entry title text as feedparser would give it: unescaped, tags stripped, trimmed"""
+    if not text:
+        return ''
+    if '<' in text:
+        text = TAG_RE.sub('', text)
+    if '&' in text:
+        text = html.unescape(text)
+    return ' '.join(text.split())
+
+
+def entry_fields(element):
+    """title/link/id from an <item> or <entry>'s direct children"""
+    entry = {}
+    for child in element:
+        namespace, local = split_tag(child.tag)
+        if namespace not in FEED_NAMESPACES:
+            continue
+        if local == 'title' and 'title' not in entry:
+            entry['title'] = clean_text(''.join(child.itertext()))
+        elif local == 'link':
+            # Atom: <link rel="alternate" href="..."/>; RSS: <link>url</link>
+            href = child.get('href')
+            if href is not None:
+                if child.get('rel', 'alternate') == 'alternate' and 'link' not in entry:
+                    entry['link'] = href.strip()
+            elif child.text and 'link' not in entry:
+                entry['link'] = child.text.strip()
+        elif local in ('guid', 'id') and child.text and 'id' not in entry:
+            entry['id'] = child.text.strip()
+    return entry
+
+
+def extract_entries(body, max_entries=None, max_bytes=DEFAULT_MAX_BYTES):
+    """
+    Feed title and entries from an RSS 0.9x/1.0/2.0 or Atom body.
+
+    Stops after max_entries entries or max_bytes of input, whichever comes
+    first, without reading the rest. Raises ExtractError for malformed XML, a
+    document with no recognisable feed structure, or one with no entries the
+    fast path recognises (e.g. Atom 0.3 or RSS 0.90 namespaces), so callers
+    fall back to feedparser instead of reading an empty feed.
+    """
+    parser = ET.XMLPullParser(events=('start', 'end'))
+    feed = {}
+    entries = []
+    stack = []
+    seen_feed = False
+    truncated = False
+
+    try:
+        for offset in range(0, len(body), CHUNK_SIZE):
+            if offset >= max_bytes:
+                truncated = True
+                break
+            parser.feed(body[offset:offset + CHUNK_SIZE])
+            for event, element in parser.read_events():
+                namespace, local = split_tag(element.tag)
+                if event == 'start':
+                    stack.append(local)
+                    seen_feed = seen_feed or local in FEED_TAGS
+                    continue
+
+                stack.pop()
+                parent = stack[-1] if stack else None
+                if local in ENTRY_TAGS and namespace in FEED_NAMESPACES:
+                    entries.append(entry_fields(element))
+                    element.clear()
+                    if max_entries is not None and len(entries) >= max_entries:
+                        return ExtractedFeed(feed, entries, truncated=True)
+                elif local == 'title' and parent in FEED_TAGS and 'title' not in feed:
+                    feed['title'] = clean_text(''.join(element.itertext()))
+        else:
+            parser.close()
+    except ET.ParseError as e:
+        raise ExtractError(str(e)) from e
+
+    if not seen_feed and not entries:
+        raise ExtractError("no RSS channel or Atom feed element")
+    if not entries:
+        raise ExtractError("no entries in a recognised namespace")
+    return ExtractedFeed(feed, entries, truncated)
+
+
+def benchmark(bodies, repeat=3):
+    """Time extract_entries against feedparser over feed bodies, and compare their titles"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fast = []
+        for body in bodies:
+            try:
+                fast.append(extract_entries(body))
+            except ExtractError:
+                fast.append(None)
+    fast_time = time.perf_counter() - start
+
+    try:
+        import feedparser
+    except ImportError:
+        return {'fast_seconds': fast_time, 'feedparser_seconds': None,
+                'fallbacks': fast.count(None), 'mismatches': None}
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        slow = [feedparser.parse(body) for body in bodies]
+    slow_time = time.perf_counter() - start
+
+    mismatches = 0
+    for quick, full in zip(fast, slow):
+        if quick is None:
+            continue
+        quick_titles = [entry.get('title', '') for entry in quick.entries]
+        full_titles = [' '.join(entry.get('title', '').split()) for entry in full.entries]
+        mismatches += sum(1 for a, b in zip(quick_titles, full_titles) if a != b)
+        mismatches += abs(len(quick_titles) - len(full_titles))
+
+    return {'fast_seconds': fast_time, 'feedparser_seconds': slow_time,
+            'fallbacks': fast.count(None), 'mismatches': mismatches}
+
+
+def snapshot_bodies(paths):
+    """Every recorded feed body in the given snapshot files"""
+    bodies = []
+    for path in paths:
+        with zipfile.ZipFile(path) as archive:
+            for name in archive.namelist():
+                if name.startswith('feeds/'):
+                    bodies.append(archive.read(name))
+    return bodies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the fast feed extractor "
+                                                 "against feedparser on saved snapshots")
+    parser.add_argument('snapshots', nargs='*',
+                        help="snapshot zips to read feed bodies from (default: all)")
+    parser.add_argument('--repeat', type=int, default=3, help="passes over the feed bodies")
+    args = parser.parse_args()
+
+    bodies = snapshot_bodies(args.snapshots or snapshot_paths())
+    if not bodies:
+        print("No feed bodies found; run an entry point once to save a snapshot")
+        return
+
+    size_mb = sum(len(body) for body in bodies) / (1024 * 1024)
+    print(f"Benchmarking {len(bodies)} feed bodies ({size_mb:.1f} MB) x {args.repeat} passes")
+    result = benchmark(bodies, args.repeat)
+
+    print(f"fast extractor: {result['fast_seconds']:>8.3f}s  "
+          f"({result['fallbacks']} would fall back to feedparser)")
+    if result['feedparser_seconds'] is None:
+        print("feedparser:     not installed")
+        return
+    speedup = result['feedparser_seconds'] / result['fast_seconds'] if result['fast_seconds'] else 0.0
+    print(f"feedparser:     {result['feedparser_seconds']:>8.3f}s  ({speedup:.1f}x slower)")
+    print(f"title mismatches: {result['mismatches']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Concurrent RSS feed fetcher for LUCKNOOZ
+Downloads every feed at once with per-feed timeouts and an overall deadline,
+over pooled keep-alive connections, skipping feeds whose circuit breaker is open
+"""
+
+from concurrent.futures import Future, TimeoutError, as_completed
+import queue
+import threading
+import time
+
+from feed_extract import ExtractError, extract_entries
+from feed_scheduler import DEFAULT_BUDGET
+from http_client import HTTPClient, HTTPClientError
+from feed_snapshots import latest_snapshot, replay_feeds, save_snapshot
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_TIMEOUT = 10     # seconds to connect, and per socket read
+DEFAULT_DEADLINE = 45    # seconds for the whole batch of feeds
+
+USER_AGENT = 'LUCKNOOZ/1.0 (+https://github.com/youngryman/LUCKNOOZ)'
+
+# One client for the whole process, so feeds on the same host share connections.
+# Made on first use: building its SSL context loads the CA bundle.
+_client = None
+_client_lock = threading.Lock()
+
+
+def shared_client():
+    """The process-wide HTTPClient, created the first time it is needed"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HTTPClient()
+        return _client
+
+
+def add_fetch_arguments(parser):
+    """Add the shared fetch options to an entry point's argparse parser"""
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help="feeds to download at the same time")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help="per-feed connect/read timeout in seconds")
+    parser.add_argument('--deadline', type=float, default=DEFAULT_DEADLINE,
+                        help="give up on feeds still downloading after this many seconds")
+    parser.add_argument('--refresh', action='store_true',
+                        help="ignore saved ETag/Last-Modified validators and download every "
+                             "polled feed in full")
+    parser.add_argument('--replay', metavar='SNAPSHOT',
+                        help="read feeds from a saved snapshot ('latest' for the newest) "
+                             "instead of the network")
+    parser.add_argument('--no-snapshot', action='store_true',
+                        help="don't save this run's feed bodies to the snapshot store")
+    parser.add_argument('--schedule', action='store_true',
+                        help="only poll feeds the adaptive scheduler says are due")
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET,
+                        help="scheduler's request budget, in requests per hour across all feeds")
+    parser.add_argument('--reset-breakers', action='store_true',
+                        help="retry feeds the circuit breaker is skipping after repeated failures")
+
+
+class DaemonExecutor:
+    """
+    Thread pool whose workers are daemon threads
+
+    ThreadPoolExecutor joins its workers at interpreter exit, so one feed
+    still trickling in would keep the whole run alive after the deadline.
+    These workers are simply abandoned when the process exits.
+    """
+
+    def __init__(self, max_workers):
+        self.tasks = queue.SimpleQueue()
+        self.workers = max(1, max_workers)
+        for _ in range(self.workers):
+            threading.Thread(target=self._work, daemon=True).start()
+
+    def _work(self):
+        while True:
+            task = self.tasks.get()
+            if task is None:
+                return
+            future, fn, args = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def submit(self, fn, *args):
+        future = Future()
+        self.tasks.put((future, fn, args))
+        return future
+
+    def shutdown(self):
+        """Cancel tasks not started yet and let the workers exit once idle"""
+        while True:
+            try:
+                task = self.tasks.get_nowait()
+            except queue.Empty:
+                break
+            if task is not None:
+                task[0].cancel()
+        for _ in range(self.workers):
+            self.tasks.put(None)
+
+
+def fetch_feed(url, timeout=DEFAULT_TIMEOUT, etag=None, modified=None, budget=None):
+    """
+    Download one feed.
+
+    Returns a result dict with the url, HTTP status, response headers, body
+    bytes, elapsed seconds and an error message (None on success). Given an
+    etag or modified validator the request is conditional, and an unchanged
+    feed comes back with status 304, no body and not_modified set. Transient
+    failures are retried by the shared pooled client, within budget seconds
+    in all if given.
+    """
+    result = {'url': url, 'status': None, 'headers': {}, 'body': None,
+              'error': None, 'elapsed': 0.0, 'not_modified': False}
+    start = time.monotonic()
+
+    headers = {'User-Agent': USER_AGENT}
+    if etag:
+        headers['If-None-Match'] = etag
+    if modified:
+        headers['If-Modified-Since'] = modified
+
+    try:
+        status, response_headers, body, final_url = shared_client().get(url, headers, timeout, budget)
+        result['status'] = status
+        if status == 304:
+            result['not_modified'] = True
+        elif status >= 300:
+            result['error'] = f"HTTP {status}"
+        else:
+            result['headers'] = response_headers
+            result['body'] = body
+    except HTTPClientError as e:
+        result['error'] = str(e)
+    except Exception as e:
+        result['error'] = str(e) or e.__class__.__name__
+
+    result['elapsed'] = time.monotonic() - start
+    return result
+
+
+def deadline_result(url, deadline):
+    """Result for a feed still downloading when the batch deadline passed"""
+    return {'url': url, 'status': None, 'headers': {}, 'body': None,
+            'error': f"deadline of {deadline:g}s exceeded", 'elapsed': deadline,
+            'not_modified': False}
+
+
+def iter_fetched(urls, concurrency=DEFAULT_CONCURRENCY, timeout=DEFAULT_TIMEOUT,
+                 deadline=DEFAULT_DEADLINE, validators=None):
+    """
+    Download feeds concurrently, yielding each result as soon as its feed finishes.
+
+    Feeds still running when the deadline passes are yielded last, with an
+    error, instead of holding up the others. validators maps url ->
+    (etag, modified) for conditional GETs.
+    """
+    urls = list(urls)
+    if not urls:
+        return
+    validators = validators or {}
+
+    executor = DaemonExecutor(concurrency)
+    futures = {executor.submit(fetch_feed, url, timeout, *validators.get(url, (None, None)),
+                               deadline): url
+               for url in urls}
+    pending = set(futures)
+    try:
+        for future in as_completed(futures, timeout=deadline):
+            pending.discard(future)
+            yield future.result()
+    except TimeoutError:
+        for future in pending:
+            yield deadline_result(futures[future], deadline)
+    finally:
+        # Don't block on stragglers; each gives up within the deadline of starting,
+        # and none of them holds up interpreter exit
+        executor.shutdown()
+
+
+def fetch_feeds(urls, concurrency=DEFAULT_CONCURRENCY, timeout=DEFAULT_TIMEOUT,
+                deadline=DEFAULT_DEADLINE, validators=None):
+    """Like iter_fetched, but return one result dict per url, in the order given"""
+    urls = list(urls)
+    results = {result['url']: result
+               for result in iter_fetched(urls, concurrency, timeout, deadline, validators)}
+    return [results[url] for url in urls]
+
+
+def breaker_result(url, reason):
+    """Result for a feed skipped because its circuit breaker is open"""
+    return {'url': url, 'status': None, 'headers': {}, 'body': None, 'error': reason,
+            'elapsed': 0.0, 'not_modified': False, 'skipped': True}
+
+
+def iter_feeds(urls, label, concurrency=DEFAULT_CONCURRENCY, timeout=DEFAULT_TIMEOUT,
+               deadline=DEFAULT_DEADLINE, validators=None, replay=None, snapshot=True,
+               poll=None, breaker=None):
+    """
+    Fetch feeds, or replay them from a snapshot, for the entry point `label`,
+    yielding each result as soon as it is ready.
+
+    Callers can parse the fastest feeds while slow ones are still
+    downloading. Once every feed is in, live fetches are saved to the
+    snapshot store unless snapshot is False.
+    replay is a snapshot path, or 'latest' for the newest one for this label.
+    If poll is given, only those urls are fetched; the rest come back as
+    skipped, not-modified results so callers reuse what they stored last time.
+    With a CircuitBreaker, feeds it has opened are not requested and come
+    back as skipped results carrying the breaker's reason as their error;
+    every fetched result is recorded with it.
+    """
+    urls = list(urls)
+
+    if replay:
+        path = latest_snapshot(label) if replay == 'latest' else replay
+        if not path:
+            raise FileNotFoundError(f"no snapshots saved for {label}")
+        print(f"Replaying feeds from {path}")
+        yield from replay_feeds(path, urls)
+        return
+
+    poll = set(urls) if poll is None else set(poll)
+    blocked = breaker.blocked(poll) if breaker is not None else {}
+    if len(poll) < len(urls):
+        print(f"Polling {len(poll)} of {len(urls)} feeds; the rest aren't due yet")
+    if blocked:
+        print(f"Skipping {len(blocked)} feeds with an open circuit breaker")
+
+    results = []
+    for url in urls:
+        if url in blocked:
+            results.append(breaker_result(url, blocked[url]))
+        elif url not in poll:
+            results.append({'url': url, 'status': None, 'headers': {}, 'body': None,
+                            'error': None, 'elapsed': 0.0, 'not_modified': True,
+                            'skipped': True})
+    yield from list(results)
+
+    fetch_urls = [url for url in urls if url in poll and url not in blocked]
+    for result in iter_fetched(fetch_urls, concurrency, timeout, deadline, validators):
+        if breaker is not None:
+            breaker.record(result)
+        results.append(result)
+        yield result
+
+    if snapshot:
+        try:
+            print(f"Saved feed snapshot {save_snapshot(results, label)}")
+        except OSError as e:
+            print(f"Could not save feed snapshot: {e}")
+
+
+def get_feeds(urls, label, concurrency=DEFAULT_CONCURRENCY, timeout=DEFAULT_TIMEOUT,
+              deadline=DEFAULT_DEADLINE, validators=None, replay=None, snapshot=True,
+              poll=None, breaker=None):
+    """Like iter_feeds, but return one result dict per url, in the order given"""
+    urls = list(urls)
+    results = {result['url']: result
+               for result in iter_feeds(urls, label, concurrency, timeout, deadline,
+                                        validators, replay, snapshot, poll, breaker)}
+    return [results[url] for url in urls]
+
+
+def parse_feed(result, max_entries=None):
+    """
+    Entries of a fetched feed body, reading at most max_entries of them.
+
+    Well-formed RSS and Atom go through the fast title/link extractor;
+    anything it rejects falls back to feedparser, which copes with broken
+    feeds. Either way the result has .feed and .entries like feedparser's.
+    """
+    try:
+        return extract_entries(result['body'], max_entries)
+    except ExtractError:
+        pass
+
+    import feedparser
+
+    feed = feedparser.parse(result['body'], response_headers=result['headers'])
+    if max_entries is not None:
+        feed.entries = feed.entries[:max_entries]
+    return feed
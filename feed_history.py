@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Feed quality history for LUCKNOOZ
+Appends every feed_analyzer run to a local time series and aggregates it
+over rolling windows, so feed choices rest on more than one noisy sample
+"""
+
+import sqlite3
+import time
+
+DEFAULT_HISTORY_FILE = 'feed_history.sqlite3'
+
+BUCKET = 60 * 60                    # samples are rolled up into hourly buckets
+RETENTION = 90 * 24 * 60 * 60       # samples and buckets older than this are dropped
+
+WINDOWS = {'24h': 24 * 60 * 60, '7d': 7 * 24 * 60 * 60}
+
+
+class FeedHistory:
+    """
+    SQLite-backed samples of each feed's headline statistics
+
+    Every sample is kept as raw sums (headlines, words, parseable) and also
+    added into an hourly bucket when it is recorded. Window queries read the
+    buckets, at most one row per feed per hour, so no history is ever
+    recomputed from the raw samples.
+    """
+
+    def __init__(self, filename=DEFAULT_HISTORY_FILE):
+        self.filename = filename
+        self.conn = sqlite3.connect(filename)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS feed_samples (
+                url TEXT NOT NULL,
+                name TEXT NOT NULL,
+                sampled_at REAL NOT NULL,
+                headlines INTEGER NOT NULL,
+                words INTEGER NOT NULL,
+                parseable INTEGER NOT NULL,
+                min_words INTEGER NOT NULL,
+                max_words INTEGER NOT NULL
+            )
+        """)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS feed_hourly (
+                url TEXT NOT NULL,
+                hour INTEGER NOT NULL,
+                name TEXT NOT NULL,
+                samples INTEGER NOT NULL,
+                headlines INTEGER NOT NULL,
+                words INTEGER NOT NULL,
+                parseable INTEGER NOT NULL,
+                min_words INTEGER NOT NULL,
+                max_words INTEGER NOT NULL,
+                PRIMARY KEY (url, hour)
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS feed_samples_sampled_at "
+                          "ON feed_samples (sampled_at)")
+        self.conn.commit()
+
+    def record(self, results, now=None):
+        """Append one run's analysis results (feed_analyzer.analyze_feed dicts)"""
+        now = now if now is not None else time.time()
+        hour = int(now // BUCKET)
+        for r in results:
+            words = r.get('total_words', round(r['avg_words'] * r['total_headlines']))
+            self.conn.execute(
+                "INSERT INTO feed_samples "
+                "(url, name, sampled_at, headlines, words, parseable, min_words, max_words) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (r['url'], r['name'], now, r['total_headlines'], words, r['parseable'],
+                 r['min_words'], r['max_words'])
+            )
+            self.conn.execute(
+                "INSERT INTO feed_hourly "
+                "(url, hour, name, samples, headlines, words, parseable, min_words, max_words) "
+                "VALUES (?, ?, ?, 1, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (url, hour) DO UPDATE SET "
+                "name = excluded.name, samples = samples + 1, "
+                "headlines = headlines + excluded.headlines, words = words + excluded.words, "
+                "parseable = parseable + excluded.parseable, "
+                "min_words = MIN(min_words, excluded.min_words), "
+                "max_words = MAX(max_words, excluded.max_words)",
+                (r['url'], hour, r['name'], r['total_headlines'], words, r['parseable'],
+                 r['min_words'], r['max_words'])
+            )
+        self.conn.commit()
+        self.prune(now)
+
+    def window(self, seconds, now=None):
+        """
+        Aggregate statistics per feed over the last `seconds`, as url -> dict.
+
+        The dicts have the same keys feed_analyzer ranks a single run by
+        (name, url, total_headlines, avg_words, min_words, max_words,
+        parseable, parse_rate) plus the number of samples. Whole hourly
+        buckets are used, so the window can reach up to an hour further back.
+        """
+        now = now if now is not None else time.time()
+        since = int((now - seconds) // BUCKET)
+        rows = self.conn.execute(
+            "SELECT url, MAX(name), SUM(samples), SUM(headlines), SUM(words), SUM(parseable), "
+            "MIN(min_words), MAX(max_words) FROM feed_hourly WHERE hour >= ? GROUP BY url",
+            (since,)
+        ).fetchall()
+
+        stats = {}
+        for url, name, samples, headlines, words, parseable, min_words, max_words in rows:
+            if not headlines:
+                continue
+            stats[url] = {
+                'name': name,
+                'url': url,
+                'samples': samples,
+                'total_headlines': headlines,
+                'avg_words': words / headlines,
+                'min_words': min_words,
+                'max_words': max_words,
+                'parseable': parseable,
+                'parse_rate': parseable / headlines * 100
+            }
+        return stats
+
+    def prune(self, now=None):
+        """Drop samples and buckets older than the retention period"""
+        now = now if now is not None else time.time()
+        cutoff = now - RETENTION
+        self.conn.execute("DELETE FROM feed_samples WHERE sampled_at < ?", (cutoff,))
+        self.conn.execute("DELETE FROM feed_hourly WHERE hour < ?", (int(cutoff // BUCKET),))
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
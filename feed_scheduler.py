@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Adaptive feed polling scheduler for LUCKNOOZ
+Learns how often each feed's entries actually change and polls busy feeds
+more often than slow or dead ones, within a global request budget
+"""
+
+import hashlib
+import sqlite3
+import time
+
+DEFAULT_SCHEDULE_FILE = 'feed_schedule.sqlite3'
+
+MIN_INTERVAL = 15 * 60              # never poll a feed more often than this
+MAX_INTERVAL = 24 * 60 * 60         # never leave a feed longer than this
+DEFAULT_INTERVAL = 4 * 60 * 60      # the old fixed cadence, for feeds with no history
+DEFAULT_BUDGET = 30                 # requests per hour across every feed
+
+# How far the interval moves after each poll
+SPEEDUP = 0.5       # entries changed: poll sooner
+SLOWDOWN = 1.5      # nothing new: back off
+FAILURE_BACKOFF = 2.0
+
+
+def entries_fingerprint(entry_keys):
+    """Order-independent hash of a feed's entry ids"""
+    digest = hashlib.sha1()
+    for key in sorted(entry_keys):
+        digest.update(key.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class FeedScheduler:
+    """SQLite-backed polling interval and change history per feed"""
+
+    def __init__(self, namespace, budget=DEFAULT_BUDGET, filename=DEFAULT_SCHEDULE_FILE):
+        self.namespace = namespace
+        self.budget = budget
+        self.filename = filename
+        # Streaming mode reads and writes it from a pipeline stage thread
+        self.conn = sqlite3.connect(filename, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS feed_schedule (
+                namespace TEXT NOT NULL,
+                url TEXT NOT NULL,
+                interval REAL NOT NULL,
+                last_poll REAL,
+                last_change REAL,
+                entries_hash TEXT,
+                polls INTEGER NOT NULL DEFAULT 0,
+                changes INTEGER NOT NULL DEFAULT 0,
+                failures INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (namespace, url)
+            )
+        """)
+        self.conn.commit()
+
+    def rows(self, urls=None):
+        """Schedule rows as dicts, for the given feeds or every feed in the namespace"""
+        cursor = self.conn.execute(
+            "SELECT url, interval, last_poll, last_change, entries_hash, polls, changes, failures "
+            "FROM feed_schedule WHERE namespace = ?",
+            (self.namespace,)
+        )
+        names = [column[0] for column in cursor.description]
+        rows = {row[0]: dict(zip(names, row)) for row in cursor.fetchall()}
+        if urls is None:
+            return rows
+        return {url: rows[url] for url in urls if url in rows}
+
+    def stretch(self, rows):
+        """
+        Factor to lengthen every interval by so the expected request rate fits the budget.
+
+        Feeds without history count at the default interval.
+        """
+        if not self.budget:
+            return 1.0
+        rate = sum(3600.0 / row['interval'] for row in rows.values())
+        return max(1.0, rate / self.budget)
+
+    def due(self, urls, always=(), now=None):
+        """
+        The subset of urls to poll this run.
+
+        Feeds never polled are always due, and so are feeds in always (e.g.
+        ones with nothing stored to fall back on) unless their last poll
+        failed: a dead feed waits out its backed-off interval like any other.
+        Others are due once their interval, stretched to fit the request
+        budget, has passed since their last poll.
+        """
+        now = now if now is not None else time.time()
+        urls = list(urls)
+        rows = self.rows(urls)
+        for url in urls:
+            rows.setdefault(url, {'url': url, 'interval': DEFAULT_INTERVAL, 'last_poll': None})
+        factor = self.stretch(rows)
+
+        due = []
+        for url in urls:
+            row = rows[url]
+            if row['last_poll'] is None or (url in always and not row.get('failures')):
+                due.append(url)
+            elif now - row['last_poll'] >= row['interval'] * factor:
+                due.append(url)
+        return due
+
+    def record(self, result, entry_keys=None, now=None):
+        """
+        Update a feed's interval from one poll.
+
+        result is the fetch result; entry_keys are the ids of the entries it
+        contained (None when it wasn't parsed). Skipped feeds are ignored.
+        """
+        if result.get('skipped'):
+            return
+        now = now if now is not None else time.time()
+        url = result['url']
+        row = self.rows([url]).get(url) or {
+            'interval': DEFAULT_INTERVAL, 'last_change': None, 'entries_hash': None,
+            'polls': 0, 'changes': 0, 'failures': 0
+        }
+
+        interval = row['interval']
+        entries_hash = row['entries_hash']
+        changed = False
+
+        if result['error']:
+            interval *= FAILURE_BACKOFF
+            row['failures'] += 1
+        elif result['not_modified'] or entry_keys is None:
+            interval *= SLOWDOWN
+        else:
+            new_hash = entries_fingerprint(entry_keys)
+            changed = entries_hash is not None and new_hash != entries_hash
+            interval *= SPEEDUP if changed else SLOWDOWN
+            entries_hash = new_hash
+            row['failures'] = 0
+
+        interval = min(MAX_INTERVAL, max(MIN_INTERVAL, interval))
+        self.conn.execute(
+            "INSERT OR REPLACE INTO feed_schedule "
+            "(namespace, url, interval, last_poll, last_change, entries_hash, polls, changes, failures) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (self.namespace, url, interval, now, now if changed else row['last_change'],
+             entries_hash, row['polls'] + 1, row['changes'] + (1 if changed else 0),
+             row['failures'])
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+def main():
+    """Print the learned schedule for every entry point"""
+    conn = sqlite3.connect(DEFAULT_SCHEDULE_FILE)
+    try:
+        namespaces = [row[0] for row in conn.execute(
+            "SELECT DISTINCT namespace FROM feed_schedule ORDER BY namespace")]
+    except sqlite3.OperationalError:
+        namespaces = []
+    conn.close()
+
+    if not namespaces:
+        print("No feed schedule recorded yet")
+        return
+
+    now = time.time()
+    for namespace in namespaces:
+        scheduler = FeedScheduler(namespace)
+        rows = scheduler.rows()
+        factor = scheduler.stretch(rows)
+        print(f"\n{namespace} (intervals stretched {factor:.2f}x to fit {scheduler.budget} req/h)")
+        print(f"{'Feed':<60} {'Every':>8} {'Changed':>9} {'Fails':>6} {'Next in':>8}")
+        print("-" * 95)
+        for row in sorted(rows.values(), key=lambda r: r['interval']):
+            change_rate = f"{row['changes']}/{row['polls']}"
+            next_in = row['last_poll'] + row['interval'] * factor - now
+            print(f"{row['url'][:60]:<60} {row['interval'] / 60:>6.0f}m {change_rate:>9} "
+                  f"{row['failures']:>6} {max(0, next_in) / 60:>6.0f}m")
+        scheduler.close()
+
+
+if __name__ == "__main__":
+    main()
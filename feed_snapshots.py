@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Raw feed snapshot store for LUCKNOOZ
+Saves every run's fetched feed bodies to a compressed, timestamped zip, and
+replays them later without touching the network. Only the newest few
+snapshots per entry point are kept.
+"""
+
+from datetime import datetime
+import glob
+import json
+import os
+import re
+import zipfile
+
+SNAPSHOT_DIR = 'snapshots'
+KEEP_SNAPSHOTS = 24     # newest snapshots kept per entry point; older ones are deleted
+
+SNAPSHOT_NAME_RE = re.compile(r'-(\d{8}T\d{6})(?:-(\d+))?\.zip$')
+
+
+def snapshot_order(path):
+    """Sort key for a snapshot path: its timestamp, then its same-second suffix"""
+    match = SNAPSHOT_NAME_RE.search(path)
+    if not match:
+        return ('', 0, path)
+    return (match.group(1), int(match.group(2) or 1), path)
+
+
+def snapshot_paths(label=None, directory=SNAPSHOT_DIR):
+    """Snapshot files, oldest first, optionally only those for one entry point"""
+    pattern = f"{label}-*.zip" if label else "*.zip"
+    # "<stamp>.zip" sorts before "<stamp>-2.zip", and "-2" before "-10"
+    return sorted(glob.glob(os.path.join(directory, pattern)), key=snapshot_order)
+
+
+def latest_snapshot(label=None, directory=SNAPSHOT_DIR):
+    """Path of the newest snapshot, or None"""
+    paths = snapshot_paths(label, directory)
+    return paths[-1] if paths else None
+
+
+def read_manifest(path):
+    with zipfile.ZipFile(path) as archive:
+        return json.loads(archive.read('manifest.json'))
+
+
+def find_previous_body(url, label, directory=SNAPSHOT_DIR):
+    """Most recent body recorded for a feed, for feeds that answered 304 this run"""
+    for path in reversed(snapshot_paths(label, directory)):
+        try:
+            with zipfile.ZipFile(path) as archive:
+                manifest = json.loads(archive.read('manifest.json'))
+                for feed in manifest['feeds']:
+                    if feed['url'] == url and feed.get('member'):
+                        return archive.read(feed['member']), feed['headers']
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            continue
+    return None, None
+
+
+def prune_snapshots(label, keep=KEEP_SNAPSHOTS, directory=SNAPSHOT_DIR):
+    """Delete all but the newest `keep` snapshots for label; returns the paths removed"""
+    paths = snapshot_paths(label, directory)
+    removed = paths[:max(len(paths) - keep, 0)]
+    for path in removed:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    return removed
+
+
+def save_snapshot(results, label, directory=SNAPSHOT_DIR, keep=KEEP_SNAPSHOTS):
+    """
+    Write fetch results to snapshots/<label>-<timestamp>.zip and return its path.
+
+    Feeds that came back 304 carry forward the body from the newest earlier
+    snapshot that has one, so every snapshot replays on its own; that also
+    makes it safe to prune all but the newest `keep` for label afterwards.
+    """
+    os.makedirs(directory, exist_ok=True)
+    stamp = datetime.now().strftime('%Y%m%dT%H%M%S')
+    path = os.path.join(directory, f"{label}-{stamp}.zip")
+    # Same-second snapshots are numbered after the highest taken, so the newest sorts last
+    same_second = glob.glob(os.path.join(directory, f"{label}-{stamp}*.zip"))
+    if same_second:
+        suffix = max(snapshot_order(p)[1] for p in same_second) + 1
+        path = os.path.join(directory, f"{label}-{stamp}-{suffix}.zip")
+
+    manifest = {'label': label, 'created': datetime.now().isoformat(), 'feeds': []}
+
+    with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for i, result in enumerate(results):
+            body = result['body']
+            headers = result['headers']
+            carried = False
+            if body is None and result.get('not_modified'):
+                body, headers = find_previous_body(result['url'], label, directory)
+                carried = body is not None
+
+            member = None
+            if body is not None:
+                member = f"feeds/{i:03d}.xml"
+                archive.writestr(member, body)
+
+            manifest['feeds'].append({
+                'url': result['url'],
+                'status': result['status'],
+                'headers': headers or {},
+                'error': result['error'],
+                'elapsed': result['elapsed'],
+                'member': member,
+                'carried_forward': carried
+            })
+
+        archive.writestr('manifest.json', json.dumps(manifest, indent=2))
+
+    prune_snapshots(label, keep, directory)
+    return path
+
+
+def replay_feeds(path, urls):
+    """
+    Fetch results for urls, read from a snapshot instead of the network.
+
+    Same shape as feed_fetcher.fetch_feeds; feeds missing from the snapshot
+    come back with an error.
+    """
+    with zipfile.ZipFile(path) as archive:
+        manifest = json.loads(archive.read('manifest.json'))
+        recorded = {feed['url']: feed for feed in manifest['feeds']}
+
+        results = []
+        for url in urls:
+            feed = recorded.get(url)
+            result = {'url': url, 'status': None, 'headers': {}, 'body': None,
+                      'error': None, 'elapsed': 0.0, 'not_modified': False}
+            if feed is None:
+                result['error'] = "not in snapshot"
+            elif feed['member'] is None:
+                result['status'] = feed['status']
+                result['error'] = feed['error'] or "no body recorded"
+            else:
+                result['status'] = 200
+                result['headers'] = feed['headers']
+                result['body'] = archive.read(feed['member'])
+            results.append(result)
+
+    return results
+
+
+def main():
+    """List the snapshots on disk"""
+    paths = snapshot_paths()
+    if not paths:
+        print(f"No snapshots in {SNAPSHOT_DIR}/")
+        return
+
+    for path in paths:
+        manifest = read_manifest(path)
+        feeds = manifest['feeds']
+        recorded = sum(1 for feed in feeds if feed['member'])
+        size_kb = os.path.getsize(path) / 1024
+        print(f"{path:<55} {recorded:>3}/{len(feeds):<3} feeds  {size_kb:>8.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Per-feed HTTP validator state for LUCKNOOZ
+Remembers each feed's ETag / Last-Modified and the headlines parsed from it,
+so an unchanged feed (HTTP 304) can be reused without downloading or parsing
+"""
+
+import json
+import sqlite3
+import time
+
+DEFAULT_STATE_FILE = 'feed_state.sqlite3'
+
+
+class FeedState:
+    """
+    SQLite-backed validators and parsed items per feed, scoped by namespace
+
+    version should change whenever the stored items would be parsed
+    differently (e.g. a parser fingerprint); state from another version is
+    dropped, which forces a full download of every feed.
+    """
+
+    def __init__(self, namespace, version='', filename=DEFAULT_STATE_FILE):
+        self.namespace = namespace
+        self.version = version
+        self.filename = filename
+        # Streaming mode reads and writes it from a pipeline stage thread
+        self.conn = sqlite3.connect(filename, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS feed_state (
+                namespace TEXT NOT NULL,
+                url TEXT NOT NULL,
+                etag TEXT,
+                modified TEXT,
+                items TEXT NOT NULL,
+                version TEXT NOT NULL,
+                updated REAL NOT NULL,
+                PRIMARY KEY (namespace, url)
+            )
+        """)
+        self.conn.execute(
+            "DELETE FROM feed_state WHERE namespace = ? AND version != ?",
+            (namespace, version)
+        )
+        self.conn.commit()
+
+    def validators(self, urls):
+        """
+        Conditional GET validators for the given feeds, as url -> (etag, modified).
+
+        Only feeds with stored items are included: a 304 is useless without
+        something to reuse.
+        """
+        found = {}
+        for url in urls:
+            row = self.conn.execute(
+                "SELECT etag, modified FROM feed_state WHERE namespace = ? AND url = ?",
+                (self.namespace, url)
+            ).fetchone()
+            if row and (row[0] or row[1]):
+                found[url] = row
+        return found
+
+    def stored(self, urls):
+        """The subset of urls that have items stored from an earlier download"""
+        return {url for url in urls if self.conn.execute(
+            "SELECT 1 FROM feed_state WHERE namespace = ? AND url = ?",
+            (self.namespace, url)
+        ).fetchone()}
+
+    def items(self, url):
+        """Items stored for a feed on its last full download, or None"""
+        row = self.conn.execute(
+            "SELECT items FROM feed_state WHERE namespace = ? AND url = ?",
+            (self.namespace, url)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def update(self, url, headers, items):
+        """Record a full download: its validators from the response headers and its items"""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO feed_state "
+            "(namespace, url, etag, modified, items, version, updated) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (self.namespace, url, headers.get('etag'), headers.get('last-modified'),
+             json.dumps(items), self.version, time.time())
+        )
+        self.conn.commit()
+
+    def forget_validators(self):
+        """Drop every feed's ETag/Last-Modified so each is downloaded in full; items stay"""
+        self.conn.execute("UPDATE feed_state SET etag = NULL, modified = NULL WHERE namespace = ?",
+                          (self.namespace,))
+        self.conn.commit()
+
+    def clear(self):
+        """Forget every feed in this namespace"""
+        self.conn.execute("DELETE FROM feed_state WHERE namespace = ?", (self.namespace,))
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Per-run stores for LUCKNOOZ entry points
+Opens the parse cache, circuit breaker, feed state, seen-entry index,
+schedule and remix pool an entry point's options ask for, and polls feeds
+with them
+"""
+
+from feed_breaker import CircuitBreaker
+from feed_fetcher import DEFAULT_CONCURRENCY, DEFAULT_DEADLINE, DEFAULT_TIMEOUT, iter_feeds
+from feed_scheduler import FeedScheduler
+from feed_state import FeedState
+from parse_cache import ParseCache
+from remix_pool import RemixPool
+from seen_entries import SeenEntries
+
+
+def add_store_arguments(parser, seen=False):
+    """Add the shared store options to an entry point's argparse parser"""
+    parser.add_argument('--no-cache', action='store_true',
+                        help="parse every headline instead of using the parse cache")
+    parser.add_argument('--clear-cache', action='store_true',
+                        help="empty the parse cache before running")
+    if seen:
+        parser.add_argument('--full-ingest', action='store_true',
+                            help="parse every feed entry, not just those unseen on earlier runs")
+    parser.add_argument('--keep-duplicates', action='store_true',
+                        help="parse every copy of a story told by several feeds")
+    parser.add_argument('--clear-pool', action='store_true',
+                        help="drop the remixes kept from earlier runs and make all new ones")
+
+
+class RunStores:
+    """
+    The stores one run of an entry point reads and writes, opened from its options
+
+    version should change whenever parsing would give different results
+    (e.g. a parser fingerprint). Replays are read straight from a snapshot,
+    so they get only the parse cache: no breaker, conditional GET state,
+    seen-entry index, schedule or remix pool. The seen-entry index is only
+    opened for entry points that ask for it.
+    """
+
+    def __init__(self, namespace, version, args, seen=False):
+        self.cache = None
+        self.breaker = None
+        self.state = None
+        self.seen = None
+        self.scheduler = None
+        self.pool = None
+
+        if not args.no_cache:
+            self.cache = ParseCache(namespace, version)
+            if args.clear_cache:
+                self.cache.clear()
+
+        if args.replay:
+            return
+
+        # Feeds that keep failing are skipped for a while; replays never fail that way
+        self.breaker = CircuitBreaker()
+        if args.reset_breakers:
+            self.breaker.reset()
+        self.state = FeedState(namespace, version)
+        # Stored items stay, so new titles are still checked against them
+        if args.refresh:
+            self.state.forget_validators()
+        if seen:
+            self.seen = SeenEntries(namespace, version)
+            if args.full_ingest:
+                self.seen.clear()
+        if args.schedule:
+            self.scheduler = FeedScheduler(namespace, budget=args.budget)
+        self.pool = RemixPool(namespace)
+        if args.clear_pool:
+            self.pool.clear()
+
+    def close(self):
+        if self.cache is not None:
+            print(f"Parse cache: {self.cache.hits} hits, {self.cache.misses} misses")
+        for store in (self.cache, self.breaker, self.state, self.seen, self.scheduler, self.pool):
+            if store is not None:
+                store.close()
+
+
+def poll_feeds(urls, label, concurrency=DEFAULT_CONCURRENCY, timeout=DEFAULT_TIMEOUT,
+               deadline=DEFAULT_DEADLINE, state=None, replay=None, snapshot=True,
+               scheduler=None, breaker=None):
+    """
+    iter_feeds, with conditional GETs from a FeedState and only the feeds a
+    FeedScheduler says are due
+
+    Feeds with nothing stored to fall back on are polled whether due or not,
+    unless they have been failing; those follow their backed-off interval and
+    come back as skipped with nothing to reuse.
+    """
+    urls = list(urls)
+    validators = state.validators(urls) if state is not None else None
+    poll = None
+    if scheduler is not None:
+        stored = state.stored(urls) if state is not None else set()
+        poll = scheduler.due(urls, always=set(urls) - stored)
+    return iter_feeds(urls, label, concurrency, timeout, deadline, validators, replay,
+                      snapshot, poll, breaker)
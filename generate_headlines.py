@@ -4,16 +4,30 @@ LUCKNOOZ Headline Generator - Version 12
 Pre-generates fully conjugated headline combinations
 """
 
-import feedparser
+import argparse
+from collections import deque
+import gc
 import json
+import multiprocessing
 import re
 from datetime import datetime
-import random
-import spacy
+import time
 
-# Load spaCy English model
+from bulk_remix import RemixCorpus, parsed_headline_features, use_bulk
+from feed_fetcher import (DEFAULT_CONCURRENCY, DEFAULT_DEADLINE, DEFAULT_TIMEOUT,
+                          add_fetch_arguments, parse_feed)
+from feed_stores import RunStores, add_store_arguments, poll_feeds
+from near_duplicates import DEFAULT_THRESHOLD, NearDuplicateIndex
+from nlp_profiles import load_profile
+from pair_sampling import sample_pairs
+from parse_cache import fingerprint, normalize_headline
+from pipeline import PairingPool, run_stages
+from remix_pool import keep_latest, top_up
+from seen_entries import entry_key
+
+# Load spaCy English model, skipping components the parser never reads
 print("Loading spaCy model...")
-nlp = spacy.load('en_core_web_sm')
+nlp = load_profile('generate_headlines')
 print("✓ spaCy loaded\n")
 
 # RSS feeds
@@ -153,19 +167,18 @@ def conjugate_verb(verb_text, is_singular, target_tense='present'):
             return verb_lower[:-1]
         return verb_text
 
-def conjugate_predicate_for_subject(predicate_doc, subject_doc, original_verb_token):
+def conjugate_predicate_for_subject(predicate_doc, subject_is_plural, original_tense):
     """
     Conjugate predicate to match a NEW subject
     This is the KEY function that makes combinations grammatical
+    
+    subject_is_plural and original_tense come precomputed from parse_headline
+    (the new subject's number and the predicate verb's original tense)
     """
     if len(predicate_doc) == 0:
         return ""
     
-    # Determine if NEW subject is singular
-    is_singular = is_subject_singular(subject_doc)
-    
-    # Get original verb tense
-    original_tense = get_verb_tense(original_verb_token)
+    is_singular = not subject_is_plural
     
     # Find verbs in predicate
     verbs = [token for token in predicate_doc if token.pos_ == 'VERB' or token.pos_ == 'AUX']
@@ -202,6 +215,40 @@ def find_root_verb(doc):
     
     return None
 
+class ParsedHeadline:
+    """
+    Compact parse of one headline: only the strings and flags combinations use
+    
+    Holds no spaCy objects, so each Doc is freed as soon as its headline is
+    parsed, and records pickle (for worker processes) and serialise (for the
+    parse cache) cheaply.
+    """
+    
+    __slots__ = ('subject_text', 'subject_is_plural', 'tense', 'predicate_text',
+                 'predicate_singular', 'predicate_plural', 'original', 'source')
+    
+    def __init__(self, subject_text, subject_is_plural, tense, predicate_text,
+                 predicate_singular, predicate_plural, original, source):
+        self.subject_text = subject_text
+        self.subject_is_plural = subject_is_plural
+        self.tense = tense
+        self.predicate_text = predicate_text
+        self.predicate_singular = predicate_singular
+        self.predicate_plural = predicate_plural
+        self.original = original
+        self.source = source
+    
+    def predicate_for(self, subject_is_plural):
+        """This headline's predicate conjugated for a subject of the given number"""
+        return self.predicate_plural if subject_is_plural else self.predicate_singular
+    
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+    
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
 def parse_headline(title, source):
     """Parse headline into subject and predicate components"""
     title = clean_headline(title)
@@ -241,144 +288,502 @@ def parse_headline(title, source):
     if len(subject_content) == 0:
         return None
     
-    return {
-        'subject_doc': subject_doc,
-        'subject_text': subject_doc.text,
-        'predicate_doc': predicate_doc,
-        'predicate_text': predicate_doc.text,
-        'verb_token': root_verb,
-        'original': title,
-        'source': source
-    }
+    # Number, tense and the predicate's conjugated forms are properties of this
+    # headline, not of any pairing, so work them out once here instead of for
+    # every combination
+    tense = get_verb_tense(root_verb)
+    
+    return ParsedHeadline(
+        subject_text=subject_doc.text,
+        subject_is_plural=not is_subject_singular(subject_doc),
+        tense=tense,
+        predicate_text=predicate_doc.text,
+        predicate_singular=conjugate_predicate_for_subject(predicate_doc, False, tense),
+        predicate_plural=conjugate_predicate_for_subject(predicate_doc, True, tense),
+        original=title,
+        source=source
+    )
+
+def parser_fingerprint():
+    """Fingerprint of the parse rules and model, used to invalidate the parse cache"""
+    return fingerprint(
+        clean_headline, find_root_verb, parse_headline, ParsedHeadline, is_subject_singular,
+        get_verb_tense, conjugate_verb, conjugate_predicate_for_subject, QUESTION_WORDS,
+        nlp.meta.get('name'), nlp.meta.get('version')
+    )
 
-def fetch_headlines():
-    """Fetch and parse headlines from all RSS feeds"""
-    parsed_headlines = []
+def parse_chunk(chunk):
+    """Worker entry point: parse (title, source) pairs into ParsedHeadline records"""
+    return [parse_headline(title, source) for title, source in chunk]
+
+def parse_pool(workers):
+    """
+    Pool of `workers` forked parse processes for parse_titles, or None to parse in this one
     
-    print("Fetching headlines from feeds...")
+    The model is already loaded in this process, so forked workers share it
+    copy-on-write instead of each loading their own. Make the pool before
+    any fetch threads start, and hand it to close_parse_pool when done.
+    """
+    if workers <= 1:
+        return None
     
-    for feed_url in FEEDS:
-        try:
-            print(f"  Fetching from {feed_url}...")
-            feed = feedparser.parse(feed_url)
-            source = feed.feed.get('title', feed_url)
-            
-            feed_count = 0
-            for entry in feed.entries[:30]:
-                title = entry.get('title', '')
-                if title:
-                    parsed = parse_headline(title, source)
-                    if parsed:
-                        parsed_headlines.append(parsed)
-                        feed_count += 1
-            
-            print(f"    Found {feed_count} parseable headlines")
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        print("  Process pool needs fork(); parsing on one core")
+        return None
+    
+    # Move everything allocated so far (the model included) out of the GC's
+    # reach so collections in the workers don't touch, and copy, shared pages
+    gc.freeze()
+    return multiprocessing.get_context('fork').Pool(workers)
+
+def close_parse_pool(pool):
+    if pool is not None:
+        pool.close()
+        pool.join()
+        gc.unfreeze()
+
+def parse_titles(items, pool=None, workers=1):
+    """
+    Parse (title, source) pairs, on a pool of `workers` from parse_pool if given
+    
+    Titles go out to the workers in chunks and only ParsedHeadline records
+    come back.
+    """
+    if pool is None or len(items) < 2:
+        return parse_chunk(items)
+    
+    # A few chunks per worker keeps them all busy without much IPC overhead
+    chunk_size = max(1, -(-len(items) // (workers * 4)))
+    chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+    
+    results = []
+    for chunk_results in pool.imap(parse_chunk, chunks):
+        results.extend(chunk_results)
+    return results
+
+class FeedIngest:
+    """
+    Turns fetch results into ParsedHeadline records
+    
+    Used by both the batch and streaming paths, so every feed goes through
+    the same steps however it is consumed. read() takes one feed's result
+    as soon as it arrives; parse() then parses the new titles of one or
+    more read feeds together, spread over pool (a parse_pool of `workers`
+    processes) if given. With a ParseCache, titles parsed or rejected on an
+    earlier run are answered from the cache. With a FeedState, a feed that
+    answered 304 Not Modified (or wasn't due) reuses the headlines parsed
+    from it last time, and each parsed feed's validators and headlines are
+    stored for next run. With a FeedScheduler, every result is recorded for
+    the polling schedule. Titles that retell a story already in hand
+    (near-duplicates at dedupe_threshold, None to keep them all) are
+    dropped, new ones before parsing.
+    """
+    
+    def __init__(self, cache=None, state=None, scheduler=None,
+                 dedupe_threshold=DEFAULT_THRESHOLD, pool=None, workers=1):
+        self.cache = cache
+        self.state = state
+        self.scheduler = scheduler
+        self.pool = pool
+        self.workers = workers
+        self.duplicates = None
+        if dedupe_threshold is not None:
+            self.duplicates = NearDuplicateIndex(dedupe_threshold)
+        self.stored = None
+        self.live = set()
+        self.collapsed = 0
+    
+    def seed(self, urls):
+        """
+        Match new titles against every feed's stored headlines too
+        
+        For streaming, where the copy of a story kept on an earlier run may
+        belong to a feed that hasn't arrived yet when another feed's copy does.
+        """
+        if self.duplicates is None or self.state is None:
+            return
+        self.stored = NearDuplicateIndex(self.duplicates.threshold)
+        for url in urls:
+            for item in self.state.items(url) or ():
+                self.stored.add(self.stored.signature(item['original']))
+    
+    def admit(self, title, new=False):
+        """Whether title tells a story not yet in hand; if so, it now is"""
+        if self.duplicates is None:
+            return True
+        signature = self.duplicates.signature(title)
+        if (self.duplicates.matches(signature)
+                or (new and self.stored is not None and self.stored.matches(signature))):
+            self.collapsed += 1
+            return False
+        self.duplicates.add(signature)
+        return True
+    
+    def read(self, result):
+        """
+        One feed's fetch result, read but not yet parsed, or None if it failed
         
+        Returned as a dict of the feed's url, the headlines it already has in
+        hand, its (title, source) items still to parse, and the result to
+        store validators from (None for a feed that wasn't downloaded).
+        """
+        feed_url = result['url']
+        
+        if result['error']:
+            print(f"    Error fetching {feed_url}: {result['error']}")
+            if self.scheduler is not None:
+                self.scheduler.record(result)
+            return None
+        
+        if result['not_modified']:
+            stored = self.state.items(feed_url) if self.state is not None else None
+            reused = [ParsedHeadline.from_dict(item) for item in stored or ()]
+            reason = "not due" if result.get('skipped') else "not modified"
+            print(f"  {feed_url} {reason}, reusing {len(reused)} parsed headlines")
+            if self.scheduler is not None:
+                self.scheduler.record(result)
+            return {'url': feed_url, 'headlines': reused, 'items': [],
+                    'result': None}
+        
+        try:
+            feed = parse_feed(result, max_entries=30)
         except Exception as e:
             print(f"    Error fetching {feed_url}: {str(e)}")
+            return None
+        print(f"  Fetched {feed_url} in {result['elapsed']:.1f}s")
+        if self.scheduler is not None:
+            self.scheduler.record(result, [entry_key(entry) for entry in feed.entries])
+        source = feed.feed.get('title', feed_url)
+        
+        titles = [clean_headline(entry.get('title', '')) for entry in feed.entries]
+        titles = [title for title in titles if title]
+        
+        cached = self.cache.get_many(titles) if self.cache is not None else {}
+        
+        parsed_headlines = []
+        items = []
+        for title in titles:
+            key = normalize_headline(title)
+            if key not in cached:
+                items.append((title, source))
+            elif cached[key] is not None:
+                parsed = ParsedHeadline.from_dict(cached[key])
+                parsed.source = source
+                parsed_headlines.append(parsed)
+        
+        return {'url': feed_url, 'headlines': parsed_headlines, 'items': items,
+                'result': result}
     
+    def parse(self, feeds):
+        """Parse the new titles of feeds from read() together; returns every feed's headlines"""
+        feeds = [feed for feed in feeds if feed is not None]
+        
+        # Every feed's cached and stored headlines are indexed before any new
+        # title is checked, in feed order, so which copy of a story is kept
+        # doesn't depend on which feed arrived first. Known copies of one story
+        # are only dropped from the output; each feed still stores all of its own.
+        output = {feed['url']: [p for p in feed['headlines'] if self.admit(p.original)]
+                  for feed in feeds}
+        
+        # The same story from several feeds is parsed once, as its first copy.
+        # Dropped copies stay out of the parse cache, so they are checked
+        # again next run.
+        for feed in feeds:
+            feed['items'] = [item for item in feed['items'] if self.admit(item[0], new=True)]
+        
+        # One backlog across every feed, so the pool's chunks are sized from
+        # all the titles waiting rather than from one feed's handful
+        pending = [(feed, item) for feed in feeds for item in feed['items']]
+        if pending:
+            print(f"\nParsing {len(pending)} titles on {max(self.workers, 1)} process(es)...")
+        results = parse_titles([item for feed, item in pending], self.pool, self.workers)
+        for (feed, item), parsed in zip(pending, results):
+            if parsed:
+                feed['headlines'].append(parsed)
+                output[feed['url']].append(parsed)
+        
+        if self.cache is not None:
+            self.cache.put_many(
+                (title, parsed.to_dict() if parsed else None)
+                for (feed, (title, source)), parsed in zip(pending, results)
+            )
+        
+        for feed in feeds:
+            if feed['result'] is None:
+                continue
+            # Remember validators and parsed headlines for next run's conditional GETs
+            if self.state is not None:
+                self.state.update(feed['url'], feed['result']['headers'],
+                                  [parsed.to_dict() for parsed in feed['headlines']])
+            print(f"  {feed['url']}: found {len(output[feed['url']])} parseable headlines")
+        
+        parsed_headlines = [parsed for feed in feeds for parsed in output[feed['url']]]
+        self.live.update(parsed.original for parsed in parsed_headlines)
+        return parsed_headlines
+    
+    def stage(self, results):
+        """Pipeline stage: fetch results in, ParsedHeadline records out, one feed at a time"""
+        for result in results:
+            yield from self.parse([self.read(result)])
+    
+    def report(self):
+        if self.duplicates is not None:
+            print(f"  Collapsed {self.collapsed} near-duplicate titles")
+
+def fetch_headlines(cache=None, pool=None, workers=1, concurrency=DEFAULT_CONCURRENCY,
+                    timeout=DEFAULT_TIMEOUT, deadline=DEFAULT_DEADLINE, state=None,
+                    replay=None, snapshot=True, scheduler=None, breaker=None,
+                    dedupe_threshold=DEFAULT_THRESHOLD):
+    """
+    Fetch and parse headlines from all RSS feeds
+    
+    Each feed is read through a FeedIngest as soon as it downloads, while
+    slower feeds are still on the way; once every feed is in, the new titles
+    from all of them are parsed in one pass, on pool (a parse_pool of
+    `workers` processes) if given. With replay, feed bodies come from a
+    saved snapshot instead of the network. With a FeedScheduler, only feeds
+    that are due get polled. With a CircuitBreaker, feeds that keep failing
+    are skipped for a cool-down.
+    """
+    ingest = FeedIngest(cache, state, scheduler, dedupe_threshold, pool, workers)
+    
+    print(f"Fetching headlines from {len(FEEDS)} feeds...")
+    results = poll_feeds(FEEDS, 'generate_headlines', concurrency, timeout, deadline, state,
+                         replay, snapshot, scheduler, breaker)
+    feeds = {result['url']: ingest.read(result) for result in results}
+    parsed_headlines = ingest.parse([feeds.get(url) for url in FEEDS])
+    ingest.report()
     return parsed_headlines
 
-def generate_combinations(parsed_headlines, num_combinations=120):
+def generate_combinations(parsed_headlines, num_combinations=120, exclude=()):
     """
     Generate headline combinations with proper conjugation
     THIS IS WHERE THE MAGIC HAPPENS
+    Headlines in exclude (e.g. already pooled) are not made again.
     """
-    if len(parsed_headlines) < 2:
+    if len(parsed_headlines) < 2 or num_combinations <= 0:
         return []
     
     combinations = []
-    attempts = 0
-    max_attempts = num_combinations * 10
+    seen_headlines = set(exclude)
     
     print(f"\nGenerating {num_combinations} combinations with proper conjugation...")
     
-    while len(combinations) < num_combinations and attempts < max_attempts:
-        attempts += 1
-        
-        # Pick random subject and predicate sources
-        subj_parsed = random.choice(parsed_headlines)
-        pred_parsed = random.choice(parsed_headlines)
+    # Every (subject, predicate) pair at most once, in random order, never
+    # pairing a headline with itself. Large corpora pick pairs in bulk, with
+    # headroom for ones that turn out to repeat an earlier headline.
+    if use_bulk(len(parsed_headlines)):
+        corpus = RemixCorpus(parsed_headlines, parsed_headline_features)
+        pairs = corpus.pairs(num_combinations * 2 + len(exclude))
+    else:
+        pairs = sample_pairs(len(parsed_headlines))
+    
+    for subj_index, pred_index in pairs:
+        subj_parsed = parsed_headlines[subj_index]
+        pred_parsed = parsed_headlines[pred_index]
         
-        # CRITICAL: Ensure different originals
-        if subj_parsed['original'] == pred_parsed['original']:
+        # CRITICAL: Ensure different originals (the same headline from two feeds)
+        if subj_parsed.original == pred_parsed.original:
             continue
         
-        # Get the NEW subject and predicate
-        subject_doc = subj_parsed['subject_doc']
-        subject_text = subj_parsed['subject_text']
-        
-        predicate_doc = pred_parsed['predicate_doc']
-        verb_token = pred_parsed['verb_token']
-        
-        # CONJUGATE predicate to match the NEW subject
-        conjugated_predicate = conjugate_predicate_for_subject(
-            predicate_doc, 
-            subject_doc, 
-            verb_token
-        )
-        
-        # Create combined headline
-        combined_headline = f"{subject_text} {conjugated_predicate}"
+        combination = make_combination(subj_parsed, pred_parsed)
         
         # Check for duplicates
-        if any(c['headline'] == combined_headline for c in combinations):
+        if combination['headline'] in seen_headlines:
             continue
+        seen_headlines.add(combination['headline'])
         
-        combinations.append({
-            'headline': combined_headline,
-            'subject': {
-                'text': subject_text,
-                'original': subj_parsed['original'],
-                'source': subj_parsed['source']
-            },
-            'predicate': {
-                'text': conjugated_predicate,
-                'original': pred_parsed['original'],
-                'source': pred_parsed['source']
-            }
-        })
+        combinations.append(combination)
+        if len(combinations) >= num_combinations:
+            break
     
     print(f"✓ Generated {len(combinations)} unique, grammatical combinations")
     return combinations
 
+def make_combination(subj_parsed, pred_parsed):
+    """One output combination: the NEW subject with a predicate conjugated to fit it"""
+    # Get the NEW subject and predicate
+    subject_text = subj_parsed.subject_text
+    
+    # Predicate already CONJUGATED for either number of the NEW subject
+    conjugated_predicate = pred_parsed.predicate_for(subj_parsed.subject_is_plural)
+    
+    return {
+        'headline': f"{subject_text} {conjugated_predicate}",
+        'subject': {
+            'text': subject_text,
+            'original': subj_parsed.original,
+            'source': subj_parsed.source
+        },
+        'predicate': {
+            'text': conjugated_predicate,
+            'original': pred_parsed.original,
+            'source': pred_parsed.source
+        }
+    }
+
+def pooled(combo):
+    """RemixPool entry for a combination: its text, the headlines it came from, and the record"""
+    return (combo['headline'], (combo['subject']['original'], combo['predicate']['original']),
+            combo)
+
+def stream_combinations(pairs):
+    """Pipeline stage: (subject, predicate) headline pairs in, combinations out"""
+    for subj_parsed, pred_parsed in pairs:
+        yield make_combination(subj_parsed, pred_parsed)
+
+def stream_headlines(pairing, ingest, concurrency=DEFAULT_CONCURRENCY, timeout=DEFAULT_TIMEOUT,
+                     deadline=DEFAULT_DEADLINE, replay=None, snapshot=True, breaker=None):
+    """
+    Fetch, parse and combine as overlapping stages, yielding combinations as they are made
+    
+    Each feed goes through ingest as soon as it downloads and each parsed
+    headline is paired through pairing with earlier ones, so combinations
+    start arriving while slow feeds are still downloading. Stages are joined
+    by bounded queues; stopping early stops every stage.
+    """
+    results = poll_feeds(FEEDS, 'generate_headlines', concurrency, timeout, deadline,
+                         ingest.state, replay, snapshot, ingest.scheduler, breaker)
+    ingest.seed(FEEDS)
+    return run_stages(results, ingest.stage, pairing.stage, stream_combinations)
+
+def run_stream(args, stores, pool=None, count=120):
+    """--stream / --follow: print combinations as they are made and save the latest ones"""
+    pairing = PairingPool(key=lambda parsed: parsed.original)
+    # Without a remix pool (replays) only this process's latest combinations are kept
+    latest = deque(maxlen=count)
+    seen_headlines = set()
+    
+    while True:
+        print(f"Streaming headlines from {len(FEEDS)} feeds...")
+        ingest = FeedIngest(stores.cache, stores.state, stores.scheduler,
+                            None if args.keep_duplicates else DEFAULT_THRESHOLD,
+                            pool, args.workers)
+        stream = stream_headlines(pairing, ingest, concurrency=args.concurrency,
+                                  timeout=args.timeout, deadline=args.deadline,
+                                  replay=args.replay, snapshot=not args.no_snapshot,
+                                  breaker=stores.breaker)
+        if stores.pool is not None:
+            seen_headlines = stores.pool.headlines()
+        made = []
+        try:
+            for combo in stream:
+                if combo['headline'] in seen_headlines:
+                    continue
+                seen_headlines.add(combo['headline'])
+                made.append(combo)
+                print(f"  • {combo['headline']}")
+                if not args.follow and len(made) >= count:
+                    break
+        finally:
+            stream.close()
+        ingest.report()
+        
+        if stores.pool is not None:
+            combinations = keep_latest(stores.pool, ingest.live, [pooled(c) for c in made], count)
+        else:
+            latest.extend(made)
+            combinations = list(latest)
+            # Forget headlines that have rotated out so the set stays bounded
+            seen_headlines &= {combo['headline'] for combo in latest}
+        if combinations:
+            save_combinations(combinations)
+        if not args.follow:
+            return
+        print(f"{len(made)} new combinations from {len(pairing.records)} pooled headlines; "
+              f"polling again in {args.follow:g}s")
+        time.sleep(args.follow)
+
+def save_combinations(combinations, filename='headline-components.json'):
+    """Write combinations to the JSON file the site reads"""
+    output = {
+        'headlines': combinations,
+        'generated': datetime.now().isoformat(),
+        'total_headlines': len(combinations)
+    }
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(output, f, indent=2, ensure_ascii=False)
+    
+    print()
+    print(f"✅ Saved {len(combinations)} headlines to {filename}")
+
 def main():
+    parser = argparse.ArgumentParser(description="LUCKNOOZ headline generator")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="processes to parse headlines on (forked, sharing the loaded model)")
+    parser.add_argument('--count', type=int, default=120,
+                        help="combinations to write")
+    parser.add_argument('--stream', action='store_true',
+                        help="parse and combine each feed as it arrives, printing "
+                             "combinations as they are made")
+    parser.add_argument('--follow', type=float, metavar='SECONDS',
+                        help="keep streaming, re-polling every feed this often")
+    add_store_arguments(parser)
+    add_fetch_arguments(parser)
+    args = parser.parse_args()
+    
     print("=" * 60)
     print("LUCKNOOZ Headline Generator v12")
     print("Pre-combined with proper conjugation")
     print("=" * 60)
     print()
     
-    # Fetch and parse headlines
-    parsed_headlines = fetch_headlines()
+    # Fork the parse workers before any fetch threads exist
+    pool = parse_pool(args.workers)
+    stores = RunStores('generate_headlines', parser_fingerprint(), args)
     
-    if not parsed_headlines:
-        print("ERROR: No headlines parsed successfully")
+    if args.stream or args.follow:
+        try:
+            run_stream(args, stores, pool, args.count)
+        except FileNotFoundError as e:
+            print(f"ERROR: {e}")
+        except KeyboardInterrupt:
+            print("\nStopped")
+        finally:
+            stores.close()
+            close_parse_pool(pool)
         return
     
-    print(f"\nSuccessfully parsed {len(parsed_headlines)} headlines")
-    
-    # Generate combinations
-    combinations = generate_combinations(parsed_headlines, num_combinations=120)
+    # Fetch and parse headlines
+    try:
+        parsed_headlines = fetch_headlines(cache=stores.cache, pool=pool, workers=args.workers,
+                                           concurrency=args.concurrency, timeout=args.timeout,
+                                           deadline=args.deadline, state=stores.state,
+                                           replay=args.replay, snapshot=not args.no_snapshot,
+                                           scheduler=stores.scheduler, breaker=stores.breaker,
+                                           dedupe_threshold=None if args.keep_duplicates
+                                           else DEFAULT_THRESHOLD)
+        
+        if not parsed_headlines:
+            print("ERROR: No headlines parsed successfully")
+            return
+        
+        print(f"\nSuccessfully parsed {len(parsed_headlines)} headlines")
+        
+        # Generate combinations
+        if stores.pool is None:
+            combinations = generate_combinations(parsed_headlines, num_combinations=args.count)
+        else:
+            # Combinations from earlier runs stay while their sources are in the
+            # feeds; only the shortfall is made fresh
+            combinations = top_up(
+                stores.pool, (parsed.original for parsed in parsed_headlines), args.count,
+                lambda needed, exclude: [pooled(combo) for combo in generate_combinations(
+                    parsed_headlines, num_combinations=needed, exclude=exclude)],
+                label="\nCombination pool"
+            )
+    except FileNotFoundError as e:
+        print(f"ERROR: {e}")
+        return
+    finally:
+        stores.close()
+        close_parse_pool(pool)
     
     if not combinations:
         print("ERROR: Could not generate any combinations")
         return
     
-    # Prepare output
-    output = {
-        'headlines': combinations,
-        'generated': datetime.now().isoformat(),
-        'total_headlines': len(combinations)
-    }
-    
-    # Save to file
-    filename = 'headline-components.json'
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
-    
-    print()
-    print(f"✅ Saved {len(combinations)} headlines to {filename}")
+    save_combinations(combinations)
     print()
     print("Sample headlines:")
     for combo in combinations[:8]:
@@ -387,4 +792,4 @@ def main():
     print("Upload headline-components.json to GitHub to update your site!")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Pooled HTTP client for LUCKNOOZ
+Keeps connections alive per host so feeds on the same domain share them,
+and retries transient failures with jittered exponential back-off
+"""
+
+import base64
+import http.client
+import random
+import ssl
+import threading
+import time
+from urllib.parse import unquote, urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass
+import zlib
+
+DEFAULT_RETRIES = 2          # extra attempts after the first, for transient failures
+DEFAULT_BACKOFF = 0.5        # seconds; attempt n waits up to BACKOFF * 2**n
+MAX_BACKOFF = 8.0            # never sleep longer than this between attempts
+MAX_RETRY_AFTER = 30.0       # cap on a server's Retry-After
+MAX_REDIRECTS = 5
+MAX_IDLE_PER_HOST = 4        # idle keep-alive connections kept per host
+READ_CHUNK = 64 * 1024       # bytes per body read; the time budget is checked between reads
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+# Errors a stale keep-alive connection gives when the server already closed it
+STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, http.client.BadStatusLine,
+                           BrokenPipeError, ConnectionResetError)
+
+
+class HTTPClientError(Exception):
+    """A request that failed without an HTTP response, after every retry"""
+
+
+class BudgetExceeded(TimeoutError):
+    """A request ran past its total time budget"""
+
+
+def decode_body(body, encoding):
+    """A response body with its Content-Encoding (gzip, deflate or none) undone"""
+    encoding = (encoding or 'identity').strip().lower()
+    if encoding in ('identity', ''):
+        return body
+    try:
+        if encoding in ('gzip', 'x-gzip'):
+            return zlib.decompress(body, 16 + zlib.MAX_WBITS)
+        if encoding == 'deflate':
+            # Servers send zlib-wrapped or raw deflate under the same name
+            try:
+                return zlib.decompress(body)
+            except zlib.error:
+                return zlib.decompress(body, -zlib.MAX_WBITS)
+    except zlib.error as e:
+        raise HTTPClientError(f"could not decode {encoding} body: {e}") from e
+    raise HTTPClientError(f"unsupported Content-Encoding: {encoding}")
+
+
+def proxy_auth(parts):
+    """Proxy-Authorization header value for a proxy URL with user:password, or None"""
+    if parts.username is None:
+        return None
+    credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+    return 'Basic ' + base64.b64encode(credentials.encode('utf-8')).decode('ascii')
+
+
+def backoff_delay(attempt, base=DEFAULT_BACKOFF, cap=MAX_BACKOFF, rng=random):
+    """Full-jitter exponential back-off: a random wait up to base * 2**attempt"""
+    return rng.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def retry_after(headers):
+    """Seconds a 429/503 response asks us to wait, if it says (numeric form only)"""
+    value = headers.get('retry-after')
+    try:
+        return min(MAX_RETRY_AFTER, max(0.0, float(value)))
+    except (TypeError, ValueError):
+        return None
+
+
+class HTTPClient:
+    """
+    Thread-safe GET client with a keep-alive connection pool per host
+
+    Connections are keyed by (scheme, host, port), so every feed on
+    feeds.bbci.co.uk reuses the same few sockets. Connection errors,
+    timeouts and 429/5xx responses are retried up to `retries` times with
+    jittered back-off; a keep-alive connection the server dropped is
+    replaced without counting as a retry. Responses are asked for gzip or
+    deflate and decoded. The http_proxy/https_proxy/no_proxy environment
+    variables are honoured as urllib does: plain HTTP goes through the
+    proxy, HTTPS is tunnelled with CONNECT. Proxies are spoken to in plain
+    HTTP, with Basic auth if their URL carries credentials.
+    """
+
+    def __init__(self, retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF,
+                 max_idle_per_host=MAX_IDLE_PER_HOST):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_idle_per_host = max_idle_per_host
+        self.idle = {}
+        self.lock = threading.Lock()
+        self.ssl_context = ssl.create_default_context()
+        self.proxies = getproxies()
+        self.connections_opened = 0
+        self.connections_reused = 0
+
+    @staticmethod
+    def _read_timeout(timeout, end):
+        """Socket timeout for the next read: timeout, cut short by the budget's end"""
+        if end is None:
+            return timeout
+        remaining = end - time.monotonic()
+        if remaining <= 0:
+            raise BudgetExceeded("time budget exceeded")
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def _connect(self, key, timeout):
+        """An idle connection for key if there is one, else a new one; and whether it was reused"""
+        with self.lock:
+            idle = self.idle.get(key)
+            if idle:
+                conn = idle.pop()
+                self.connections_reused += 1
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+            self.connections_opened += 1
+
+        scheme, host, port = key
+        proxy = self._proxy(scheme, host)
+        if proxy is None:
+            connect_host, connect_port = host, port
+        else:
+            connect_host, connect_port = proxy.hostname, proxy.port or 80
+        if scheme == 'https':
+            conn = http.client.HTTPSConnection(connect_host, connect_port, timeout=timeout,
+                                               context=self.ssl_context)
+            if proxy is not None:
+                auth = proxy_auth(proxy)
+                conn.set_tunnel(host, port, headers={'Proxy-Authorization': auth} if auth else None)
+        else:
+            conn = http.client.HTTPConnection(connect_host, connect_port, timeout=timeout)
+        return conn, False
+
+    def _proxy(self, scheme, host):
+        """Split URL of the environment's proxy for scheme and host, or None to go direct"""
+        proxy = self.proxies.get(scheme)
+        if not proxy or proxy_bypass(host):
+            return None
+        return urlsplit(proxy if '://' in proxy else 'http://' + proxy)
+
+    def _release(self, key, conn, reusable):
+        """Return a connection to its host's idle list, or close it"""
+        if reusable:
+            with self.lock:
+                idle = self.idle.setdefault(key, [])
+                if len(idle) < self.max_idle_per_host:
+                    idle.append(conn)
+                    return
+        conn.close()
+
+    def _request_once(self, url, headers, timeout, end=None):
+        """
+        One GET over a pooled connection, without retries or redirects.
+
+        Returns (status, headers, body). A reused connection the server had
+        already closed is swapped for a fresh one transparently. With end (a
+        time.monotonic() value), the body is read in chunks and the request
+        raises BudgetExceeded once end passes, however slowly bytes arrive.
+        """
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ('http', 'https'):
+            raise HTTPClientError(f"unsupported URL scheme: {url}")
+        key = (scheme, parts.hostname, parts.port or (443 if scheme == 'https' else 80))
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        headers = dict(headers)
+        proxy = self._proxy(scheme, parts.hostname) if scheme == 'http' else None
+        if proxy is not None:
+            # A plain HTTP proxy is sent the whole URL
+            path = f"http://{parts.netloc}{path}"
+            auth = proxy_auth(proxy)
+            if auth:
+                headers['Proxy-Authorization'] = auth
+
+        while True:
+            conn, reused = self._connect(key, self._read_timeout(timeout, end))
+            try:
+                conn.request('GET', path, headers=headers)
+                # getresponse() detaches the socket from a connection that won't be kept
+                sock = conn.sock
+                response = conn.getresponse()
+                chunks = []
+                while True:
+                    sock.settimeout(self._read_timeout(timeout, end))
+                    chunk = response.read1(READ_CHUNK)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+                # read() marks a fully read response closed, freeing the connection for reuse
+                chunks.append(response.read())
+                body = b''.join(chunks)
+            except STALE_CONNECTION_ERRORS:
+                conn.close()
+                if reused:
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+
+            response_headers = {k.lower(): v for k, v in response.getheaders()}
+            self._release(key, conn, not response.will_close)
+            if 'content-encoding' in response_headers:
+                body = decode_body(body, response_headers.pop('content-encoding'))
+                response_headers.pop('content-length', None)
+            return response.status, response_headers, body
+
+    def get(self, url, headers=None, timeout=None, budget=None):
+        """
+        GET url, following redirects and retrying transient failures.
+
+        Returns (status, headers, body, final_url) for any HTTP response,
+        including error statuses once retries are used up; header names are
+        lowercased and the body is already decompressed. Raises
+        HTTPClientError when no response could be had.
+        timeout applies to each socket operation; budget, if given, caps the
+        whole call in seconds, redirects, retries and back-off included.
+        """
+        end = time.monotonic() + budget if budget is not None else None
+        headers = dict(headers or {})
+        headers.setdefault('Connection', 'keep-alive')
+        headers.setdefault('Accept-Encoding', 'gzip, deflate')
+        redirects = 0
+        attempt = 0
+
+        while True:
+            try:
+                status, response_headers, body = self._request_once(url, headers, timeout, end)
+            except BudgetExceeded as e:
+                raise HTTPClientError(f"time budget of {budget:g}s exceeded") from e
+            except (OSError, http.client.HTTPException) as e:
+                if attempt >= self.retries:
+                    raise HTTPClientError(str(e) or e.__class__.__name__) from e
+                self._sleep(backoff_delay(attempt, self.backoff), end, budget)
+                attempt += 1
+                continue
+
+            if status in REDIRECT_STATUSES and 'location' in response_headers:
+                redirects += 1
+                if redirects > MAX_REDIRECTS:
+                    raise HTTPClientError(f"more than {MAX_REDIRECTS} redirects")
+                url = urljoin(url, response_headers['location'])
+                continue
+
+            if status in RETRY_STATUSES and attempt < self.retries:
+                delay = retry_after(response_headers)
+                if delay is None:
+                    delay = backoff_delay(attempt, self.backoff)
+                if end is not None and time.monotonic() + delay >= end:
+                    # No time left to retry; the error response is the answer
+                    return status, response_headers, body, url
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            return status, response_headers, body, url
+
+    @staticmethod
+    def _sleep(delay, end, budget):
+        """Back off before a retry, unless that would run past the budget"""
+        if end is not None and time.monotonic() + delay >= end:
+            raise HTTPClientError(f"time budget of {budget:g}s exceeded")
+        time.sleep(delay)
+
+    def close(self):
+        """Close every idle connection"""
+        with self.lock:
+            for idle in self.idle.values():
+                for conn in idle:
+                    conn.close()
+            self.idle.clear()
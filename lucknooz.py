@@ -8,6 +8,7 @@ import random
 import json
 import os
 import re
+import sqlite3
 from datetime import datetime
 from collections import defaultdict
 
@@ -15,11 +16,11 @@ from collections import defaultdict
 class HeadlineSplitter:
     """Handles three-part headline splitting with prepositional phrase extraction"""
     
-    PREPOSITIONS = [
+    PREPOSITIONS = frozenset([
         'in', 'on', 'at', 'with', 'for', 'about', 'after', 'before',
         'during', 'from', 'to', 'over', 'under', 'between', 'among',
         'through', 'across', 'along', 'around', 'near', 'by', 'of'
-    ]
+    ])
     
     @staticmethod
     def split_three_parts(headline):
@@ -54,22 +55,31 @@ class HeadlineSplitter:
             return headlines
         
         split_headlines = [HeadlineSplitter.split_three_parts(h) for h in headlines]
+        subjects, connectors, contexts = (list(pool) for pool in zip(*split_headlines))
+        return HeadlineSplitter.remix_from_parts(subjects, connectors, contexts, count)
+    
+    @staticmethod
+    def remix_from_parts(subjects, connectors, contexts, count=10):
+        """
+        Generate remixes from part pools already split, indexed by headline
+        
+        Each remix takes its subject, connector and context from three
+        different headlines, so the cost per remix doesn't grow with the pools.
+        """
+        n = len(subjects)
         remixed = []
         
         for _ in range(count):
-            parts_pool = list(range(len(split_headlines)))
-            random.shuffle(parts_pool)
-            
-            if len(parts_pool) >= 3:
-                part1 = split_headlines[parts_pool[0]][0]
-                part2 = split_headlines[parts_pool[1]][1]
-                part3 = split_headlines[parts_pool[2]][2]
+            if n >= 3:
+                first, second, third = random.sample(range(n), 3)
+                part1 = subjects[first]
+                part2 = connectors[second]
+                part3 = contexts[third]
             else:
-                idx = random.choice(parts_pool)
-                parts = split_headlines[idx]
-                part1 = parts[0]
-                part2 = random.choice([p[1] for p in split_headlines])
-                part3 = random.choice([p[2] for p in split_headlines if p != parts])
+                idx = random.randrange(n)
+                part1 = subjects[idx]
+                part2 = connectors[random.randrange(n)]
+                part3 = contexts[1 - idx]
             
             remixed_headline = f"{part1} {part2} {part3}"
             remixed.append(remixed_headline)
@@ -77,8 +87,18 @@ class HeadlineSplitter:
         return remixed
 
 
+DEFAULT_DATA_FILE = 'lucknooz_data.sqlite3'
+LEGACY_DATA_FILE = 'lucknooz_data.json'
+
+
 class HeadlineDatabase:
-    """Manages headlines with voting and user submissions"""
+    """
+    Manages headlines with voting and user submissions, kept in a JSON file
+    
+    Everything is held in memory and the whole file is rewritten by
+    save_data. SQLiteHeadlineDatabase has the same methods and writes only
+    what changes.
+    """
     
     def __init__(self, filename='lucknooz_data.json'):
         self.filename = filename
@@ -86,8 +106,30 @@ class HeadlineDatabase:
         self.remixed_headlines = []
         self.votes = defaultdict(int)  # headline -> vote count
         self.user_submissions = []
+        self.splits = {}  # headline -> [subject, connector, context]
+        self.index_headlines()
         self.load_data()
     
+    def index_headlines(self):
+        """Rebuild the headline index and part pools from self.headlines"""
+        self.headline_index = {}
+        self.subjects = []
+        self.connectors = []
+        self.contexts = []
+        for headline in self.headlines:
+            self.index_headline(headline)
+    
+    def index_headline(self, headline):
+        """Split a headline once, if not already split, and add its parts to the pools"""
+        parts = self.splits.get(headline)
+        if parts is None:
+            parts = HeadlineSplitter.split_three_parts(headline)
+            self.splits[headline] = parts
+        self.headline_index[headline] = len(self.subjects)
+        self.subjects.append(parts[0])
+        self.connectors.append(parts[1])
+        self.contexts.append(parts[2])
+    
     def load_data(self):
         """Load all data from JSON file"""
         if os.path.exists(self.filename):
@@ -98,6 +140,9 @@ class HeadlineDatabase:
                     self.remixed_headlines = data.get('remixed', [])
                     self.votes = defaultdict(int, data.get('votes', {}))
                     self.user_submissions = data.get('user_submissions', [])
+                    # Files saved before splits were stored get split here, once
+                    self.splits = data.get('splits', {})
+                self.index_headlines()
                 print(f"✓ Loaded {len(self.headlines)} headlines, {len(self.remixed_headlines)} remixes")
             except Exception as e:
                 print(f"⚠ Error loading data: {e}")
@@ -109,6 +154,7 @@ class HeadlineDatabase:
             'remixed': self.remixed_headlines,
             'votes': dict(self.votes),
             'user_submissions': self.user_submissions,
+            'splits': {headline: self.splits[headline] for headline in self.headlines},
             'last_updated': datetime.now().isoformat()
         }
         
@@ -121,8 +167,9 @@ class HeadlineDatabase:
     
     def add_headline(self, headline, source='manual'):
         """Add a headline (original or user submission)"""
-        if headline not in self.headlines:
+        if headline not in self.headline_index:
             self.headlines.append(headline)
+            self.index_headline(headline)
             if source == 'user':
                 self.user_submissions.append({
                     'headline': headline,
@@ -131,10 +178,48 @@ class HeadlineDatabase:
             return True
         return False
     
+    def remix(self, count=10):
+        """Three-part remixes from the pre-split part pools"""
+        if len(self.headlines) < 2:
+            return list(self.headlines)
+        return HeadlineSplitter.remix_from_parts(self.subjects, self.connectors,
+                                                 self.contexts, count)
+    
+    def headline_count(self):
+        return len(self.headlines)
+    
+    def iter_headlines(self):
+        """(headline, is user submission) pairs in the order they were added"""
+        submitted = {s['headline'] for s in self.user_submissions}
+        for headline in self.headlines:
+            yield headline, headline in submitted
+    
+    def submission_count(self):
+        return len(self.user_submissions)
+    
+    def recent_submissions(self, n=3):
+        """The last n user submissions, oldest first"""
+        return self.user_submissions[-n:]
+    
+    def add_remixes(self, remixes):
+        """Remember generated remixes, skipping ones already kept"""
+        for remix in remixes:
+            if remix not in self.remixed_headlines:
+                self.remixed_headlines.append(remix)
+    
+    def remix_count(self):
+        return len(self.remixed_headlines)
+    
     def vote(self, headline, value=1):
         """Vote on a remixed headline"""
         self.votes[headline] += value
     
+    def votes_for(self, headline):
+        return self.votes.get(headline, 0)
+    
+    def total_votes(self):
+        return sum(self.votes.values())
+    
     def get_top_remixes(self, n=10):
         """Get top voted remixes"""
         sorted_remixes = sorted(
@@ -145,11 +230,230 @@ class HeadlineDatabase:
         return sorted_remixes[:n]
 
 
+class PartColumn:
+    """
+    One part (subject, connector or context) of every stored headline, as a
+    read-only sequence that fetches rows on demand
+    
+    Headline ids run 1..n in insertion order and rows are never deleted
+    (SQLiteHeadlineDatabase checks this when it opens), so index i is the
+    row with id i + 1.
+    """
+    
+    def __init__(self, conn, column, size):
+        self.conn = conn
+        self.column = column
+        self.size = size
+    
+    def __len__(self):
+        return self.size
+    
+    def __getitem__(self, index):
+        if not 0 <= index < self.size:
+            raise IndexError(index)
+        return self.conn.execute(
+            f"SELECT {self.column} FROM headlines WHERE id = ?", (index + 1,)
+        ).fetchone()[0]
+
+
+class SQLiteHeadlineDatabase:
+    """
+    Manages headlines with voting and user submissions, kept in SQLite
+    
+    Same methods as HeadlineDatabase, but nothing is loaded at startup and
+    each change writes and commits only its own rows, so neither opening
+    nor saving grows with the library. Headlines are stored already split.
+    """
+    
+    def __init__(self, filename=DEFAULT_DATA_FILE):
+        self.filename = filename
+        self.conn = sqlite3.connect(filename)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS headlines (
+                id INTEGER PRIMARY KEY,
+                headline TEXT NOT NULL UNIQUE,
+                subject TEXT NOT NULL,
+                connector TEXT NOT NULL,
+                context TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS submissions (
+                id INTEGER PRIMARY KEY,
+                headline_id INTEGER NOT NULL REFERENCES headlines (id),
+                timestamp TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS submissions_headline_id ON submissions (headline_id);
+            CREATE TABLE IF NOT EXISTS remixes (
+                id INTEGER PRIMARY KEY,
+                headline TEXT NOT NULL UNIQUE
+            );
+            CREATE TABLE IF NOT EXISTS votes (
+                headline TEXT PRIMARY KEY,
+                count INTEGER NOT NULL
+            );
+        """)
+        self.conn.commit()
+        self.check_headline_ids()
+    
+    def check_headline_ids(self):
+        """
+        Make sure headline ids are exactly 1..n.
+        
+        headline_count and PartColumn rely on it; only editing the file by
+        hand (deleting rows, inserting with explicit ids) can break it.
+        """
+        count, low, high = self.conn.execute(
+            "SELECT COUNT(*), MIN(id), MAX(id) FROM headlines"
+        ).fetchone()
+        if count and (low != 1 or high != count):
+            raise ValueError(f"{self.filename}: headline ids must run 1..{count} "
+                             f"without gaps, found {low}..{high}")
+    
+    def is_empty(self):
+        return self.conn.execute("SELECT 1 FROM headlines LIMIT 1").fetchone() is None
+    
+    def import_json(self, filename=LEGACY_DATA_FILE):
+        """One-shot migration of a HeadlineDatabase JSON file, in one transaction"""
+        old = HeadlineDatabase(filename)
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO headlines (headline, subject, connector, context) "
+                "VALUES (?, ?, ?, ?)",
+                [(headline, *old.splits[headline]) for headline in old.headlines]
+            )
+            self.conn.executemany(
+                "INSERT INTO submissions (headline_id, timestamp) "
+                "SELECT id, ? FROM headlines WHERE headline = ?",
+                [(s.get('timestamp', ''), s['headline']) for s in old.user_submissions]
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO remixes (headline) VALUES (?)",
+                [(remix,) for remix in old.remixed_headlines]
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO votes (headline, count) VALUES (?, ?)",
+                list(old.votes.items())
+            )
+        print(f"✓ Migrated {len(old.headlines)} headlines, {len(old.remixed_headlines)} "
+              f"remixes from {filename} to {self.filename}")
+    
+    def save_data(self):
+        """Every change is already committed; kept for the same interface"""
+        self.conn.commit()
+        print(f"✓ Saved to {self.filename}")
+    
+    def add_headline(self, headline, source='manual'):
+        """Add a headline (original or user submission)"""
+        parts = HeadlineSplitter.split_three_parts(headline)
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT OR IGNORE INTO headlines (headline, subject, connector, context) "
+                "VALUES (?, ?, ?, ?)",
+                (headline, *parts)
+            )
+            if not cursor.rowcount:
+                return False
+            if source == 'user':
+                self.conn.execute(
+                    "INSERT INTO submissions (headline_id, timestamp) VALUES (?, ?)",
+                    (cursor.lastrowid, datetime.now().isoformat())
+                )
+        return True
+    
+    def headline_count(self):
+        # Ids run 1..n (see check_headline_ids), and MAX reads one index entry
+        return self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM headlines").fetchone()[0]
+    
+    def iter_headlines(self):
+        """(headline, is user submission) pairs in the order they were added"""
+        rows = self.conn.execute(
+            "SELECT headline, EXISTS (SELECT 1 FROM submissions WHERE headline_id = headlines.id) "
+            "FROM headlines ORDER BY id"
+        )
+        for headline, submitted in rows:
+            yield headline, bool(submitted)
+    
+    def submission_count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM submissions").fetchone()[0]
+    
+    def recent_submissions(self, n=3):
+        """The last n user submissions, oldest first"""
+        rows = self.conn.execute(
+            "SELECT headlines.headline, submissions.timestamp FROM submissions "
+            "JOIN headlines ON headlines.id = submissions.headline_id "
+            "ORDER BY submissions.id DESC LIMIT ?",
+            (n,)
+        ).fetchall()
+        return [{'headline': headline, 'timestamp': timestamp}
+                for headline, timestamp in reversed(rows)]
+    
+    def remix(self, count=10):
+        """Three-part remixes, reading only the rows the sampled parts come from"""
+        n = self.headline_count()
+        if n < 2:
+            return [headline for headline, _ in self.iter_headlines()]
+        return HeadlineSplitter.remix_from_parts(PartColumn(self.conn, 'subject', n),
+                                                 PartColumn(self.conn, 'connector', n),
+                                                 PartColumn(self.conn, 'context', n), count)
+    
+    def add_remixes(self, remixes):
+        """Remember generated remixes, skipping ones already kept"""
+        with self.conn:
+            self.conn.executemany("INSERT OR IGNORE INTO remixes (headline) VALUES (?)",
+                                  [(remix,) for remix in remixes])
+    
+    def remix_count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM remixes").fetchone()[0]
+    
+    def vote(self, headline, value=1):
+        """Vote on a remixed headline"""
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO votes (headline, count) VALUES (?, ?) "
+                "ON CONFLICT (headline) DO UPDATE SET count = count + excluded.count",
+                (headline, value)
+            )
+    
+    def votes_for(self, headline):
+        row = self.conn.execute("SELECT count FROM votes WHERE headline = ?",
+                                (headline,)).fetchone()
+        return row[0] if row else 0
+    
+    def total_votes(self):
+        return self.conn.execute("SELECT COALESCE(SUM(count), 0) FROM votes").fetchone()[0]
+    
+    def get_top_remixes(self, n=10):
+        """Get top voted remixes"""
+        rows = self.conn.execute(
+            "SELECT remixes.headline FROM remixes "
+            "LEFT JOIN votes ON votes.headline = remixes.headline "
+            "ORDER BY COALESCE(votes.count, 0) DESC, remixes.id LIMIT ?",
+            (n,)
+        )
+        return [headline for headline, in rows]
+    
+    def close(self):
+        self.conn.close()
+
+
+def open_database(filename=DEFAULT_DATA_FILE, legacy_file=LEGACY_DATA_FILE):
+    """
+    The headline database in filename: JSON for a .json file, else SQLite.
+    
+    A new SQLite database is filled from legacy_file first, if that exists.
+    """
+    if filename.endswith('.json'):
+        return HeadlineDatabase(filename)
+    db = SQLiteHeadlineDatabase(filename)
+    if db.is_empty() and legacy_file and os.path.exists(legacy_file):
+        db.import_json(legacy_file)
+    return db
+
+
 class LuckNoozApp:
     """Main application controller"""
     
-    def __init__(self):
-        self.db = HeadlineDatabase()
+    def __init__(self, db=None):
+        self.db = db if db is not None else open_database()
         self.current_remixes = []
     
     def add_headline_interactive(self):
@@ -180,20 +484,20 @@ class LuckNoozApp:
     def view_headlines(self):
         """Display all headlines"""
         print("\n" + "="*70)
-        print(f"HEADLINE LIBRARY ({len(self.db.headlines)} total)")
+        print(f"HEADLINE LIBRARY ({self.db.headline_count()} total)")
         print("="*70)
         
-        if not self.db.headlines:
+        if not self.db.headline_count():
             print("\n⚠ No headlines yet! Add some first.")
             return
         
-        for i, headline in enumerate(self.db.headlines, 1):
-            marker = "👤" if any(s['headline'] == headline for s in self.db.user_submissions) else "📰"
+        for i, (headline, submitted) in enumerate(self.db.iter_headlines(), 1):
+            marker = "👤" if submitted else "📰"
             print(f"{i}. {marker} {headline}")
     
     def remix_and_vote(self):
         """Generate remixes and allow voting"""
-        if len(self.db.headlines) < 2:
+        if self.db.headline_count() < 2:
             print("\n⚠ Need at least 2 headlines to remix!")
             return
         
@@ -202,17 +506,15 @@ class LuckNoozApp:
         print("="*70)
         
         # Generate new remixes
-        self.current_remixes = HeadlineSplitter.remix_three_parts(self.db.headlines, count=10)
+        self.current_remixes = self.db.remix(count=10)
         
         # Add to database
-        for remix in self.current_remixes:
-            if remix not in self.db.remixed_headlines:
-                self.db.remixed_headlines.append(remix)
+        self.db.add_remixes(self.current_remixes)
         
         # Display with voting
         print()
         for i, headline in enumerate(self.current_remixes, 1):
-            votes = self.db.votes.get(headline, 0)
+            votes = self.db.votes_for(headline)
             vote_display = f"[{votes:+d}]" if votes != 0 else "[ 0]"
             print(f"{i}. {vote_display} {headline}")
         
@@ -252,7 +554,7 @@ class LuckNoozApp:
         
         print()
         for i, headline in enumerate(top, 1):
-            votes = self.db.votes.get(headline, 0)
+            votes = self.db.votes_for(headline)
             print(f"{i}. [{votes:+d}] {headline}")
     
     def show_stats(self):
@@ -261,20 +563,21 @@ class LuckNoozApp:
         print("📊 LUCKNOOZ STATISTICS")
         print("="*70)
         
-        print(f"\n📰 Total headlines: {len(self.db.headlines)}")
-        print(f"👤 User submissions: {len(self.db.user_submissions)}")
-        print(f"🎲 Total remixes generated: {len(self.db.remixed_headlines)}")
-        print(f"🗳️  Total votes cast: {sum(self.db.votes.values())}")
+        print(f"\n📰 Total headlines: {self.db.headline_count()}")
+        print(f"👤 User submissions: {self.db.submission_count()}")
+        print(f"🎲 Total remixes generated: {self.db.remix_count()}")
+        print(f"🗳️  Total votes cast: {self.db.total_votes()}")
         
-        if self.db.votes:
-            top_headline = max(self.db.remixed_headlines, key=lambda h: self.db.votes.get(h, 0))
-            top_votes = self.db.votes.get(top_headline, 0)
+        top = self.db.get_top_remixes(1)
+        if self.db.total_votes() and top:
+            top_headline = top[0]
+            top_votes = self.db.votes_for(top_headline)
             print(f"\n🏆 Top remix ({top_votes:+d} votes):")
             print(f"   {top_headline}")
         
-        if self.db.user_submissions:
+        if self.db.submission_count():
             print(f"\n👤 Recent user submissions:")
-            for submission in self.db.user_submissions[-3:]:
+            for submission in self.db.recent_submissions(3):
                 print(f"   • {submission['headline']}")
     
     def run(self):
@@ -1,478 +1,31 @@
-<<<<<<< HEAD
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>LuckNooz V13</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-</head>
-<body class="min-h-screen bg-gradient-to-br from-purple-50 to-blue-50 p-8">
-    <div class="max-w-6xl mx-auto">
-        <div class="text-center mb-8">
-            <h1 class="text-4xl font-bold text-gray-800 mb-2">LuckNooz V13</h1>
-            <p class="text-gray-600">Simplified First-Verb Detection</p>
-        </div>
-
-        <div class="bg-white rounded-lg shadow-lg p-6 mb-6">
-            <button id="generateBtn" onclick="generateHeadlines()" class="w-full bg-blue-600 hover:bg-blue-700 text-white font-bold py-3 px-6 rounded-lg transition-colors">
-                Generate New Headlines
-            </button>
-            <button id="fetchBtn" onclick="fetchLiveHeadlines()" class="w-full bg-green-600 hover:bg-green-700 text-white font-bold py-3 px-6 rounded-lg transition-colors mt-3">
-                Try Fetching Live Headlines
-            </button>
-        </div>
-
-        <div id="status" class="text-center text-gray-600 mb-4"></div>
-        <div id="headlines" class="space-y-4"></div>
-    </div>
-
-    <script>
-        // Sample headlines to use if feed fetching fails
-        const sampleHeadlines = [
-            "Scientists discover new species in Amazon rainforest",
-            "Stock market reaches record high amid economic optimism",
-            "City council approves funding for new public library",
-            "Athletes prepare for upcoming championship game",
-            "Tech company announces breakthrough in AI research",
-            "Local restaurant wins prestigious culinary award",
-            "Weather forecasters predict severe storms this weekend",
-            "University researchers develop new cancer treatment",
-            "Mayor unveils plan to reduce traffic congestion",
-            "Art museum opens exhibition featuring local artists",
-            "Schools implement new digital learning platform",
-            "Community volunteers clean up neighborhood park",
-            "Musicians perform at sold-out concert venue",
-            "Business leaders discuss strategies for growth",
-            "Astronomers observe rare celestial event tonight",
-            "Activists rally for environmental protection measures",
-            "Hospital staff celebrates life-saving medical advances",
-            "Filmmakers premiere documentary about climate change",
-            "Engineers design innovative solution for clean water",
-            "Authors gather at annual book festival downtown",
-            "Teams compete in regional robotics competition",
-            "Voters head to polls for important referendum",
-            "Chefs create menu inspired by seasonal ingredients",
-            "Dancers rehearse for upcoming performance",
-            "Historians uncover ancient artifacts at excavation site",
-            "Entrepreneurs launch startup focused on sustainability",
-            "Players celebrate victory in championship match",
-            "Scientists warn about rising sea levels",
-            "Teachers adopt new methods for student engagement",
-            "Residents protest proposed development project"
-        ];
-
-        const commonVerbs = new Set([
-            'is', 'are', 'was', 'were', 'be', 'been', 'being',
-            'has', 'have', 'had', 'having',
-            'says', 'said', 'say', 'saying',
-            'gets', 'got', 'get', 'getting',
-            'makes', 'made', 'make', 'making',
-            'takes', 'took', 'take', 'taking',
-            'comes', 'came', 'come', 'coming',
-            'goes', 'went', 'go', 'going',
-            'wants', 'wanted', 'want', 'wanting',
-            'gives', 'gave', 'give', 'giving',
-            'finds', 'found', 'find', 'finding',
-            'tells', 'told', 'tell', 'telling',
-            'asks', 'asked', 'ask', 'asking',
-            'works', 'worked', 'work', 'working',
-            'seems', 'seemed', 'seem', 'seeming',
-            'feels', 'felt', 'feel', 'feeling',
-            'tries', 'tried', 'try', 'trying',
-            'leaves', 'left', 'leave', 'leaving',
-            'calls', 'called', 'call', 'calling',
-            'announces', 'announced', 'announce', 'announcing',
-            'wins', 'won', 'win', 'winning',
-            'loses', 'lost', 'lose', 'losing',
-            'reveals', 'revealed', 'reveal', 'revealing',
-            'shows', 'showed', 'shown', 'show', 'showing',
-            'faces', 'faced', 'face', 'facing',
-            'reaches', 'reached', 'reach', 'reaching',
-            'breaks', 'broke', 'broken', 'break', 'breaking',
-            'plans', 'planned', 'plan', 'planning',
-            'launches', 'launched', 'launch', 'launching',
-            'opens', 'opened', 'open', 'opening',
-            'closes', 'closed', 'close', 'closing',
-            'begins', 'began', 'begun', 'begin', 'beginning',
-            'ends', 'ended', 'end', 'ending',
-            'continues', 'continued', 'continue', 'continuing',
-            'becomes', 'became', 'become', 'becoming',
-            'remains', 'remained', 'remain', 'remaining',
-            'appears', 'appeared', 'appear', 'appearing',
-            'leads', 'led', 'lead', 'leading',
-            'follows', 'followed', 'follow', 'following',
-            'brings', 'brought', 'bring', 'bringing',
-            'keeps', 'kept', 'keep', 'keeping',
-            'holds', 'held', 'hold', 'holding',
-            'turns', 'turned', 'turn', 'turning',
-            'starts', 'started', 'start', 'starting',
-            'stops', 'stopped', 'stop', 'stopping',
-            'helps', 'helped', 'help', 'helping',
-            'moves', 'moved', 'move', 'moving',
-            'plays', 'played', 'play', 'playing',
-            'runs', 'ran', 'run', 'running',
-            'stands', 'stood', 'stand', 'standing',
-            'falls', 'fell', 'fallen', 'fall', 'falling',
-            'rises', 'rose', 'risen', 'rise', 'rising',
-            'sets', 'set', 'setting',
-            'meets', 'met', 'meet', 'meeting',
-            'includes', 'included', 'include', 'including',
-            'suggests', 'suggested', 'suggest', 'suggesting',
-            'considers', 'considered', 'consider', 'considering',
-            'reports', 'reported', 'report', 'reporting',
-            'claims', 'claimed', 'claim', 'claiming',
-            'argues', 'argued', 'argue', 'arguing',
-            'believes', 'believed', 'believe', 'believing',
-            'thinks', 'thought', 'think', 'thinking',
-            'knows', 'knew', 'known', 'know', 'knowing',
-            'sees', 'saw', 'seen', 'see', 'seeing',
-            'looks', 'looked', 'look', 'looking',
-            'sounds', 'sounded', 'sound', 'sounding',
-            'means', 'meant', 'mean', 'meaning',
-            'offers', 'offered', 'offer', 'offering',
-            'provides', 'provided', 'provide', 'providing',
-            'serves', 'served', 'serve', 'serving',
-            'uses', 'used', 'use', 'using',
-            'needs', 'needed', 'need', 'needing',
-            'requires', 'required', 'require', 'requiring',
-            'expects', 'expected', 'expect', 'expecting',
-            'hopes', 'hoped', 'hope', 'hoping',
-            'wishes', 'wished', 'wish', 'wishing',
-            'decides', 'decided', 'decide', 'deciding',
-            'chooses', 'chose', 'chosen', 'choose', 'choosing',
-            'picks', 'picked', 'pick', 'picking',
-            'selects', 'selected', 'select', 'selecting',
-            'votes', 'voted', 'vote', 'voting',
-            'elects', 'elected', 'elect', 'electing',
-            'defeats', 'defeated', 'defeat', 'defeating',
-            'beats', 'beat', 'beaten', 'beating',
-            'scores', 'scored', 'score', 'scoring',
-            'ties', 'tied', 'tie', 'tying',
-            'fails', 'failed', 'fail', 'failing',
-            'passes', 'passed', 'pass', 'passing',
-            'joins', 'joined', 'join', 'joining',
-            'quits', 'quit', 'quitting',
-            'resigns', 'resigned', 'resign', 'resigning',
-            'retires', 'retired', 'retire', 'retiring',
-            'dies', 'died', 'die', 'dying',
-            'kills', 'killed', 'kill', 'killing',
-            'saves', 'saved', 'save', 'saving',
-            'protects', 'protected', 'protect', 'protecting',
-            'attacks', 'attacked', 'attack', 'attacking',
-            'defends', 'defended', 'defend', 'defending',
-            'fights', 'fought', 'fight', 'fighting',
-            'struggles', 'struggled', 'struggle', 'struggling',
-            'suffers', 'suffered', 'suffer', 'suffering',
-            'enjoys', 'enjoyed', 'enjoy', 'enjoying',
-            'loves', 'loved', 'love', 'loving',
-            'hates', 'hated', 'hate', 'hating',
-            'fears', 'feared', 'fear', 'fearing',
-            'worries', 'worried', 'worry', 'worrying',
-            'cares', 'cared', 'care', 'caring',
-            'matters', 'mattered', 'matter', 'mattering',
-            'changes', 'changed', 'change', 'changing',
-            'grows', 'grew', 'grown', 'grow', 'growing',
-            'develops', 'developed', 'develop', 'developing',
-            'improves', 'improved', 'improve', 'improving',
-            'increases', 'increased', 'increase', 'increasing',
-            'decreases', 'decreased', 'decrease', 'decreasing',
-            'reduces', 'reduced', 'reduce', 'reducing',
-            'cuts', 'cut', 'cutting',
-            'adds', 'added', 'add', 'adding',
-            'removes', 'removed', 'remove', 'removing',
-            'creates', 'created', 'create', 'creating',
-            'builds', 'built', 'build', 'building',
-            'destroys', 'destroyed', 'destroy', 'destroying',
-            'damages', 'damaged', 'damage', 'damaging',
-            'fixes', 'fixed', 'fix', 'fixing',
-            'repairs', 'repaired', 'repair', 'repairing',
-            'replaces', 'replaced', 'replace', 'replacing',
-            'discover', 'discovers', 'discovered', 'discovering',
-            'predict', 'predicts', 'predicted', 'predicting',
-            'approve', 'approves', 'approved', 'approving',
-            'prepare', 'prepares', 'prepared', 'preparing',
-            'unveil', 'unveils', 'unveiled', 'unveiling',
-            'implement', 'implements', 'implemented', 'implementing',
-            'clean', 'cleans', 'cleaned', 'cleaning',
-            'perform', 'performs', 'performed', 'performing',
-            'discuss', 'discusses', 'discussed', 'discussing',
-            'observe', 'observes', 'observed', 'observing',
-            'rally', 'rallies', 'rallied', 'rallying',
-            'celebrate', 'celebrates', 'celebrated', 'celebrating',
-            'premiere', 'premieres', 'premiered', 'premiering',
-            'design', 'designs', 'designed', 'designing',
-            'gather', 'gathers', 'gathered', 'gathering',
-            'compete', 'competes', 'competed', 'competing',
-            'head', 'heads', 'headed', 'heading',
-            'rehearse', 'rehearses', 'rehearsed', 'rehearsing',
-            'uncover', 'uncovers', 'uncovered', 'uncovering',
-            'warn', 'warns', 'warned', 'warning',
-            'adopt', 'adopts', 'adopted', 'adopting',
-            'protest', 'protests', 'protested', 'protesting'
-        ]);
-
-        const skipWords = new Set([
-            'the', 'a', 'an', 'this', 'that', 'these', 'those',
-            'will', 'would', 'should', 'could', 'might', 'may', 'must', 'can',
-            'to', 'for', 'of', 'in', 'on', 'at', 'by', 'with', 'from', 'about', 'as'
-        ]);
-
-        const neverVerbs = new Set([
-            'news', 'report', 'update', 'story', 'article', 'poll', 'data',
-            'study', 'research', 'analysis', 'review', 'survey'
-        ]);
-
-        function findFirstVerb(headline) {
-            const words = headline.split(' ');
-            
-            for (let i = 1; i < words.length; i++) {
-                const word = words[i];
-                const wordLower = word.toLowerCase().replace(/[^a-z]/g, '');
-                const prevWord = i > 0 ? words[i - 1].toLowerCase() : '';
-                
-                if (!wordLower) continue;
-                if (skipWords.has(wordLower)) continue;
-                if (neverVerbs.has(wordLower)) continue;
-                if (skipWords.has(prevWord)) continue;
-                if (word === word.toUpperCase() && word.length > 1) continue;
-                
-                if (commonVerbs.has(wordLower)) {
-                    const subject = words.slice(0, i).join(' ');
-                    const predicate = words.slice(i).join(' ');
-                    return { subject, predicate, verb: word };
-                }
-                
-                if ((wordLower.endsWith('ed') || wordLower.endsWith('ing')) && wordLower.length >= 5) {
-                    const subject = words.slice(0, i).join(' ');
-                    const predicate = words.slice(i).join(' ');
-                    return { subject, predicate, verb: word };
-                }
-            }
-            
-            return null;
-        }
-
-        function conjugateVerb(verb, subjectIsPlural) {
-            const verbLower = verb.toLowerCase();
-            
-            if (verbLower === 'is' || verbLower === 'are') {
-                return subjectIsPlural ? 'are' : 'is';
-            }
-            if (verbLower === 'was' || verbLower === 'were') {
-                return subjectIsPlural ? 'were' : 'was';
-            }
-            
-            if (verbLower.endsWith('ed') || verbLower.endsWith('ing')) {
-                return verb;
-            }
-            
-            if (subjectIsPlural) {
-                if (verbLower.endsWith('es')) {
-                    return verb.slice(0, -2);
-                }
-                if (verbLower.endsWith('s') && !verbLower.endsWith('ss')) {
-                    return verb.slice(0, -1);
-                }
-                return verb;
-            }
-            
-            if (!subjectIsPlural) {
-                if (!verbLower.endsWith('s')) {
-                    if (verbLower.endsWith('ch') || verbLower.endsWith('sh') || 
-                        verbLower.endsWith('x') || verbLower.endsWith('z') ||
-                        verbLower.endsWith('o')) {
-                        return verb + 'es';
-                    }
-                    if (verbLower.endsWith('y') && verbLower.length > 1 && !'aeiou'.includes(verbLower[verbLower.length - 2])) {
-                        return verb.slice(0, -1) + 'ies';
-                    }
-                    return verb + 's';
-                }
-            }
-            
-            return verb;
-        }
-
-        function isPlural(subject) {
-            const subjectLower = subject.toLowerCase().trim();
-            
-            if (subjectLower.includes(' and ')) return true;
-            if (subjectLower.startsWith('several ')) return true;
-            if (subjectLower.startsWith('many ')) return true;
-            if (subjectLower.startsWith('both ')) return true;
-            if (subjectLower.startsWith('all ')) return true;
-            if (subjectLower.startsWith('some ')) return true;
-            if (subjectLower.startsWith('most ')) return true;
-            if (subjectLower.startsWith('few ')) return true;
-            
-            const words = subject.split(' ');
-            const lastWord = words[words.length - 1].toLowerCase().replace(/[^a-z]/g, '');
-            
-            if (lastWord.endsWith('s') && !lastWord.endsWith('ss') && lastWord.length > 3) {
-                return true;
-            }
-            
-            return false;
-        }
-
-        function shuffle(array) {
-            const newArray = [...array];
-            for (let i = newArray.length - 1; i > 0; i--) {
-                const j = Math.floor(Math.random() * (i + 1));
-                [newArray[i], newArray[j]] = [newArray[j], newArray[i]];
-            }
-            return newArray;
-        }
-
-        function remixHeadlines(headlines) {
-            const subjects = headlines.map(h => h.subject);
-            const predicates = shuffle(headlines.map(h => h.predicate));
-            
-            return subjects.slice(0, 20).map((subject, i) => {
-                const predicate = predicates[i];
-                
-                const verbMatch = predicate.match(/^(\S+)/);
-                if (verbMatch) {
-                    const verb = verbMatch[1];
-                    const subjectIsPlural = isPlural(subject);
-                    const conjugatedVerb = conjugateVerb(verb, subjectIsPlural);
-                    const newPredicate = predicate.replace(/^(\S+)/, conjugatedVerb);
-                    
-                    return `${subject} ${newPredicate}`;
-                }
-                
-                return `${subject} ${predicate}`;
-            });
-        }
-
-        function displayHeadlines(headlines) {
-            const container = document.getElementById('headlines');
-            container.innerHTML = headlines.map(headline => 
-                `<div class="bg-gray-50 p-4 rounded-lg border-l-4 border-blue-500">
-                    <p class="text-lg text-gray-800">${headline}</p>
-                </div>`
-            ).join('');
-        }
-
-        function generateHeadlines() {
-            const status = document.getElementById('status');
-            
-            status.textContent = '🔄 Parsing sample headlines...';
-            status.className = 'text-center text-blue-600 mb-4 font-semibold';
-            
-            const parsed = sampleHeadlines
-                .map(findFirstVerb)
-                .filter(h => h !== null);
-            
-            if (parsed.length === 0) {
-                status.textContent = '❌ Error parsing headlines';
-                status.className = 'text-center text-red-600 mb-4';
-                return;
-            }
-            
-            const remixed = remixHeadlines(parsed);
-            displayHeadlines(remixed);
-            
-            status.textContent = `✨ Generated ${remixed.length} LuckNooz headlines from sample data`;
-            status.className = 'text-center text-green-600 mb-4 font-semibold';
-        }
-
-        async function fetchLiveHeadlines() {
-            const status = document.getElementById('status');
-            const button = document.getElementById('fetchBtn');
-            
-            button.disabled = true;
-            button.classList.add('opacity-50', 'cursor-not-allowed');
-            status.textContent = '🔄 Fetching live headlines from RSS feeds...';
-            status.className = 'text-center text-blue-600 mb-4 font-semibold';
-            
-            const feeds = [
-                'https://feeds.bbci.co.uk/news/world/rss.xml',
-                'https://rss.nytimes.com/services/xml/rss/nyt/World.xml',
-                'https://feeds.npr.org/1001/rss.xml',
-                'https://www.theguardian.com/world/rss',
-                'https://www.espn.com/espn/rss/news'
-            ];
-            
-            const allHeadlines = [];
-            
-            try {
-                for (const feed of feeds) {
-                    try {
-                        const response = await fetch(`https://api.rss2json.com/v1/api.json?rss_url=${encodeURIComponent(feed)}`);
-                        const data = await response.json();
-                        
-                        if (data.items) {
-                            data.items.forEach(item => {
-                                const parsed = findFirstVerb(item.title);
-                                if (parsed) {
-                                    allHeadlines.push(parsed);
-                                }
-                            });
-                        }
-                    } catch (error) {
-                        console.error('Error fetching feed:', feed, error);
-                    }
-                }
-                
-                if (allHeadlines.length === 0) {
-                    status.textContent = '⚠️ Could not fetch live headlines. Using sample data instead.';
-                    status.className = 'text-center text-yellow-600 mb-4';
-                    generateHeadlines();
-                } else {
-                    const remixed = remixHeadlines(allHeadlines);
-                    displayHeadlines(remixed);
-                    status.textContent = `✨ Generated ${remixed.length} LuckNooz headlines from live feeds!`;
-                    status.className = 'text-center text-green-600 mb-4 font-semibold';
-                }
-            } catch (error) {
-                console.error('Error:', error);
-                status.textContent = '⚠️ Error fetching live headlines. Using sample data.';
-                status.className = 'text-center text-yellow-600 mb-4';
-                generateHeadlines();
-            } finally {
-                button.disabled = false;
-                button.classList.remove('opacity-50', 'cursor-not-allowed');
-            }
-        }
-
-        window.onload = generateHeadlines;
-    </script>
-</body>
-</html>
-
-
-=======
 #!/usr/bin/env python3
 """
 LuckNooz V13.9 - Gerund Filtering Added
 Skips gerunds (VBG) acting as nouns, not verbs
 """
 
-import feedparser
+import argparse
+from collections import deque
 import json
-import random
 from datetime import datetime
-import spacy
-import subprocess
 import sys
-
-# Download spaCy model if not present
-try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    print("Downloading spaCy English model...")
-    subprocess.check_call([sys.executable, "-m", "spacy", "download", "en_core_web_sm"])
-    nlp = spacy.load("en_core_web_sm")
-
-# Import LemmInflect and add to spaCy pipeline
-try:
-    import lemminflect
-except ImportError:
-    print("Installing lemminflect...")
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "lemminflect"])
-    import lemminflect
+import time
+
+from bulk_remix import V13_COMPATIBILITY, RemixCorpus, compatible, use_bulk, v13_features
+from feed_fetcher import (DEFAULT_CONCURRENCY, DEFAULT_DEADLINE, DEFAULT_TIMEOUT,
+                          add_fetch_arguments, parse_feed)
+from feed_stores import RunStores, add_store_arguments, poll_feeds
+from near_duplicates import DEFAULT_THRESHOLD, NearDuplicateIndex
+from nlp_profiles import NLPEngine, NLPUnavailableError
+from pair_sampling import derangement_pairs
+from parse_cache import fingerprint, normalize_headline
+from pipeline import PairingPool, run_stages
+from remix_pool import keep_latest, top_up
+from seen_entries import entry_key
+
+# spaCy pipeline, loaded on first parse with only the components find_first_verb
+# and is_plural read (no NER, no lemmatizer). LemmInflect must be installed too.
+nlp = NLPEngine('lucknooz_v13', requires=('lemminflect',))
 
 # RSS Feeds to scrape with display names
 # 6 feeds with cleanest headline structure
@@ -484,6 +37,7 @@ FEEDS = [
     {'url': 'https://www.aljazeera.com/xml/rss/all.xml', 'name': 'Al Jazeera'},
     {'url': 'http://rss.cnn.com/rss/edition.rss', 'name': 'CNN'}
 ]
+FEED_NAMES = {f['url']: f['name'] for f in FEEDS}
 
 # Question words that indicate headlines to skip
 QUESTION_WORDS = {'why', 'what', 'when', 'where', 'who', 'how', 'which', 'whose'}
@@ -495,14 +49,23 @@ NEVER_VERBS = {
     'wins', 'calls', 'wounded', 'targeted', 'attached'
 }
 
+# Headlines per nlp.pipe batch when parsing fetched feeds
+PARSE_BATCH_SIZE = 64
 
-def find_first_verb(headline):
-    """Find the first verb using spaCy structure + LemmInflect verification."""
+# Subject verb tag standing in for each tense when building conjugation tables
+TENSE_TAGS = {'present': 'VBZ', 'past': 'VBD', 'gerund': 'VBG'}
+
+# Bump when find_first_verb's behaviour changes in a way its source doesn't show
+PARSER_VERSION = '13.9'
+
+
+def is_skippable_headline(headline):
+    """Cheap text checks that reject a headline before it reaches spaCy."""
     
     # Skip question headlines
     first_word = headline.split()[0] if headline.split() else ''
     if first_word.lower().rstrip(',:;?!') in QUESTION_WORDS:
-        return None
+        return True
     
     words = headline.split()
     
@@ -511,7 +74,16 @@ def find_first_verb(headline):
         last_word_lower = words[-1].lower().rstrip(',.!?;:')
         common_ending_verbs = {'say', 'says', 'said', 'attached', 'included', 'reported'}
         if last_word_lower in common_ending_verbs:
-            return None
+            return True
+    
+    return False
+
+
+def find_first_verb(headline):
+    """Find the first verb using spaCy structure + LemmInflect verification."""
+    
+    if is_skippable_headline(headline):
+        return None
     
     # Process with spaCy
     try:
@@ -520,6 +92,12 @@ def find_first_verb(headline):
         print(f"Error processing headline: {headline[:50]}... - {e}")
         return None
     
+    return find_first_verb_in_doc(doc)
+
+
+def find_first_verb_in_doc(doc):
+    """Apply the first-verb rules to a headline that spaCy has already parsed."""
+    
     # Prepositions that often follow adjectival participles or precede gerunds
     prep_indicators = {'with', 'by', 'in', 'for', 'of', 'from', 'to', 'at', 'on', 'over', 'after', 'about', 'without', 'before', 'through', 'during'}
     
@@ -575,257 +153,7 @@ def find_first_verb(headline):
                     # Check 4: Following possessive (e.g., "his running")
                     if i > 0:
                         prev_token = doc[i - 1]
-                        if prev_token.tag_ in ['PRP
-
-
-def is_plural(subject):
-    """Determine if a subject is plural using spaCy."""
-    try:
-        doc = nlp(subject)
-        
-        # Find the root noun (usually the last significant noun)
-        root_noun = None
-        for token in reversed(doc):
-            if token.pos_ in ["NOUN", "PROPN"]:
-                root_noun = token
-                break
-        
-        if root_noun:
-            # Check if it's tagged as plural
-            if root_noun.tag_ in ["NNS", "NNPS"]:
-                return True
-            # Check for compound subjects with "and"
-            if " and " in subject.lower():
-                return True
-    except:
-        pass
-    
-    # Fallback: check for plural indicators
-    subject_lower = subject.lower().strip()
-    plural_indicators = ['several', 'many', 'both', 'all', 'some', 'most', 'few', 'these', 'those']
-    for indicator in plural_indicators:
-        if subject_lower.startswith(indicator + ' '):
-            return True
-    
-    return False
-
-
-def conjugate_verb(predicate_verb, predicate_verb_lemma, predicate_verb_tag, 
-                   subject_verb_tag, new_subject_is_plural):
-    """
-    Conjugate predicate verb to match subject verb's tense and new subject's number.
-    
-    Args:
-        predicate_verb: The original predicate verb word
-        predicate_verb_lemma: Lemma of predicate verb
-        predicate_verb_tag: Original tag of predicate verb
-        subject_verb_tag: Tag of the subject verb (to match tense)
-        new_subject_is_plural: Whether the new subject is plural
-    
-    Returns:
-        Conjugated verb matching subject tense and new subject number
-    """
-    from lemminflect import getInflection
-    
-    # Map verb tags to tense categories
-    # VB = base form, VBD = past, VBG = gerund, VBN = past participle
-    # VBP = present non-3rd, VBZ = present 3rd singular
-    
-    # Determine target tense from SUBJECT verb
-    target_tense = None
-    
-    if subject_verb_tag in ['VBD', 'VBN']:
-        # Subject is past tense → predicate should be past tense
-        target_tense = 'past'
-    elif subject_verb_tag in ['VBZ', 'VBP', 'VB']:
-        # Subject is present tense → predicate should be present tense
-        target_tense = 'present'
-    elif subject_verb_tag == 'VBG':
-        # Subject is gerund → keep predicate as gerund
-        target_tense = 'gerund'
-    else:
-        # Default to present
-        target_tense = 'present'
-    
-    # Special handling for "to be"
-    if predicate_verb_lemma in ['be', 'is', 'are', 'was', 'were', 'am']:
-        if target_tense == 'past':
-            return 'were' if new_subject_is_plural else 'was'
-        elif target_tense == 'present':
-            return 'are' if new_subject_is_plural else 'is'
-    
-    # Determine target tag based on tense and number
-    target_tag = None
-    
-    if target_tense == 'past':
-        # Past tense (same for singular and plural)
-        target_tag = 'VBD'
-    elif target_tense == 'gerund':
-        # Keep as gerund
-        return predicate_verb
-    elif target_tense == 'present':
-        # Present tense - adjust for number
-        if new_subject_is_plural:
-            target_tag = 'VBP'  # Present non-3rd person (base form for plural)
-        else:
-            target_tag = 'VBZ'  # Present 3rd person singular
-    
-    # Use LemmInflect to get the correct conjugation
-    if target_tag:
-        inflections = getInflection(predicate_verb_lemma, tag=target_tag)
-        if inflections and len(inflections) > 0:
-            return inflections[0]
-    
-    # Fallback: return original verb
-    return predicate_verb
-
-
-def fetch_headlines():
-    """Fetch headlines from RSS feeds with source tracking."""
-    all_headlines = []
-    
-    for feed_info in FEEDS:
-        feed_url = feed_info['url']
-        feed_name = feed_info['name']
-        
-        try:
-            print(f"Fetching {feed_name}...")
-            feed = feedparser.parse(feed_url)
-            
-            for entry in feed.entries:
-                title = entry.get('title', '').strip()
-                link = entry.get('link', '')
-                
-                if title:
-                    parsed = find_first_verb(title)
-                    if parsed:
-                        parsed['original_headline'] = title
-                        parsed['source'] = feed_name
-                        parsed['link'] = link
-                        all_headlines.append(parsed)
-        except Exception as e:
-            print(f"Error fetching {feed_name}: {e}")
-    
-    return all_headlines
-
-
-def remix_headlines(headlines, count=50):
-    """Create remixed headlines by swapping subjects and predicates."""
-    if len(headlines) < 2:
-        return []
-    
-    subjects = headlines.copy()
-    predicates = headlines.copy()
-    random.shuffle(predicates)
-    
-    # Ensure no headline is paired with itself
-    for i in range(len(subjects)):
-        if i < len(predicates) and subjects[i]['original_headline'] == predicates[i]['original_headline']:
-            # Swap with next one (or previous if at end)
-            swap_idx = (i + 1) if i < len(predicates) - 1 else (i - 1)
-            if swap_idx >= 0 and swap_idx < len(predicates):
-                predicates[i], predicates[swap_idx] = predicates[swap_idx], predicates[i]
-    
-    remixed = []
-    
-    for i in range(min(count, len(subjects))):
-        subject_obj = subjects[i]
-        predicate_obj = predicates[i]
-        
-        # Double-check we didn't pair with self
-        if subject_obj['original_headline'] == predicate_obj['original_headline']:
-            continue
-        
-        subject = subject_obj['subject']
-        predicate = predicate_obj['predicate']
-        
-        # Get subject verb info (for tense matching)
-        subject_verb_tag = subject_obj['verb_tag']
-        
-        # Get predicate verb info
-        predicate_verb = predicate_obj['verb']
-        predicate_verb_lemma = predicate_obj['verb_lemma']
-        predicate_verb_tag = predicate_obj['verb_tag']
-        
-        # Determine if new subject is plural
-        new_subject_is_plural = is_plural(subject)
-        
-        # Conjugate predicate verb to match SUBJECT VERB TENSE and NEW SUBJECT NUMBER
-        conjugated_verb = conjugate_verb(
-            predicate_verb, 
-            predicate_verb_lemma, 
-            predicate_verb_tag,
-            subject_verb_tag,  # NEW: Pass subject verb tag for tense matching
-            new_subject_is_plural
-        )
-        
-        # Replace first word of predicate (the verb) with conjugated version
-        pred_words = predicate.split()
-        if pred_words:
-            new_predicate = ' '.join([conjugated_verb] + pred_words[1:])
-            remixed_headline = f"{subject} {new_predicate}"
-        else:
-            remixed_headline = f"{subject} {predicate}"
-        
-        remixed.append({
-            'headline': remixed_headline,
-            'subject_source': {
-                'original': subject_obj['original_headline'],
-                'source': subject_obj['source'],
-                'link': subject_obj['link']
-            },
-            'predicate_source': {
-                'original': predicate_obj['original_headline'],
-                'source': predicate_obj['source'],
-                'link': predicate_obj['link']
-            }
-        })
-    
-    return remixed
-
-
-def main():
-    """Main function to fetch, process, and save headlines."""
-    print("LuckNooz V13.9 - Gerund Filtering Added")
-    print("=" * 50)
-    
-    # Fetch headlines
-    print("\nFetching headlines from RSS feeds...")
-    headlines = fetch_headlines()
-    print(f"Found {len(headlines)} parseable headlines")
-    
-    if len(headlines) < 2:
-        print("Not enough headlines found. Exiting.")
-        return
-    
-    # Create remixed headlines
-    print("\nRemixing headlines...")
-    remixed = remix_headlines(headlines, count=50)
-    
-    # Prepare output
-    output = {
-        'generated_at': datetime.now().isoformat(),
-        'version': '13.9',
-        'count': len(remixed),
-        'headlines': remixed
-    }
-    
-    # Save to JSON
-    output_file = 'lucknooz-headlines.json'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
-    
-    print(f"\nSaved {len(remixed)} remixed headlines to {output_file}")
-    
-    # Print sample
-    print("\nSample headlines:")
-    for i, item in enumerate(remixed[:10], 1):
-        print(f"{i}. {item['headline']}")
-
-
-if __name__ == '__main__':
-    main()
-, 'POS']:  # Possessive pronouns/markers
+                        if prev_token.tag_ in ['PRP$', 'POS']:  # Possessive pronouns/markers
                             # Pattern like "his giving", "country's opening" - gerund as noun
                             continue
                 
@@ -876,25 +204,91 @@ if __name__ == '__main__':
                 subject = " ".join([t.text for t in subject_tokens])
                 predicate = " ".join([t.text for t in predicate_tokens])
                 
+                # Features of this headline that remixing needs, worked out
+                # now so that pairing headlines never has to call spaCy
                 return {
                     'subject': subject,
                     'predicate': predicate,
                     'verb': word,
                     'verb_lemma': lemmas[0],
-                    'verb_tag': token.tag_
+                    'verb_tag': token.tag_,
+                    'subject_is_plural': is_plural_tokens(subject_tokens, subject),
+                    'tense': tense_for_tag(token.tag_),
+                    'conjugations': conjugation_table(word, lemmas[0], token.tag_),
+                    'predicate_tail': ' '.join(predicate.split()[1:])
                 }
     
     return None
 
 
+def find_first_verbs(headlines, batch_size=PARSE_BATCH_SIZE, cache=None):
+    """
+    Batch version of find_first_verb.
+    
+    Headlines that survive the cheap text checks are streamed through
+    nlp.pipe in batches of batch_size, and the first-verb rules run on
+    the returned Docs. With a ParseCache, previously parsed headlines
+    (accepted or rejected) are answered from the cache and only new ones
+    reach spaCy. Returns one result (or None) per input headline.
+    """
+    results = [None] * len(headlines)
+    pending = [i for i, headline in enumerate(headlines) if not is_skippable_headline(headline)]
+    
+    if cache is not None:
+        cached = cache.get_many([headlines[i] for i in pending])
+        misses = []
+        for i in pending:
+            key = normalize_headline(headlines[i])
+            if key in cached:
+                results[i] = cached[key]
+            else:
+                misses.append(i)
+        pending = misses
+    
+    done = 0
+    try:
+        docs = nlp.pipe((headlines[i] for i in pending), batch_size=batch_size)
+        for i, doc in zip(pending, docs):
+            results[i] = find_first_verb_in_doc(doc)
+            done += 1
+    except Exception as e:
+        # Fall back to one-at-a-time parsing for whatever the batch didn't reach
+        print(f"Error in batch parse, falling back to single parses: {e}")
+        for i in pending[done:]:
+            results[i] = find_first_verb(headlines[i])
+    
+    if cache is not None:
+        # Repeated titles share one cached dict; give each its own copy to annotate
+        cache.put_many((headlines[i], results[i]) for i in pending)
+        results = [dict(r) if r else r for r in results]
+    
+    return results
+
+
+def parser_fingerprint():
+    """Fingerprint of the parse rules and model, used to invalidate the parse cache."""
+    return fingerprint(
+        PARSER_VERSION, is_skippable_headline, find_first_verb_in_doc,
+        is_plural_tokens, tense_for_tag, conjugate_verb, conjugation_table, QUESTION_WORDS, NEVER_VERBS, nlp.meta.get('name'), nlp.meta.get('version')
+    )
+
+
 def is_plural(subject):
     """Determine if a subject is plural using spaCy."""
     try:
         doc = nlp(subject)
-        
+    except:
+        doc = []
+    
+    return is_plural_tokens(doc, subject)
+
+
+def is_plural_tokens(tokens, subject):
+    """is_plural's rules applied to subject tokens spaCy has already tagged."""
+    try:
         # Find the root noun (usually the last significant noun)
         root_noun = None
-        for token in reversed(doc):
+        for token in reversed(tokens):
             if token.pos_ in ["NOUN", "PROPN"]:
                 root_noun = token
                 break
@@ -919,6 +313,21 @@ def is_plural(subject):
     return False
 
 
+def tense_for_tag(verb_tag):
+    """Map a verb tag to the tense category remixes are conjugated into."""
+    # VB = base form, VBD = past, VBG = gerund, VBN = past participle
+    # VBP = present non-3rd, VBZ = present 3rd singular
+    if verb_tag in ['VBD', 'VBN']:
+        return 'past'
+    elif verb_tag in ['VBZ', 'VBP', 'VB']:
+        return 'present'
+    elif verb_tag == 'VBG':
+        return 'gerund'
+    
+    # Default to present
+    return 'present'
+
+
 def conjugate_verb(predicate_verb, predicate_verb_lemma, predicate_verb_tag, 
                    subject_verb_tag, new_subject_is_plural):
     """
@@ -936,25 +345,8 @@ def conjugate_verb(predicate_verb, predicate_verb_lemma, predicate_verb_tag,
     """
     from lemminflect import getInflection
     
-    # Map verb tags to tense categories
-    # VB = base form, VBD = past, VBG = gerund, VBN = past participle
-    # VBP = present non-3rd, VBZ = present 3rd singular
-    
     # Determine target tense from SUBJECT verb
-    target_tense = None
-    
-    if subject_verb_tag in ['VBD', 'VBN']:
-        # Subject is past tense → predicate should be past tense
-        target_tense = 'past'
-    elif subject_verb_tag in ['VBZ', 'VBP', 'VB']:
-        # Subject is present tense → predicate should be present tense
-        target_tense = 'present'
-    elif subject_verb_tag == 'VBG':
-        # Subject is gerund → keep predicate as gerund
-        target_tense = 'gerund'
-    else:
-        # Default to present
-        target_tense = 'present'
+    target_tense = tense_for_tag(subject_verb_tag)
     
     # Special handling for "to be"
     if predicate_verb_lemma in ['be', 'is', 'are', 'was', 'were', 'am']:
@@ -989,142 +381,471 @@ def conjugate_verb(predicate_verb, predicate_verb_lemma, predicate_verb_tag,
     return predicate_verb
 
 
-def fetch_headlines():
-    """Fetch headlines from RSS feeds with source tracking."""
-    all_headlines = []
-    
-    for feed_info in FEEDS:
-        feed_url = feed_info['url']
-        feed_name = feed_info['name']
-        
-        try:
-            print(f"Fetching {feed_name}...")
-            feed = feedparser.parse(feed_url)
-            
-            for entry in feed.entries:
-                title = entry.get('title', '').strip()
-                link = entry.get('link', '')
-                
-                if title:
-                    parsed = find_first_verb(title)
-                    if parsed:
-                        parsed['original_headline'] = title
-                        parsed['source'] = feed_name
-                        parsed['link'] = link
-                        all_headlines.append(parsed)
-        except Exception as e:
-            print(f"Error fetching {feed_name}: {e}")
-    
-    return all_headlines
+def conjugation_key(tense, subject_is_plural):
+    """Key into a predicate's conjugation table for a subject's tense and number."""
+    if tense == 'gerund':
+        return 'gerund'
+    return f"{tense}_{'plural' if subject_is_plural else 'singular'}"
 
 
-def remix_headlines(headlines, count=50):
-    """Create remixed headlines by swapping subjects and predicates."""
-    if len(headlines) < 2:
-        return []
+def conjugation_table(verb, verb_lemma, verb_tag):
+    """Every form conjugate_verb can give one predicate verb, keyed by conjugation_key."""
+    table = {}
+    for tense, subject_verb_tag in TENSE_TAGS.items():
+        for subject_is_plural in (False, True):
+            table[conjugation_key(tense, subject_is_plural)] = conjugate_verb(
+                verb, verb_lemma, verb_tag, subject_verb_tag, subject_is_plural
+            )
+    return table
+
+
+def remix_headline_text(subject_obj, predicate_obj):
+    """Join one headline's subject to another's predicate, conjugated to fit."""
+    subject = subject_obj['subject']
     
-    subjects = headlines.copy()
-    predicates = headlines.copy()
-    random.shuffle(predicates)
+    # Determine if new subject is plural (precomputed at parse time)
+    new_subject_is_plural = subject_obj.get('subject_is_plural')
+    if new_subject_is_plural is None:
+        new_subject_is_plural = is_plural(subject)
     
-    # Ensure no headline is paired with itself
-    for i in range(len(subjects)):
-        if i < len(predicates) and subjects[i]['original_headline'] == predicates[i]['original_headline']:
-            # Swap with next one (or previous if at end)
-            swap_idx = (i + 1) if i < len(predicates) - 1 else (i - 1)
-            if swap_idx >= 0 and swap_idx < len(predicates):
-                predicates[i], predicates[swap_idx] = predicates[swap_idx], predicates[i]
+    conjugations = predicate_obj.get('conjugations')
+    if conjugations:
+        # Table lookup: match SUBJECT VERB TENSE and NEW SUBJECT NUMBER
+        key = conjugation_key(tense_for_tag(subject_obj['verb_tag']), new_subject_is_plural)
+        conjugated_verb = conjugations[key]
+        tail = predicate_obj['predicate_tail']
+    else:
+        # Records parsed before conjugation tables existed
+        conjugated_verb = conjugate_verb(
+            predicate_obj['verb'],
+            predicate_obj['verb_lemma'],
+            predicate_obj['verb_tag'],
+            subject_obj['verb_tag'],
+            new_subject_is_plural
+        )
+        tail = ' '.join(predicate_obj['predicate'].split()[1:])
     
-    remixed = []
+    # Replace first word of predicate (the verb) with conjugated version
+    if tail:
+        return f"{subject} {conjugated_verb} {tail}"
+    return f"{subject} {conjugated_verb}"
+
+
+class FeedIngest:
+    """
+    Turns fetch results into parsed headlines
+    
+    Used by both the batch and streaming paths, so every feed goes through
+    the same steps however it is consumed. read() takes one feed's result
+    as soon as it arrives; parse() then parses the new entries of one or
+    more read feeds in a single nlp.pipe pass. With a FeedState, a feed
+    that answered 304 Not Modified (or wasn't due) reuses the headlines
+    parsed from it last time, and each parsed feed's validators and
+    headlines are stored for next run. With a SeenEntries index, only
+    entries new since earlier runs are parsed; the rest come back from the
+    index. With a FeedScheduler, every result is recorded for the polling
+    schedule. Titles that retell a story already in hand (near-duplicates
+    at dedupe_threshold, None to keep them all) are dropped, new ones
+    before parsing.
+    """
     
-    for i in range(min(count, len(subjects))):
-        subject_obj = subjects[i]
-        predicate_obj = predicates[i]
+    def __init__(self, batch_size=PARSE_BATCH_SIZE, cache=None, state=None, seen=None,
+                 scheduler=None, dedupe_threshold=DEFAULT_THRESHOLD):
+        self.batch_size = batch_size
+        self.cache = cache
+        self.state = state
+        self.seen = seen
+        self.scheduler = scheduler
+        self.duplicates = None
+        if dedupe_threshold is not None:
+            self.duplicates = NearDuplicateIndex(dedupe_threshold)
+        self.stored = None
+        self.live = set()
+        self.reused = 0
+        self.collapsed = 0
+    
+    def seed(self, urls):
+        """
+        Match new titles against every feed's stored headlines too
         
-        # Double-check we didn't pair with self
-        if subject_obj['original_headline'] == predicate_obj['original_headline']:
-            continue
+        For streaming, where the copy of a story kept on an earlier run may
+        belong to a feed that hasn't arrived yet when another feed's copy does.
+        """
+        if self.duplicates is None or self.state is None:
+            return
+        self.stored = NearDuplicateIndex(self.duplicates.threshold)
+        for url in urls:
+            for headline in self.state.items(url) or ():
+                self.stored.add(self.stored.signature(headline['original_headline']))
+    
+    def admit(self, title, new=False):
+        """Whether title tells a story not yet in hand; if so, it now is"""
+        if self.duplicates is None:
+            return True
+        signature = self.duplicates.signature(title)
+        if (self.duplicates.matches(signature)
+                or (new and self.stored is not None and self.stored.matches(signature))):
+            self.collapsed += 1
+            return False
+        self.duplicates.add(signature)
+        return True
+    
+    def read(self, result):
+        """
+        One feed's fetch result, read but not yet parsed, or None if it failed
         
-        subject = subject_obj['subject']
-        predicate = predicate_obj['predicate']
+        Returned as a dict of the feed's url and name, the headlines it
+        already has in hand, its entries still to parse, and the result to
+        store validators from (None for a feed that wasn't downloaded).
+        """
+        feed_url = result['url']
+        feed_name = FEED_NAMES.get(feed_url, feed_url)
         
-        # Get subject verb info (for tense matching)
-        subject_verb_tag = subject_obj['verb_tag']
+        if result['error']:
+            print(f"Error fetching {feed_name}: {result['error']}")
+            if self.scheduler is not None:
+                self.scheduler.record(result)
+            return None
         
-        # Get predicate verb info
-        predicate_verb = predicate_obj['verb']
-        predicate_verb_lemma = predicate_obj['verb_lemma']
-        predicate_verb_tag = predicate_obj['verb_tag']
+        if result['not_modified']:
+            reused = (self.state.items(feed_url) if self.state is not None else None) or []
+            reason = "not due" if result.get('skipped') else "not modified"
+            print(f"{feed_name} {reason}, reusing {len(reused)} parsed headlines")
+            if self.scheduler is not None:
+                self.scheduler.record(result)
+            return {'url': feed_url, 'name': feed_name, 'headlines': reused,
+                    'entries': [], 'result': None}
         
-        # Determine if new subject is plural
-        new_subject_is_plural = is_plural(subject)
+        try:
+            feed = parse_feed(result)
+        except Exception as e:
+            print(f"Error fetching {feed_name}: {e}")
+            return None
+        print(f"Fetched {feed_name}: {len(feed.entries)} entries in {result['elapsed']:.1f}s")
+        if self.scheduler is not None:
+            self.scheduler.record(result, [entry_key(entry) for entry in feed.entries])
         
-        # Conjugate predicate verb to match SUBJECT VERB TENSE and NEW SUBJECT NUMBER
-        conjugated_verb = conjugate_verb(
-            predicate_verb, 
-            predicate_verb_lemma, 
-            predicate_verb_tag,
-            subject_verb_tag,  # NEW: Pass subject verb tag for tense matching
-            new_subject_is_plural
-        )
+        entries = []
+        for entry in feed.entries:
+            title = entry.get('title', '').strip()
+            if title:
+                entries.append({'title': title, 'link': entry.get('link', ''),
+                                'key': entry_key(entry)})
         
-        # Replace first word of predicate (the verb) with conjugated version
-        pred_words = predicate.split()
-        if pred_words:
-            new_predicate = ' '.join([conjugated_verb] + pred_words[1:])
-            remixed_headline = f"{subject} {new_predicate}"
-        else:
-            remixed_headline = f"{subject} {predicate}"
+        # Entries ingested on an earlier run come back from the index unparsed
+        headlines = []
+        if self.seen is not None:
+            known, new = self.seen.lookup(feed_url, [(e['key'], e['title']) for e in entries])
+            headlines = [record for record in known.values() if record]
+            self.reused += len(known)
+            new_keys = {key for key, title in new}
+            entries = [e for e in entries if e['key'] in new_keys]
         
-        remixed.append({
-            'headline': remixed_headline,
-            'subject_source': {
-                'original': subject_obj['original_headline'],
-                'source': subject_obj['source'],
-                'link': subject_obj['link']
-            },
-            'predicate_source': {
-                'original': predicate_obj['original_headline'],
-                'source': predicate_obj['source'],
-                'link': predicate_obj['link']
-            }
-        })
+        return {'url': feed_url, 'name': feed_name, 'headlines': headlines,
+                'entries': entries, 'result': result}
     
-    return remixed
+    def parse(self, feeds):
+        """Parse the new entries of feeds from read() together; returns every feed's headlines"""
+        feeds = [feed for feed in feeds if feed is not None]
+        
+        # Every feed's headlines in hand are indexed before any new title is
+        # checked, in feed order, so which copy of a story is kept doesn't
+        # depend on which feed arrived first. Known copies of one story are
+        # only dropped from the output; each feed still stores all of its own.
+        output = {feed['url']: [h for h in feed['headlines'] if self.admit(h['original_headline'])]
+                  for feed in feeds}
+        
+        # The same story from several feeds is parsed once, as its first copy.
+        # Dropped copies stay out of the seen index, so they are checked again
+        # next run and parsed then if the kept copy was rejected.
+        for feed in feeds:
+            feed['entries'] = [e for e in feed['entries'] if self.admit(e['title'], new=True)]
+        
+        pending = [(feed, entry) for feed in feeds for entry in feed['entries']]
+        if pending:
+            print(f"Parsing {len(pending)} titles (batch size {self.batch_size})...")
+        results = find_first_verbs([entry['title'] for feed, entry in pending],
+                                   batch_size=self.batch_size, cache=self.cache)
+        
+        new_items = {feed['url']: [] for feed in feeds}
+        for (feed, entry), parsed in zip(pending, results):
+            if parsed:
+                parsed['original_headline'] = entry['title']
+                parsed['source'] = feed['name']
+                parsed['link'] = entry['link']
+                feed['headlines'].append(parsed)
+                output[feed['url']].append(parsed)
+            new_items[feed['url']].append((entry['key'], entry['title'], parsed))
+        
+        for feed in feeds:
+            # Only a body that parsed gets its validators stored, so a 304
+            # never stands in for a feed whose headlines were never read
+            if feed['result'] is None:
+                continue
+            if self.seen is not None:
+                self.seen.record(feed['url'], new_items[feed['url']])
+            if self.state is not None:
+                self.state.update(feed['url'], feed['result']['headers'], feed['headlines'])
+        
+        headlines = [headline for feed in feeds for headline in output[feed['url']]]
+        self.live.update(headline['original_headline'] for headline in headlines)
+        return headlines
+    
+    def stage(self, results):
+        """Pipeline stage: fetch results in, parsed headlines out, one feed at a time"""
+        for result in results:
+            yield from self.parse([self.read(result)])
+    
+    def report(self):
+        if self.seen is not None:
+            print(f"Reused {self.reused} entries seen on earlier runs")
+        if self.duplicates is not None:
+            print(f"Collapsed {self.collapsed} near-duplicate titles")
+
+
+def fetch_headlines(batch_size=PARSE_BATCH_SIZE, cache=None, concurrency=DEFAULT_CONCURRENCY,
+                    timeout=DEFAULT_TIMEOUT, deadline=DEFAULT_DEADLINE, state=None,
+                    replay=None, snapshot=True, seen=None, scheduler=None, breaker=None,
+                    dedupe_threshold=DEFAULT_THRESHOLD):
+    """
+    Fetch headlines from RSS feeds with source tracking.
+    
+    Each feed is read through a FeedIngest as soon as it downloads, while
+    slower feeds are still on the way; once every feed is in, the new
+    titles from all of them are parsed in one batched pass. With a
+    FeedState, feeds are requested conditionally. With replay, feed bodies
+    come from a saved snapshot instead of the network. With a
+    FeedScheduler, only feeds that are due get polled. With a
+    CircuitBreaker, feeds that keep failing are skipped for a cool-down.
+    """
+    ingest = FeedIngest(batch_size, cache, state, seen, scheduler, dedupe_threshold)
+    
+    # Download every feed at once; a dead host only costs its own timeout
+    urls = [f['url'] for f in FEEDS]
+    print(f"Fetching {len(FEEDS)} feeds...")
+    results = poll_feeds(urls, 'lucknooz_v13', concurrency, timeout, deadline, state, replay,
+                         snapshot, scheduler, breaker)
+    feeds = {result['url']: ingest.read(result) for result in results}
+    headlines = ingest.parse([feeds.get(url) for url in urls])
+    ingest.report()
+    return headlines
 
 
-def main():
-    """Main function to fetch, process, and save headlines."""
-    print("LuckNooz V13.8 - Improved Past Participle Filtering")
-    print("=" * 50)
-    
-    # Fetch headlines
-    print("\nFetching headlines from RSS feeds...")
-    headlines = fetch_headlines()
-    print(f"Found {len(headlines)} parseable headlines")
+def remix_headlines(headlines, count=50, exclude=()):
+    """
+    Create remixed headlines by swapping subjects and predicates.
+    
+    Pairs come from chained random derangements: the first len(headlines)
+    remixes use every headline once as a subject and once as a predicate,
+    and asking for more keeps going with fresh derangements, never
+    repeating a pair or pairing a headline with itself. Pairs whose tenses
+    V13_COMPATIBILITY rules out are skipped on either path. Every remix's
+    text is unique, and none is in exclude (e.g. already pooled).
+    """
+    # The same title from two feeds counts once, so it can't pair with itself
+    unique = list({h['original_headline']: h for h in reversed(headlines)}.values())[::-1]
+    if len(unique) < 2:
+        return []
     
-    if len(headlines) < 2:
-        print("Not enough headlines found. Exiting.")
-        return
+    # Large corpora pick compatible pairs in bulk instead, with headroom for
+    # ones that turn out to repeat an earlier remix
+    if use_bulk(len(unique)):
+        corpus = RemixCorpus(unique, v13_features)
+        pairs = corpus.pairs(count * 2 + len(exclude), V13_COMPATIBILITY)
+    else:
+        pairs = derangement_pairs(len(unique))
     
-    # Create remixed headlines
-    print("\nRemixing headlines...")
-    remixed = remix_headlines(headlines, count=50)
+    remixed = []
+    seen_headlines = set(exclude)
+    for i, j in pairs:
+        if len(remixed) >= count:
+            break
+        if not compatible(V13_COMPATIBILITY, unique[i].get('tense'), unique[j].get('tense')):
+            continue
+        remix = make_remix(unique[i], unique[j])
+        # Different pairs can read the same, e.g. two headlines sharing a subject
+        if remix['headline'] in seen_headlines:
+            continue
+        seen_headlines.add(remix['headline'])
+        remixed.append(remix)
+    return remixed
+
+
+def make_remix(subject_obj, predicate_obj):
+    """Output record for one remix: its text and where each half came from."""
+    return {
+        'headline': remix_headline_text(subject_obj, predicate_obj),
+        'subject_source': {
+            'original': subject_obj['original_headline'],
+            'source': subject_obj['source'],
+            'link': subject_obj['link']
+        },
+        'predicate_source': {
+            'original': predicate_obj['original_headline'],
+            'source': predicate_obj['source'],
+            'link': predicate_obj['link']
+        }
+    }
+
+
+def pooled(remix):
+    """RemixPool entry for a remix: its text, the headlines it came from, and the record"""
+    return (remix['headline'],
+            (remix['subject_source']['original'], remix['predicate_source']['original']),
+            remix)
+
+
+def stream_remixes(pairs):
+    """Pipeline stage: (subject, predicate) headline pairs in, remix records out."""
+    for subject_obj, predicate_obj in pairs:
+        if compatible(V13_COMPATIBILITY, subject_obj.get('tense'), predicate_obj.get('tense')):
+            yield make_remix(subject_obj, predicate_obj)
+
+
+def stream_headlines(pairing, ingest, concurrency=DEFAULT_CONCURRENCY, timeout=DEFAULT_TIMEOUT,
+                     deadline=DEFAULT_DEADLINE, replay=None, snapshot=True, breaker=None):
+    """
+    Fetch, parse and remix as overlapping stages, yielding remixes as they are made.
     
-    # Prepare output
+    Each feed goes through ingest as soon as it downloads, and each parsed
+    headline is paired through pairing with ones parsed before it, so the
+    first remixes arrive while slower feeds are still downloading. Stages
+    are joined by bounded queues; stopping early stops every stage.
+    """
+    results = poll_feeds([f['url'] for f in FEEDS], 'lucknooz_v13', concurrency, timeout,
+                         deadline, ingest.state, replay, snapshot, ingest.scheduler, breaker)
+    ingest.seed([f['url'] for f in FEEDS])
+    return run_stages(results, ingest.stage, pairing.stage, stream_remixes)
+
+
+def run_stream(args, stores, count=50):
+    """--stream / --follow: print remixes as they are made and save the latest ones."""
+    pairing = PairingPool(key=lambda record: record['original_headline'])
+    # Without a remix pool (replays) only this process's latest remixes are kept
+    latest = deque(maxlen=count)
+    
+    while True:
+        print("\nStreaming headlines from RSS feeds...")
+        ingest = FeedIngest(args.batch_size, stores.cache, stores.state, stores.seen,
+                            stores.scheduler, None if args.keep_duplicates else DEFAULT_THRESHOLD)
+        stream = stream_headlines(pairing, ingest, concurrency=args.concurrency,
+                                  timeout=args.timeout, deadline=args.deadline,
+                                  replay=args.replay, snapshot=not args.no_snapshot,
+                                  breaker=stores.breaker)
+        emitted = stores.pool.headlines() if stores.pool is not None else set()
+        made = []
+        try:
+            for item in stream:
+                # Different pairs can read the same, or repeat a pooled remix
+                if item['headline'] in emitted:
+                    continue
+                emitted.add(item['headline'])
+                made.append(item)
+                print(f"{len(made)}. {item['headline']}")
+                if not args.follow and len(made) >= count:
+                    break
+        finally:
+            stream.close()
+        ingest.report()
+        
+        if stores.pool is not None:
+            remixed = keep_latest(stores.pool, ingest.live, [pooled(r) for r in made], count)
+        else:
+            latest.extend(made)
+            remixed = list(latest)
+        if remixed:
+            save_remixes(remixed)
+        if not args.follow:
+            return
+        print(f"{len(made)} new remixes from {len(pairing.records)} pooled headlines; "
+              f"polling again in {args.follow:g}s")
+        time.sleep(args.follow)
+
+
+def save_remixes(remixed, output_file='lucknooz-headlines.json'):
+    """Write remixes to the JSON file the site reads."""
     output = {
         'generated_at': datetime.now().isoformat(),
-        'version': '13.8',
+        'version': '13.9',
         'count': len(remixed),
         'headlines': remixed
     }
-    
-    # Save to JSON
-    output_file = 'lucknooz-headlines.json'
     with open(output_file, 'w', encoding='utf-8') as f:
         json.dump(output, f, indent=2, ensure_ascii=False)
-    
     print(f"\nSaved {len(remixed)} remixed headlines to {output_file}")
+
+
+def main():
+    """Main function to fetch, process, and save headlines."""
+    parser = argparse.ArgumentParser(description="LuckNooz V13 headline remixer")
+    parser.add_argument('--batch-size', type=int, default=PARSE_BATCH_SIZE,
+                        help="headlines per spaCy nlp.pipe batch")
+    parser.add_argument('--count', type=int, default=50,
+                        help="remixes to write; more than there are headlines is fine")
+    parser.add_argument('--stream', action='store_true',
+                        help="parse and remix each feed as it arrives, printing remixes "
+                             "as they are made")
+    parser.add_argument('--follow', type=float, metavar='SECONDS',
+                        help="keep streaming, re-polling every feed this often")
+    add_store_arguments(parser, seen=True)
+    add_fetch_arguments(parser)
+    args = parser.parse_args()
+    
+    # Fail before any network work if spaCy, the model or LemmInflect is missing
+    try:
+        nlp.load()
+    except NLPUnavailableError as e:
+        sys.exit(f"ERROR: {e}")
+    
+    print("LuckNooz V13.9 - Gerund Filtering Added")
+    print("=" * 50)
+    
+    stores = RunStores('lucknooz_v13', parser_fingerprint(), args, seen=True)
+    
+    if args.stream or args.follow:
+        try:
+            run_stream(args, stores, args.count)
+        except FileNotFoundError as e:
+            sys.exit(f"ERROR: {e}")
+        except KeyboardInterrupt:
+            print("\nStopped")
+        finally:
+            stores.close()
+        return
+    
+    # Fetch headlines
+    print("\nFetching headlines from RSS feeds...")
+    try:
+        headlines = fetch_headlines(batch_size=args.batch_size, cache=stores.cache,
+                                    concurrency=args.concurrency, timeout=args.timeout,
+                                    deadline=args.deadline, state=stores.state,
+                                    replay=args.replay, snapshot=not args.no_snapshot,
+                                    seen=stores.seen, scheduler=stores.scheduler,
+                                    breaker=stores.breaker,
+                                    dedupe_threshold=None if args.keep_duplicates else DEFAULT_THRESHOLD)
+        print(f"Found {len(headlines)} parseable headlines")
+        
+        if len(headlines) < 2:
+            print("Not enough headlines found. Exiting.")
+            return
+        
+        # Create remixed headlines
+        print("\nRemixing headlines...")
+        if stores.pool is None:
+            remixed = remix_headlines(headlines, count=args.count)
+        else:
+            # Remixes from earlier runs stay while their sources are in the
+            # feeds; only the shortfall is made fresh
+            remixed = top_up(
+                stores.pool, (h['original_headline'] for h in headlines), args.count,
+                lambda needed, exclude: [pooled(r) for r in remix_headlines(headlines, needed, exclude)]
+            )
+    except FileNotFoundError as e:
+        sys.exit(f"ERROR: {e}")
+    finally:
+        stores.close()
+    
+    save_remixes(remixed)
     
     # Print sample
     print("\nSample headlines:")
@@ -1134,4 +855,3 @@ def main():
 
 if __name__ == '__main__':
     main()
->>>>>>> 6ecb2b2192f59895e0c0a1e5d530bd07eb7f4da1
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+Mock feed server and end-to-end benchmark for LUCKNOOZ
+Serves recorded or synthetic RSS over local HTTP, with configurable latency,
+errors, 304s and feed sizes, and times each entry point's stages against it
+"""
+
+import argparse
+import contextlib
+import email.utils
+import http.server
+import importlib
+import io
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+from xml.sax.saxutils import escape
+
+DEFAULT_PORT = 8800
+DEFAULT_FEEDS = 12
+DEFAULT_ENTRIES = 40
+
+SUBJECTS = [
+    'The president', 'Local officials', 'Scientists', 'A new study', 'The central bank',
+    'Protesters', 'The company', 'Voters', 'Police', 'The prime minister', 'Researchers',
+    'Firefighters', 'The museum', 'Astronomers', 'Farmers', 'The city council',
+]
+VERBS = [
+    'announces', 'rejects', 'warns of', 'celebrates', 'unveils', 'delays', 'approves',
+    'investigates', 'discovered', 'criticised', 'launched', 'is considering',
+]
+OBJECTS = [
+    'new climate plan', 'record budget', 'controversial merger', 'rare comet',
+    'ban on plastic bags', 'overhaul of tax rules', 'emergency talks', 'lost manuscript',
+    'surprise election', 'high-speed rail link', 'deal with neighbours', 'heatwave response',
+]
+
+
+def synthetic_title(rng):
+    return f"{rng.choice(SUBJECTS)} {rng.choice(VERBS)} {rng.choice(OBJECTS)}"
+
+
+def synthetic_feed(index, version, entries=DEFAULT_ENTRIES, padding=0):
+    """
+    RSS 2.0 body for mock feed `index` at content `version`.
+
+    Each version adds one new entry at the top, so consecutive versions share
+    most entries as real feeds do. padding adds that many bytes of
+    description per entry, to mimic heavy feeds.
+    """
+    filler = escape('Lorem ipsum dolor sit amet. ' * (padding // 28 + 1))[:padding]
+    items = []
+    for n in range(version + entries - 1, version - 1, -1):
+        rng = random.Random(index * 1000003 + n)
+        title = escape(synthetic_title(rng))
+        link = f"https://mock.example/{index}/{n}"
+        items.append(f"<item><title>{title}</title><link>{link}</link>"
+                     f"<guid>{link}</guid><description>{filler}</description></item>")
+    return (f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+            f'<title>Mock Feed {index}</title><link>https://mock.example/{index}</link>'
+            + ''.join(items) + '</channel></rss>').encode('utf-8')
+
+
+def recorded_bodies(path):
+    """Every feed body saved in a snapshot zip, to serve as fixtures"""
+    with zipfile.ZipFile(path) as archive:
+        return [archive.read(name) for name in sorted(archive.namelist())
+                if name.startswith('feeds/')]
+
+
+class MockFeedServer:
+    """
+    Threaded local HTTP server for mock feeds at /feeds/<n>.xml
+
+    Synthetic feeds change with probability change_rate on each request and
+    answer If-None-Match with 304 while unchanged; recorded fixtures never
+    change. Each request waits latency plus up to jitter seconds, and fails
+    with HTTP 500 with probability error_rate. Feeds listed in dead always
+    fail. stats counts requests, responses and bytes served.
+    """
+
+    def __init__(self, feeds=DEFAULT_FEEDS, entries=DEFAULT_ENTRIES, padding=0,
+                 latency=0.0, jitter=0.0, error_rate=0.0, change_rate=0.0, dead=(),
+                 fixtures=None, port=0, seed=0):
+        self.fixtures = fixtures
+        self.count = len(fixtures) if fixtures else feeds
+        self.entries = entries
+        self.padding = padding
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.change_rate = change_rate
+        self.dead = set(dead)
+        self.rng = random.Random(seed)
+        self.versions = [0] * self.count
+        self.lock = threading.Lock()
+        self.stats = {'requests': 0, 'ok': 0, 'not_modified': 0, 'errors': 0, 'bytes': 0}
+        self.server = http.server.ThreadingHTTPServer(('127.0.0.1', port), self._handler())
+        self.server.daemon_threads = True
+        self.thread = None
+
+    @property
+    def urls(self):
+        host, port = self.server.server_address[:2]
+        return [f"http://{host}:{port}/feeds/{i}.xml" for i in range(self.count)]
+
+    def _respond(self, index, etag):
+        """(status, headers, body) for one request to feed index"""
+        with self.lock:
+            self.stats['requests'] += 1
+            if index in self.dead or self.rng.random() < self.error_rate:
+                self.stats['errors'] += 1
+                return 500, {}, b''
+            if not self.fixtures and self.rng.random() < self.change_rate:
+                self.versions[index] += 1
+            version = self.versions[index]
+
+        current = f'"mock-{index}-{version}"'
+        if etag == current:
+            with self.lock:
+                self.stats['not_modified'] += 1
+            return 304, {'ETag': current}, b''
+
+        if self.fixtures:
+            body = self.fixtures[index]
+        else:
+            body = synthetic_feed(index, version, self.entries, self.padding)
+        with self.lock:
+            self.stats['ok'] += 1
+            self.stats['bytes'] += len(body)
+        return 200, {'ETag': current, 'Content-Type': 'application/rss+xml',
+                     'Last-Modified': email.utils.formatdate(usegmt=True)}, body
+
+    def _handler(self):
+        mock = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                name = self.path.rsplit('/', 1)[-1]
+                try:
+                    index = int(name.split('.')[0])
+                    if not 0 <= index < mock.count:
+                        raise ValueError(name)
+                except ValueError:
+                    self.send_response(404)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                delay = mock.latency + (mock.rng.uniform(0, mock.jitter) if mock.jitter else 0)
+                if delay:
+                    time.sleep(delay)
+
+                status, headers, body = mock._respond(index, self.headers.get('If-None-Match'))
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                if status != 304:
+                    self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                if body:
+                    self.wfile.write(body)
+
+        return Handler
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class StageTimer:
+    """Accumulates wall time and calls for named stages"""
+
+    def __init__(self):
+        self.seconds = {}
+        self.calls = {}
+        self.items = {}
+
+    def wrap(self, stage, func, count=None):
+        """func, timed under stage; count(args) gives how many items a call handled"""
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.seconds[stage] = self.seconds.get(stage, 0.0) + time.perf_counter() - start
+                self.calls[stage] = self.calls.get(stage, 0) + 1
+                if count is not None:
+                    self.items[stage] = self.items.get(stage, 0) + count(args)
+        return timed
+
+
+# Entry point -> (stage name, function attribute, items-per-call counter) to time.
+# Feeds are parsed while others download, so time spent waiting on the
+# network shows up under 'other'.
+TARGETS = {
+    'lucknooz_v13': [
+        ('feed parse', 'parse_feed', lambda args: 1),
+        ('nlp parse', 'find_first_verbs', lambda args: len(args[0])),
+        ('remix', 'remix_headlines', None),
+        ('write', 'save_remixes', None),
+    ],
+    'generate_headlines': [
+        ('feed parse', 'parse_feed', lambda args: 1),
+        ('nlp parse', 'parse_titles', lambda args: len(args[0])),
+        ('remix', 'generate_combinations', None),
+        ('write', 'save_combinations', None),
+    ],
+}
+
+
+def point_at(module, name, urls):
+    """Swap an entry point's feed list for the mock server's"""
+    if name == 'lucknooz_v13':
+        module.FEEDS = [{'url': url, 'name': f"Mock {i}"} for i, url in enumerate(urls)]
+        module.FEED_NAMES = {f['url']: f['name'] for f in module.FEEDS}
+    else:
+        module.FEEDS = list(urls)
+
+
+def run_target(name, server, argv=(), verbose=False):
+    """
+    Run one entry point's main() against the mock server and time its stages.
+
+    Returns (total seconds, StageTimer, error message or None).
+    """
+    timer = StageTimer()
+    output = io.StringIO()
+    redirect = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(output)
+
+    with redirect:
+        try:
+            module = importlib.import_module(name)
+        except Exception as e:
+            # generate_headlines loads spaCy at import time
+            return 0.0, timer, f"cannot import {name}: {e}"
+
+    point_at(module, name, server.urls)
+    originals = {}
+    for stage, attr, count in TARGETS[name]:
+        originals[attr] = getattr(module, attr)
+        setattr(module, attr, timer.wrap(stage, originals[attr], count))
+
+    saved_argv = sys.argv
+    sys.argv = [name] + list(argv)
+    error = None
+    start = time.perf_counter()
+    try:
+        with redirect:
+            module.main()
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            error = str(e.code)
+    except Exception as e:
+        error = f"{e.__class__.__name__}: {e}"
+    finally:
+        total = time.perf_counter() - start
+        sys.argv = saved_argv
+        for attr, func in originals.items():
+            setattr(module, attr, func)
+    return total, timer, error
+
+
+def report(name, run, total, timer, server_stats):
+    print(f"\n{name} run {run}: {total:.2f}s total, {server_stats['requests']} requests "
+          f"({server_stats['ok']} ok, {server_stats['not_modified']} not modified, "
+          f"{server_stats['errors']} errors), {server_stats['bytes'] / 1024:.0f} KB served")
+    print(f"  {'Stage':<12} {'Seconds':>8} {'Calls':>6} {'Items':>6} {'Items/s':>8}")
+    for stage, _attr, _count in TARGETS[name]:
+        seconds = timer.seconds.get(stage, 0.0)
+        items = timer.items.get(stage)
+        rate = f"{items / seconds:>8.0f}" if items and seconds else f"{'-':>8}"
+        print(f"  {stage:<12} {seconds:>8.3f} {timer.calls.get(stage, 0):>6} "
+              f"{items if items is not None else '-':>6} {rate}")
+    timed = sum(timer.seconds.values())
+    print(f"  {'other':<12} {max(0.0, total - timed):>8.3f}")
+
+
+def server_from_args(args):
+    fixtures = recorded_bodies(args.fixtures) if args.fixtures else None
+    return MockFeedServer(feeds=args.feeds, entries=args.entries, padding=args.padding,
+                          latency=args.latency, jitter=args.jitter,
+                          error_rate=args.error_rate, change_rate=args.change_rate,
+                          dead=args.dead, fixtures=fixtures, port=args.port, seed=args.seed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LUCKNOOZ mock feed server and benchmark")
+    parser.add_argument('command', choices=['serve', 'bench'])
+    parser.add_argument('targets', nargs='*', default=list(TARGETS),
+                        help="entry points to benchmark (bench only)")
+    parser.add_argument('--port', type=int, default=None,
+                        help=f"port to listen on (serve defaults to {DEFAULT_PORT}, bench to any)")
+    parser.add_argument('--feeds', type=int, default=DEFAULT_FEEDS, help="synthetic feeds to serve")
+    parser.add_argument('--entries', type=int, default=DEFAULT_ENTRIES, help="entries per feed")
+    parser.add_argument('--padding', type=int, default=0,
+                        help="bytes of description per entry, to make feeds heavier")
+    parser.add_argument('--latency', type=float, default=0.05, help="seconds before each response")
+    parser.add_argument('--jitter', type=float, default=0.05, help="extra random latency, up to this")
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help="probability a request fails with HTTP 500")
+    parser.add_argument('--change-rate', type=float, default=0.3,
+                        help="probability a feed has new entries on each request")
+    parser.add_argument('--dead', type=int, nargs='*', default=[],
+                        help="feed numbers that always fail")
+    parser.add_argument('--fixtures', metavar='SNAPSHOT',
+                        help="serve the feed bodies recorded in this snapshot zip instead")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--runs', type=int, default=2,
+                        help="runs per entry point; later runs exercise 304s and caches")
+    parser.add_argument('--args', default='',
+                        help="extra arguments for each entry point, e.g. '--workers 4'")
+    parser.add_argument('--verbose', action='store_true', help="show the entry points' output")
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        args.port = DEFAULT_PORT if args.port is None else args.port
+        server = server_from_args(args).start()
+        print(f"Serving {server.count} mock feeds:")
+        for url in server.urls:
+            print(f"  {url}")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            server.stop()
+        return
+
+    args.port = 0 if args.port is None else args.port
+    # Each entry point gets a scratch directory, so caches, feed state and
+    # output files start empty and the real ones are left alone
+    root = os.getcwd()
+    sys.path.insert(0, root)
+    for name in args.targets:
+        if name not in TARGETS:
+            print(f"Unknown entry point {name}; choose from {', '.join(TARGETS)}")
+            continue
+        server = server_from_args(args).start()
+        workdir = tempfile.mkdtemp(prefix=f"lucknooz-bench-{name}-")
+        os.chdir(workdir)
+        try:
+            for run in range(1, args.runs + 1):
+                before = dict(server.stats)
+                total, timer, error = run_target(name, server, args.args.split(), args.verbose)
+                served = {key: server.stats[key] - before[key] for key in before}
+                if error:
+                    print(f"\n{name} run {run}: failed: {error}")
+                    break
+                report(name, run, total, timer, served)
+        finally:
+            os.chdir(root)
+            shutil.rmtree(workdir, ignore_errors=True)
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate headline detection for LUCKNOOZ
+Finds the same story worded slightly differently across feeds, using
+MinHash signatures of character shingles and a banded LSH index
+"""
+
+import argparse
+import hashlib
+import random
+import re
+import struct
+
+NUM_PERM = 60           # MinHash signature length
+BANDS = 20              # LSH bands of NUM_PERM // BANDS rows each
+SHINGLE_SIZE = 5        # characters per shingle
+DEFAULT_THRESHOLD = 0.5 # estimated Jaccard similarity at which two titles are the same story
+
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+
+NON_WORD_RE = re.compile(r'[^\w\s]+')
+
+
+def shingles(title, size=SHINGLE_SIZE):
+    """Set of character shingles of a title, ignoring case and punctuation"""
+    text = ' '.join(NON_WORD_RE.sub(' ', title.lower()).split())
+    if len(text) <= size:
+        return {text}
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def shingle_hash(shingle):
+    """Stable 32-bit hash of a shingle (hash() is salted per process)"""
+    return struct.unpack('<I', hashlib.blake2b(shingle.encode('utf-8'), digest_size=4).digest())[0]
+
+
+class MinHasher:
+    """MinHash over NUM_PERM universal hash functions, seeded so signatures are comparable"""
+
+    def __init__(self, num_perm=NUM_PERM, seed=1):
+        rng = random.Random(seed)
+        self.params = [(rng.randrange(1, MERSENNE_PRIME), rng.randrange(0, MERSENNE_PRIME))
+                       for _ in range(num_perm)]
+
+    def signature(self, title):
+        hashes = [shingle_hash(s) for s in shingles(title)]
+        return tuple(
+            min(((a * h + b) % MERSENNE_PRIME) & MAX_HASH for h in hashes)
+            for a, b in self.params
+        )
+
+
+def similarity(signature_a, signature_b):
+    """Estimated Jaccard similarity of two titles from their signatures"""
+    same = sum(1 for a, b in zip(signature_a, signature_b) if a == b)
+    return same / len(signature_a)
+
+
+class LSHIndex:
+    """
+    Banded locality-sensitive index of MinHash signatures
+
+    Titles whose signatures agree on every row of at least one band share a
+    bucket; only those are compared, so each new title costs a handful of
+    dict lookups instead of a comparison with every earlier title.
+    """
+
+    def __init__(self, bands=BANDS):
+        self.bands = bands
+        self.buckets = [{} for _ in range(bands)]
+
+    def _bands(self, signature):
+        rows = len(signature) // self.bands
+        for band in range(self.bands):
+            yield band, signature[band * rows:(band + 1) * rows]
+
+    def candidates(self, signature):
+        """Keys of earlier signatures sharing a band with this one"""
+        found = set()
+        for band, key in self._bands(signature):
+            found.update(self.buckets[band].get(key, ()))
+        return found
+
+    def add(self, item, signature):
+        for band, key in self._bands(signature):
+            self.buckets[band].setdefault(key, []).append(item)
+
+
+def cluster_titles(titles, threshold=DEFAULT_THRESHOLD, hasher=None):
+    """
+    Group titles that tell the same story, as a list of index lists.
+
+    Clusters are ordered by their first title, and each lists its titles in
+    input order, so cluster[0] is the earliest copy. Titles join a cluster
+    when their estimated similarity to any member reaches threshold.
+    """
+    hasher = hasher or MinHasher()
+    index = LSHIndex()
+    signatures = []
+    parent = list(range(len(titles)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, title in enumerate(titles):
+        signature = hasher.signature(title)
+        signatures.append(signature)
+        for j in index.candidates(signature):
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j and similarity(signature, signatures[j]) >= threshold:
+                # Keep the earlier title as the root
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+        index.add(i, signature)
+
+    clusters = {}
+    for i in range(len(titles)):
+        clusters.setdefault(find(i), []).append(i)
+    return sorted(clusters.values(), key=lambda members: members[0])
+
+
+class NearDuplicateIndex:
+    """
+    Titles kept so far, for checking new ones against as they arrive
+
+    Titles are only matched against signatures passed to add(), so the
+    caller decides which titles count as already in hand.
+    """
+
+    def __init__(self, threshold=DEFAULT_THRESHOLD, hasher=None):
+        self.threshold = threshold
+        self.hasher = hasher or MinHasher()
+        self.index = LSHIndex()
+        self.signatures = []
+
+    def signature(self, title):
+        return self.hasher.signature(title)
+
+    def matches(self, signature):
+        """Whether a title with this signature retells one already added"""
+        return any(similarity(signature, self.signatures[i]) >= self.threshold
+                   for i in self.index.candidates(signature))
+
+    def add(self, signature):
+        self.index.add(len(self.signatures), signature)
+        self.signatures.append(signature)
+
+
+def main():
+    """Show the near-duplicate clusters among the originals in the output files"""
+    from nlp_profiles import sample_headlines
+
+    parser = argparse.ArgumentParser(description="List near-duplicate headline clusters")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    titles = sample_headlines()
+    clusters = [c for c in cluster_titles(titles, args.threshold) if len(c) > 1]
+    print(f"{len(titles)} headlines, {len(clusters)} near-duplicate clusters")
+    for members in clusters:
+        print()
+        for i in members:
+            print(f"  {titles[i]}")
+
+
+if __name__ == "__main__":
+    main()
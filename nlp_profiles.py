@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+spaCy pipeline profiles for LUCKNOOZ
+Loads only the pipeline components each entry point actually reads from
+"""
+
+import argparse
+import importlib
+import json
+import time
+
+DEFAULT_MODEL = 'en_core_web_sm'
+
+# Components in en_core_web_sm, used if the model's meta can't be read
+KNOWN_COMPONENTS = ['tok2vec', 'tagger', 'parser', 'senter', 'attribute_ruler', 'lemmatizer', 'ner']
+
+# Which components have to run for each token attribute to be filled in
+ATTRIBUTE_PROVIDERS = {
+    'tag_': {'tok2vec', 'tagger'},
+    'pos_': {'tok2vec', 'tagger', 'attribute_ruler'},
+    'morph': {'tok2vec', 'tagger', 'attribute_ruler'},
+    'dep_': {'tok2vec', 'parser'},
+    'is_sent_start': {'tok2vec', 'parser'},
+    'lemma_': {'tok2vec', 'tagger', 'attribute_ruler', 'lemmatizer'},
+    'ent_type_': {'ner'},
+}
+
+# Token attributes read by each entry point's parse rules
+PROFILES = {
+    # find_first_verb_in_doc and is_plural: tag_, pos_, dep_ (lemmas come from LemmInflect)
+    'lucknooz_v13': {'tag_', 'pos_', 'dep_'},
+    # find_root_verb, parse_headline and is_subject_singular also read morph
+    'generate_headlines': {'tag_', 'pos_', 'dep_', 'morph'},
+    'full': set(ATTRIBUTE_PROVIDERS),
+}
+
+
+def required_components(attributes):
+    """Union of the components needed to fill in the given token attributes"""
+    required = set()
+    for attribute in attributes:
+        required |= ATTRIBUTE_PROVIDERS[attribute]
+    return required
+
+
+class NLPUnavailableError(RuntimeError):
+    """spaCy, the model package or a helper library is missing"""
+
+
+def model_components(model=DEFAULT_MODEL):
+    """Names of the components a model package ships, read from its meta.json"""
+    import spacy
+
+    try:
+        meta = spacy.util.get_model_meta(spacy.util.get_package_path(model))
+        return list(meta.get('components') or meta.get('pipeline') or KNOWN_COMPONENTS)
+    except Exception:
+        return list(KNOWN_COMPONENTS)
+
+
+def excluded_components(profile, model=DEFAULT_MODEL):
+    """Components of the model that the profile never reads"""
+    if profile == 'full':
+        return []
+    required = required_components(PROFILES[profile])
+    return [name for name in model_components(model) if name not in required]
+
+
+def load_profile(profile, model=DEFAULT_MODEL):
+    """Load the model with every component the profile doesn't need excluded"""
+    import spacy
+
+    return spacy.load(model, exclude=excluded_components(profile, model))
+
+
+class NLPEngine:
+    """
+    Lazily loaded spaCy pipeline for one profile
+
+    Nothing is imported or loaded until the first parse (or an explicit load()),
+    so modules can create an engine at import time for free. Missing
+    dependencies raise NLPUnavailableError with the command that fixes them.
+    """
+
+    def __init__(self, profile, model=DEFAULT_MODEL, requires=()):
+        self.profile = profile
+        self.model = model
+        self.requires = tuple(requires)
+        self._nlp = None
+
+    @property
+    def loaded(self):
+        return self._nlp is not None
+
+    def load(self):
+        """Load the pipeline now if it isn't loaded yet, and return it"""
+        if self._nlp is not None:
+            return self._nlp
+
+        for module in ('spacy',) + self.requires:
+            try:
+                importlib.import_module(module)
+            except ImportError:
+                raise NLPUnavailableError(
+                    f"Python package '{module}' is not installed; run: pip install {module}"
+                ) from None
+
+        try:
+            self._nlp = load_profile(self.profile, self.model)
+        except OSError as e:
+            raise NLPUnavailableError(
+                f"spaCy model '{self.model}' could not be loaded ({e}); "
+                f"run: python -m spacy download {self.model}"
+            ) from None
+        return self._nlp
+
+    def __call__(self, text):
+        return self.load()(text)
+
+    def pipe(self, texts, **kwargs):
+        return self.load().pipe(texts, **kwargs)
+
+    @property
+    def meta(self):
+        return self.load().meta
+
+    @property
+    def pipe_names(self):
+        return self.load().pipe_names
+
+
+def sample_headlines():
+    """Original headlines recorded in the checked-in output files, for benchmarking"""
+    headlines = set()
+    try:
+        with open('lucknooz-headlines.json', encoding='utf-8') as f:
+            for item in json.load(f)['headlines']:
+                headlines.add(item['subject_source']['original'])
+                headlines.add(item['predicate_source']['original'])
+    except (OSError, KeyError, ValueError):
+        pass
+    try:
+        with open('headline-components.json', encoding='utf-8') as f:
+            for item in json.load(f)['headlines']:
+                headlines.add(item['subject']['original'])
+                headlines.add(item['predicate']['original'])
+    except (OSError, KeyError, ValueError):
+        pass
+    return sorted(headlines)
+
+
+def benchmark(profile, texts, model=DEFAULT_MODEL, repeat=5):
+    """Time model load and nlp.pipe throughput for a profile"""
+    start = time.perf_counter()
+    nlp = load_profile(profile, model)
+    load_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for _doc in nlp.pipe(texts):
+            pass
+    parse_time = time.perf_counter() - start
+
+    return {
+        'profile': profile,
+        'pipeline': nlp.pipe_names,
+        'load_seconds': load_time,
+        'docs_per_second': (len(texts) * repeat) / parse_time if parse_time else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare spaCy pipeline profiles")
+    parser.add_argument('profiles', nargs='*', default=['full', 'generate_headlines', 'lucknooz_v13'])
+    parser.add_argument('--model', default=DEFAULT_MODEL)
+    parser.add_argument('--repeat', type=int, default=5, help="passes over the sample headlines")
+    args = parser.parse_args()
+
+    texts = sample_headlines()
+    if not texts:
+        print("No sample headlines found")
+        return
+
+    print(f"Benchmarking {len(texts)} headlines x {args.repeat} passes with {args.model}")
+    print()
+    print(f"{'Profile':<20} {'Load (s)':<10} {'Docs/s':<10} Pipeline")
+    print("-" * 80)
+
+    baseline = None
+    for profile in args.profiles:
+        result = benchmark(profile, texts, args.model, args.repeat)
+        if baseline is None:
+            baseline = result['docs_per_second']
+        speedup = result['docs_per_second'] / baseline if baseline else 0.0
+        print(f"{profile:<20} {result['load_seconds']:>8.2f}  {result['docs_per_second']:>8.0f}  "
+              f"{', '.join(result['pipeline'])}  ({speedup:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Pair sampling for LUCKNOOZ
+Draws distinct (subject, predicate) headline pairs in random order without
+replacement, lazily and in constant memory, however large the corpus
+"""
+
+import random
+
+FEISTEL_ROUNDS = 4
+
+
+def _round_function(value, key, mask):
+    """Cheap integer mixer for one Feistel round"""
+    value = ((value + key) * 0x9E3779B1) & 0xFFFFFFFF
+    value ^= value >> 16
+    value = (value * 0x85EBCA6B) & 0xFFFFFFFF
+    value ^= value >> 13
+    return value & mask
+
+
+def shuffled_range(size, rng=random):
+    """
+    Yield every integer in range(size) exactly once, in random order.
+
+    A Feistel network over the smallest even-bit-width domain covering size
+    is a random permutation of that domain; inputs below size that land
+    outside it are mapped again until they don't (cycle-walking), which keeps
+    it a permutation of range(size). Needs O(1) memory, unlike random.shuffle.
+    """
+    if size <= 0:
+        return
+    bits = max(2, (size - 1).bit_length())
+    bits += bits % 2
+    half = bits // 2
+    mask = (1 << half) - 1
+    keys = [rng.getrandbits(32) for _ in range(FEISTEL_ROUNDS)]
+
+    def permute(value):
+        left, right = value >> half, value & mask
+        for key in keys:
+            left, right = right, left ^ _round_function(right, key, mask)
+        return (left << half) | right
+
+    for value in range(size):
+        value = permute(value)
+        while value >= size:
+            value = permute(value)
+        yield value
+
+
+def sample_pairs(n, rng=random):
+    """
+    Yield every ordered pair (i, j) of distinct indices below n once, in random order.
+
+    The n * (n - 1) pairs are indexed without materialising them: pair k has
+    subject k // (n - 1) and predicate the (k % (n - 1))-th other index.
+    """
+    if n < 2:
+        return
+    others = n - 1
+    for k in shuffled_range(n * others, rng):
+        i, j = divmod(k, others)
+        yield i, (j if j < i else j + 1)
+
+
+def random_derangement(n, rng=random):
+    """
+    A uniformly random permutation of range(n) with no fixed points, as a list.
+
+    Fisher-Yates shuffles are rejected until one has no fixed point; about
+    1/e of them qualify, so this takes O(n) expected time.
+    """
+    if n < 2:
+        raise ValueError("a derangement needs at least two elements")
+    permutation = list(range(n))
+    while True:
+        rng.shuffle(permutation)
+        if all(value != index for index, value in enumerate(permutation)):
+            return permutation
+
+
+def derangement_pairs(n, rng=random):
+    """
+    Yield distinct (i, j) pairs, i != j, one random derangement at a time.
+
+    Each round pairs every index once as subject and once as predicate, so
+    the first n pairs use every headline evenly. Later rounds are fresh
+    derangements with pairs already given skipped. Once a round finds
+    fewer than half its pairs new, the rest come from sample_pairs, so all
+    n * (n - 1) pairs are reachable and none repeats.
+    """
+    if n < 2:
+        return
+    seen = set()
+    while True:
+        fresh = 0
+        for i, j in enumerate(random_derangement(n, rng)):
+            if (i, j) not in seen:
+                seen.add((i, j))
+                fresh += 1
+                yield i, j
+        if fresh < n / 2:
+            break
+
+    for pair in sample_pairs(n, rng):
+        if pair not in seen:
+            yield pair
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Persistent headline parse cache for LUCKNOOZ
+Remembers parse results (including rejections) between runs so only new titles reach spaCy
+"""
+
+import hashlib
+import inspect
+import json
+import re
+import sqlite3
+import time
+
+DEFAULT_CACHE_FILE = 'parse_cache.sqlite3'
+DEFAULT_MAX_ENTRIES = 20000
+
+
+def normalize_headline(text):
+    """Collapse whitespace so trivially different copies of a title share a cache key"""
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def fingerprint(*parts):
+    """
+    Build a parser-version fingerprint from the things that decide a parse result.
+
+    Functions contribute their source code and sets are sorted, so editing a rule
+    function or a word list produces a new fingerprint and invalidates old entries.
+    """
+    digest = hashlib.sha1()
+    for part in parts:
+        if callable(part):
+            try:
+                part = inspect.getsource(part)
+            except (OSError, TypeError):
+                part = getattr(part, '__qualname__', repr(part))
+        elif isinstance(part, (set, frozenset)):
+            part = sorted(part)
+        digest.update(repr(part).encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()[:16]
+
+
+class ParseCache:
+    """SQLite-backed cache of headline -> parse result, scoped by namespace and fingerprint"""
+
+    def __init__(self, namespace, parser_fingerprint, filename=DEFAULT_CACHE_FILE,
+                 max_entries=DEFAULT_MAX_ENTRIES):
+        self.namespace = namespace
+        self.fingerprint = parser_fingerprint
+        self.filename = filename
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        # Streaming mode reads and writes the cache from a pipeline stage thread
+        self.conn = sqlite3.connect(filename, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS parses (
+                namespace TEXT NOT NULL,
+                headline TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                result TEXT,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (namespace, headline)
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS parses_last_used ON parses (last_used)")
+
+        # Entries written by an older version of the parse rules are stale
+        stale = self.conn.execute(
+            "DELETE FROM parses WHERE namespace = ? AND fingerprint != ?",
+            (namespace, parser_fingerprint)
+        ).rowcount
+        self.conn.commit()
+        if stale:
+            print(f"Parse cache: dropped {stale} entries from an older parser version")
+
+    def get_many(self, headlines):
+        """
+        Look up headlines in the cache.
+
+        Returns a dict of normalized headline -> result for every cached headline.
+        A cached rejection is present with a value of None; uncached headlines are absent.
+        """
+        keys = list({normalize_headline(h) for h in headlines})
+        found = {}
+
+        # Stay well under SQLite's bound-parameter limit
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT headline, result FROM parses "
+                f"WHERE namespace = ? AND fingerprint = ? AND headline IN ({placeholders})",
+                [self.namespace, self.fingerprint] + chunk
+            ).fetchall()
+            for headline, result in rows:
+                found[headline] = json.loads(result) if result is not None else None
+
+        if found:
+            now = time.time()
+            self.conn.executemany(
+                "UPDATE parses SET last_used = ? WHERE namespace = ? AND headline = ?",
+                [(now, self.namespace, h) for h in found]
+            )
+            self.conn.commit()
+
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, items):
+        """Store (headline, result) pairs; a result of None records a rejection"""
+        now = time.time()
+        rows = [
+            (self.namespace, normalize_headline(headline), self.fingerprint,
+             json.dumps(result) if result is not None else None, now)
+            for headline, result in items
+        ]
+        if not rows:
+            return
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO parses (namespace, headline, fingerprint, result, last_used) "
+            "VALUES (?, ?, ?, ?, ?)",
+            rows
+        )
+        self.conn.commit()
+        self.evict()
+
+    def evict(self):
+        """Drop least recently used entries beyond max_entries"""
+        count = self.conn.execute("SELECT COUNT(*) FROM parses").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self.conn.execute(
+                "DELETE FROM parses WHERE rowid IN "
+                "(SELECT rowid FROM parses ORDER BY last_used LIMIT ?)",
+                (excess,)
+            )
+            self.conn.commit()
+
+    def clear(self):
+        """Forget every entry in this namespace"""
+        self.conn.execute("DELETE FROM parses WHERE namespace = ?", (self.namespace,))
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
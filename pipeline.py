@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Streaming pipeline helpers for LUCKNOOZ
+Runs fetch -> titles -> parse -> remix as overlapping stages joined by
+bounded queues, so each stage works while the others wait on I/O
+"""
+
+from collections import defaultdict, deque
+import queue
+import random
+import threading
+
+DEFAULT_QUEUE_SIZE = 4      # items buffered between stages before the producer blocks
+DEFAULT_POOL_SIZE = 2000    # parsed headlines kept for pairing in a long-running stream
+
+_DONE = object()
+
+
+class _StageError:
+    """Carries an exception from a stage's thread to whoever consumes its output"""
+
+    def __init__(self, error):
+        self.error = error
+
+
+def threaded(stage, upstream, maxsize=DEFAULT_QUEUE_SIZE):
+    """
+    Run stage(upstream) on its own thread and iterate over what it yields.
+
+    The queue between the two is bounded, so a stage that gets ahead of its
+    consumer blocks instead of buffering everything (back-pressure). If the
+    consumer stops early the stage is told to stop at its next put.
+    """
+    outbox = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                outbox.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def run():
+        try:
+            for item in stage(upstream):
+                if not put(item):
+                    return
+        except Exception as e:
+            put(_StageError(e))
+            return
+        put(_DONE)
+
+    threading.Thread(target=run, daemon=True).start()
+
+    try:
+        while True:
+            item = outbox.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _StageError):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+
+
+def run_stages(source, *stages, maxsize=DEFAULT_QUEUE_SIZE):
+    """Chain generator stages, each on its own thread, and iterate over the last one's output"""
+    stream = source
+    for stage in stages:
+        stream = threaded(stage, stream, maxsize)
+    return stream
+
+
+class PairingPool:
+    """
+    Pairs each newly parsed headline with ones that arrived before it
+
+    Every new record is paired both ways with one random earlier record, so
+    remixes start flowing as soon as two headlines are parsed. Repeated
+    headlines and repeated pairs are ignored. The pool keeps the most recent
+    max_size records, so a long-running stream stays bounded.
+    """
+
+    def __init__(self, key, max_size=DEFAULT_POOL_SIZE, rng=random):
+        self.key = key
+        self.rng = rng
+        self.records = deque(maxlen=max_size)
+        self.keys = set()
+        self.pairs = set()
+        self.pairs_by_key = defaultdict(list)
+
+    def add(self, record):
+        """Add a record and return the new (subject, predicate) pairs it makes"""
+        record_key = self.key(record)
+        if record_key in self.keys:
+            return []
+
+        new_pairs = []
+        if self.records:
+            other = self.rng.choice(self.records)
+            for subject, predicate in ((record, other), (other, record)):
+                pair = (self.key(subject), self.key(predicate))
+                if pair not in self.pairs:
+                    self.pairs.add(pair)
+                    self.pairs_by_key[pair[0]].append(pair)
+                    self.pairs_by_key[pair[1]].append(pair)
+                    new_pairs.append((subject, predicate))
+
+        if len(self.records) == self.records.maxlen:
+            # Forget the oldest record and the pairs it was part of
+            evicted = self.key(self.records[0])
+            self.keys.discard(evicted)
+            for pair in self.pairs_by_key.pop(evicted, []):
+                self.pairs.discard(pair)
+        self.records.append(record)
+        self.keys.add(record_key)
+        return new_pairs
+
+    def stage(self, records):
+        """Pipeline stage: parsed records in, (subject, predicate) pairs out"""
+        for record in records:
+            yield from self.add(record)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Rolling remix pool for LUCKNOOZ
+Keeps remixes from earlier runs for as long as the headlines they were made
+from are still in the feeds, so each run only makes enough new ones to top
+the pool back up
+"""
+
+import json
+import sqlite3
+import time
+
+DEFAULT_POOL_FILE = 'remix_pool.sqlite3'
+DEFAULT_TTL = 6 * 60 * 60   # seconds a remix is kept after its sources were last in the feeds
+
+
+class RemixPool:
+    """
+    SQLite-backed pool of remix records, keyed by remix headline
+
+    Each remix stores when it was created and the original headlines it was
+    made from. refresh() marks the remixes whose sources are all still live;
+    ones not marked for longer than the TTL are evicted.
+    """
+
+    def __init__(self, namespace, filename=DEFAULT_POOL_FILE, ttl=DEFAULT_TTL):
+        self.namespace = namespace
+        self.filename = filename
+        self.ttl = ttl
+        self.conn = sqlite3.connect(filename)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS remix_pool (
+                namespace TEXT NOT NULL,
+                headline TEXT NOT NULL,
+                sources TEXT NOT NULL,
+                record TEXT NOT NULL,
+                created REAL NOT NULL,
+                last_live REAL NOT NULL,
+                PRIMARY KEY (namespace, headline)
+            )
+        """)
+        self.conn.commit()
+
+    def refresh(self, live_sources, now=None):
+        """
+        Mark remixes whose sources are all in live_sources and evict expired ones.
+
+        Returns the number of remixes evicted.
+        """
+        now = now if now is not None else time.time()
+        live_sources = set(live_sources)
+        rows = self.conn.execute(
+            "SELECT headline, sources FROM remix_pool WHERE namespace = ?",
+            (self.namespace,)
+        ).fetchall()
+        self.conn.executemany(
+            "UPDATE remix_pool SET last_live = ? WHERE namespace = ? AND headline = ?",
+            [(now, self.namespace, headline) for headline, sources in rows
+             if live_sources.issuperset(json.loads(sources))]
+        )
+        evicted = self.conn.execute(
+            "DELETE FROM remix_pool WHERE namespace = ? AND last_live < ?",
+            (self.namespace, now - self.ttl)
+        ).rowcount
+        self.conn.commit()
+        return evicted
+
+    def trim(self, size):
+        """Drop the oldest remixes beyond size; returns how many were dropped"""
+        dropped = self.conn.execute(
+            "DELETE FROM remix_pool WHERE namespace = ? AND headline NOT IN ("
+            "SELECT headline FROM remix_pool WHERE namespace = ? "
+            "ORDER BY created DESC, rowid DESC LIMIT ?)",
+            (self.namespace, self.namespace, max(size, 0))
+        ).rowcount
+        self.conn.commit()
+        return dropped
+
+    def add(self, items, now=None):
+        """Pool (headline, source headlines, record) triples created now"""
+        now = now if now is not None else time.time()
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO remix_pool "
+            "(namespace, headline, sources, record, created, last_live) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [(self.namespace, headline, json.dumps(list(sources)), json.dumps(record), now, now)
+             for headline, sources, record in items]
+        )
+        self.conn.commit()
+
+    def size(self):
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM remix_pool WHERE namespace = ?", (self.namespace,)
+        ).fetchone()[0]
+
+    def headlines(self):
+        """Set of the headlines already pooled"""
+        rows = self.conn.execute(
+            "SELECT headline FROM remix_pool WHERE namespace = ?", (self.namespace,)
+        )
+        return {headline for headline, in rows}
+
+    def records(self):
+        """Every pooled record, newest first"""
+        rows = self.conn.execute(
+            "SELECT record FROM remix_pool WHERE namespace = ? ORDER BY created DESC, rowid DESC",
+            (self.namespace,)
+        )
+        return [json.loads(record) for record, in rows]
+
+    def clear(self):
+        """Empty this namespace's pool"""
+        self.conn.execute("DELETE FROM remix_pool WHERE namespace = ?", (self.namespace,))
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+def top_up(pool, live_sources, size, make, label='Remix pool'):
+    """
+    Keep pooled remixes whose sources are still live and make enough new ones
+    to fill the pool back up to size.
+
+    make(needed, exclude) returns new (headline, source headlines, record)
+    triples, none with a headline in exclude. Returns every pooled record,
+    newest first.
+    """
+    evicted = pool.refresh(live_sources)
+    evicted += pool.trim(size)
+    needed = size - pool.size()
+    print(f"{label}: kept {pool.size()}, evicted {evicted}, making {needed} new")
+    pool.add(make(needed, pool.headlines()))
+    return pool.records()
+
+
+def keep_latest(pool, live_sources, items, size):
+    """
+    Pool (headline, source headlines, record) triples as the newest remixes,
+    keeping at most size, and return every pooled record, newest first.
+    """
+    pool.refresh(live_sources)
+    pool.add(items)
+    pool.trim(size)
+    return pool.records()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Seen-entry index for LUCKNOOZ
+Remembers which feed entries were already ingested, and what parsing them
+produced, so each run only parses entries that are new since the last one
+"""
+
+import json
+import sqlite3
+import time
+
+DEFAULT_INDEX_FILE = 'seen_entries.sqlite3'
+DEFAULT_TTL = 3 * 24 * 60 * 60   # seconds an entry is remembered after it was last seen
+
+
+def entry_key(entry):
+    """Stable identity of a feed entry: its id/guid, else its link, else its title"""
+    return entry.get('id') or entry.get('guid') or entry.get('link') or entry.get('title', '')
+
+
+class SeenEntries:
+    """
+    SQLite-backed index of (feed, entry) -> title and parse result
+
+    version should change whenever parsing would give different results
+    (e.g. a parser fingerprint); entries indexed under another version are
+    dropped and parsed again.
+    """
+
+    def __init__(self, namespace, version='', filename=DEFAULT_INDEX_FILE, ttl=DEFAULT_TTL):
+        self.namespace = namespace
+        self.version = version
+        self.filename = filename
+        self.ttl = ttl
+        # Streaming mode reads and writes it from a pipeline stage thread
+        self.conn = sqlite3.connect(filename, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS seen_entries (
+                namespace TEXT NOT NULL,
+                feed TEXT NOT NULL,
+                entry TEXT NOT NULL,
+                title TEXT NOT NULL,
+                result TEXT,
+                version TEXT NOT NULL,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL,
+                PRIMARY KEY (namespace, feed, entry)
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS seen_entries_last_seen "
+                          "ON seen_entries (last_seen)")
+        self.conn.execute(
+            "DELETE FROM seen_entries WHERE namespace = ? AND version != ?",
+            (namespace, version)
+        )
+        self.conn.commit()
+        self.expire()
+
+    def lookup(self, feed, entries):
+        """
+        Split a feed's (key, title) pairs into already-seen and new.
+
+        Returns (seen, new): seen maps key -> stored result (None for a
+        rejected entry), new lists the pairs that still need parsing. An entry
+        whose title has changed since it was indexed counts as new.
+        """
+        seen = {}
+        new = []
+        now = time.time()
+        for key, title in entries:
+            row = self.conn.execute(
+                "SELECT title, result FROM seen_entries "
+                "WHERE namespace = ? AND feed = ? AND entry = ?",
+                (self.namespace, feed, key)
+            ).fetchone()
+            if row and row[0] == title:
+                seen[key] = json.loads(row[1]) if row[1] is not None else None
+            else:
+                new.append((key, title))
+
+        if seen:
+            self.conn.executemany(
+                "UPDATE seen_entries SET last_seen = ? "
+                "WHERE namespace = ? AND feed = ? AND entry = ?",
+                [(now, self.namespace, feed, key) for key in seen]
+            )
+            self.conn.commit()
+        return seen, new
+
+    def record(self, feed, items):
+        """Index (key, title, result) triples for a feed; a result of None marks a rejection"""
+        now = time.time()
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO seen_entries "
+            "(namespace, feed, entry, title, result, version, first_seen, last_seen) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(self.namespace, feed, key, title,
+              json.dumps(result) if result is not None else None, self.version, now, now)
+             for key, title, result in items]
+        )
+        self.conn.commit()
+
+    def expire(self):
+        """Forget entries not seen in any feed for longer than the TTL"""
+        cutoff = time.time() - self.ttl
+        self.conn.execute(
+            "DELETE FROM seen_entries WHERE namespace = ? AND last_seen < ?",
+            (self.namespace, cutoff)
+        )
+        self.conn.commit()
+
+    def clear(self):
+        """Forget every entry in this namespace"""
+        self.conn.execute("DELETE FROM seen_entries WHERE namespace = ?", (self.namespace,))
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()